@@ -2,10 +2,19 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
 import argparse
+import contextlib
 import sys
 
-from beman_tidy.lib.utils.git import get_repo_info, load_beman_standard_config
+from beman_tidy.lib.utils.git import GIT_BACKENDS, get_repo_info
+from beman_tidy.lib.utils.standard_config import load_beman_standard_config
 from beman_tidy.lib.pipeline import run_checks_pipeline
+from beman_tidy.lib.profiler import (
+    print_profile_table,
+    profiler,
+    write_profile,
+    write_trace,
+)
+from beman_tidy.lib.reporters import REPORT_FORMATS, create_reporter
 
 
 def parse_args():
@@ -14,7 +23,18 @@ def parse_args():
     """
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("repo_path", help="path to the repository to check", type=str)
+    parser.add_argument(
+        "repo_paths",
+        help="path(s) to the repository(ies) to check",
+        type=str,
+        nargs="*",
+    )
+    parser.add_argument(
+        "--repos-from",
+        help="file with one repository path per line to check in batch mode ('-' for stdin)",
+        type=str,
+        default=None,
+    )
     parser.add_argument(
         "--fix-inplace",
         help="Try to automatically fix found issues",
@@ -36,21 +56,133 @@ def parse_args():
     parser.add_argument(
         "--checks", help="array of checks to run", type=str, default=None
     )
+    parser.add_argument(
+        "--format",
+        help="output format: 'text' (human-readable), 'ndjson' (one JSON object per check) or 'sarif' (SARIF 2.1.0); the text output goes to stderr for ndjson/sarif (default: text)",
+        type=str,
+        choices=REPORT_FORMATS,
+        default="text",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="number of checks (or repositories in batch mode) to run in parallel (default: 1, --fix-inplace always runs checks serially)",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--cache",
+        help="reuse the results of checks with unchanged inputs from previous runs (stored in .beman-tidy-cache/)",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory of the result cache (default: <repo_path>/.beman-tidy-cache)",
+        type=str,
+        default=None,
+    )
+    parser.add_argument(
+        "--git-backend",
+        help="how to read the repository information: 'native' reads the .git directory directly, 'gitpython' uses GitPython (default: native)",
+        type=str,
+        choices=GIT_BACKENDS,
+        default="native",
+    )
+    changed_files_group = parser.add_mutually_exclusive_group()
+    changed_files_group.add_argument(
+        "--changed-since",
+        help="only run the checks affected by the files changed since the given git revision (e.g., origin/main)",
+        type=str,
+        default=None,
+    )
+    changed_files_group.add_argument(
+        "--staged",
+        help="only run the checks affected by the staged files (e.g., for pre-commit)",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+    )
+    parser.add_argument(
+        "--include-untracked",
+        help="also walk the untracked files that are not ignored by git (default: True)",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+    )
+    parser.add_argument(
+        "--include-ignored",
+        help="walk all the files of the working tree, including the files ignored by git (e.g., build directories); by default, only the files listed by `git ls-files` are walked",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+    )
+    parser.add_argument(
+        "--profile",
+        help="print the wall time, CPU time, size of the files opened, files opened and subprocesses of each check (and of the repository information / config load)",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+    )
+    parser.add_argument(
+        "--profile-output",
+        help="write the --profile numbers to the given JSON file (implies --profile)",
+        type=str,
+        default=None,
+    )
+    parser.add_argument(
+        "--trace",
+        help="write a Chrome/Perfetto trace (timeline) of the run to the given JSON file: config load, repository information, each check pre_check/check/fix and the summary",
+        type=str,
+        default=None,
+    )
     args = parser.parse_args()
 
-    args.repo_info = get_repo_info(args.repo_path)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.repos_from is not None:
+        args.repo_paths += read_repo_paths(args.repos_from)
+    if len(args.repo_paths) == 0:
+        parser.error("at least one repository path is required")
+
+    # Batch mode: repositories are processed by the batch workers.
+    args.batch = args.repos_from is not None or len(args.repo_paths) > 1
+    if not args.batch:
+        args.repo_path = args.repo_paths[0]
     args.checks = args.checks.split(",") if args.checks else None
+    args.profile = args.profile or args.profile_output is not None
 
     return args
 
 
+def read_repo_paths(repos_from):
+    """
+    Read the repository paths from a manifest file or stdin ('-').
+    Empty lines and lines starting with '#' are ignored.
+    """
+    if repos_from == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(repos_from, "r") as file:
+            lines = file.readlines()
+
+    return [
+        line.strip()
+        for line in lines
+        if len(line.strip()) > 0 and not line.strip().startswith("#")
+    ]
+
+
 def main():
     """
     The beman-tidy main entry point.
     """
     args = parse_args()
+    if args.profile or args.trace is not None:
+        profiler.enable()
 
-    beman_standard_check_config = load_beman_standard_config()
+    if not args.batch:
+        with profiler.span("repo_info", "repo_info", repository=args.repo_path):
+            args.repo_info = get_repo_info(args.repo_path, args.git_backend)
+
+    with profiler.span("config", "config"):
+        beman_standard_check_config = load_beman_standard_config()
     if not beman_standard_check_config or len(beman_standard_check_config) == 0:
         print("Failed to download the beman standard. STOP.")
         return
@@ -61,9 +193,43 @@ def main():
         else args.checks
     )
 
-    failed_checks = run_checks_pipeline(
-        checks_to_run, args, beman_standard_check_config
-    )
+    # Machine-readable formats own stdout: the human-readable output goes to stderr.
+    reporter = create_reporter(args.format, sys.stdout, beman_standard_check_config)
+    with (
+        contextlib.redirect_stdout(sys.stderr)
+        if args.format != "text"
+        else contextlib.nullcontext()
+    ):
+        try:
+            if args.batch:
+                # Imported on demand: the process pool is only needed by the batch mode.
+                from beman_tidy.lib.batch import run_batch_pipeline
+
+                failed_repos = run_batch_pipeline(
+                    args.repo_paths,
+                    checks_to_run,
+                    args,
+                    beman_standard_check_config,
+                    reporter,
+                )
+            else:
+                failed_checks = run_checks_pipeline(
+                    checks_to_run, args, beman_standard_check_config, reporter
+                )
+
+            if args.profile:
+                print_profile_table(profiler.records)
+                if args.profile_output is not None:
+                    write_profile(profiler.records, args.profile_output)
+            if args.trace is not None:
+                write_trace(profiler.records, args.trace)
+        finally:
+            # Always finish the report (e.g., a valid SARIF document if a check stops the program).
+            reporter.close()
+
+    if args.batch:
+        # Exit codes are truncated to 8 bits, so never wrap around to 0.
+        sys.exit(min(failed_repos, 255))
     sys.exit(failed_checks)
 
 
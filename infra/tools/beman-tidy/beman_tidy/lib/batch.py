@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import contextlib
+import copy
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .pipeline import (
+    collect_checks_pipeline_summary,
+    print_checks_pipeline_summary,
+    green_color,
+    red_color,
+    no_color,
+)
+from .profiler import profiler
+from .reporters import BufferedReporter, replay_reports
+from .utils.git import get_repo_info
+
+# Per-process state of a batch worker, set once by _init_batch_worker().
+_batch_worker_state = {}
+
+
+def _init_batch_worker(checks_to_run, args, beman_standard_check_config):
+    """
+    Warm up a batch worker process: keep the already parsed Beman Standard and
+    the CLI arguments for all the repositories processed by this worker.
+    """
+    _batch_worker_state["checks_to_run"] = checks_to_run
+    _batch_worker_state["args"] = args
+    _batch_worker_state["beman_standard_check_config"] = beman_standard_check_config
+    if args.profile or args.trace is not None:
+        # Drop the records inherited from the parent process (fork start method).
+        profiler.pop_records()
+        profiler.enable()
+
+
+def _run_batch_repo(repo_path):
+    """
+    Run the checks pipeline for a single repository inside a batch worker.
+    The output and the reports of the pipeline are captured, so the parent process can print
+    them grouped per repository.
+
+    @return: (repo_path, output, reports, profile_records, summary, failed_checks) - summary and failed_checks are None if the
+             repository could not be checked (e.g., not a valid Git repository, or a check raised an exception).
+    """
+    repo_args = copy.copy(_batch_worker_state["args"])
+    repo_args.repo_path = repo_path
+    # Repositories are already processed in parallel, so run the checks of a repository serially.
+    repo_args.jobs = 1
+
+    output = io.StringIO()
+    reporter = BufferedReporter()
+    summary, failed_checks = None, None
+    with contextlib.redirect_stdout(output):
+        try:
+            with profiler.span("repo_info", "repo_info", repository=repo_path):
+                repo_args.repo_info = get_repo_info(repo_path, repo_args.git_backend)
+            summary = collect_checks_pipeline_summary(
+                _batch_worker_state["checks_to_run"],
+                repo_args,
+                _batch_worker_state["beman_standard_check_config"],
+                reporter,
+            )
+            with profiler.span("summary", "summary", repository=repo_path):
+                failed_checks = print_checks_pipeline_summary(summary, repo_args)
+            reporter.report_summary(repo_path, summary, failed_checks)
+        except SystemExit:
+            summary, failed_checks = None, None
+            reporter.report_error(repo_path, output.getvalue().strip())
+        except Exception as error:
+            # e.g., a crashing check: only this repository fails, the rest of the batch goes on.
+            summary, failed_checks = None, None
+            print(f"An error occurred while checking {repo_path}: {error!r}")
+            reporter.report_error(repo_path, output.getvalue().strip())
+
+    return (
+        repo_path,
+        output.getvalue(),
+        reporter.reports,
+        profiler.pop_records(),
+        summary,
+        failed_checks,
+    )
+
+
+def run_batch_pipeline(
+    repo_paths, checks_to_run, args, beman_standard_check_config, reporter=None
+):
+    """
+    Run the checks pipeline for many repositories, spread over args.jobs worker processes.
+    The Beman Standard is parsed once (by the caller) and shared with all the workers.
+    Prints the summary of each repository (in the given order) and an aggregated compliance table.
+    The reports of each repository are forwarded to the optional reporter as soon as the repository is done.
+
+    @return: The number of non-compliant repositories (failed checks or errors).
+    """
+    rows = []
+    with ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=_init_batch_worker,
+        initargs=(checks_to_run, args, beman_standard_check_config),
+    ) as executor:
+        for (
+            repo_path,
+            output,
+            reports,
+            profile_records,
+            summary,
+            failed_checks,
+        ) in executor.map(_run_batch_repo, repo_paths):
+            print(f"==> {repo_path}")
+            print(output)
+            if reporter is not None:
+                replay_reports(reports, reporter)
+            profiler.add_records(profile_records)
+            rows.append((repo_path, summary, failed_checks))
+
+    with profiler.span("summary", "summary"):
+        print_batch_compliance_table(rows, args)
+
+    sys.stdout.flush()
+    return len(
+        [
+            repo_path
+            for repo_path, summary, failed_checks in rows
+            if summary is None or failed_checks > 0
+        ]
+    )
+
+
+def print_batch_compliance_table(rows, args):
+    """
+    Print the aggregated compliance table for a batch run.
+    Each row is a (repo_path, summary, failed_checks) tuple - summary is None for errors.
+    """
+
+    def format_coverage(summary, check_type):
+        passed = summary["passed"][check_type]
+        implemented = summary["implemented"][check_type]
+        coverage = round(passed / implemented * 100, 2) if implemented else 0
+        return f"{coverage:{6}.2f}% ({passed}/{implemented})"
+
+    repo_column_width = max([len("Repository")] + [len(row[0]) for row in rows])
+    header = f"{'Repository':<{repo_column_width}}  {'REQUIREMENT':<18}  {'RECOMMENDATION':<18}  STATUS"
+    print("Compliance summary:")
+    print(header)
+    print("-" * len(header))
+
+    cnt_compliant = 0
+    for repo_path, summary, failed_checks in rows:
+        if summary is None:
+            print(
+                f"{repo_path:<{repo_column_width}}  {'-':<18}  {'-':<18}  {red_color}ERROR{no_color}"
+            )
+            continue
+
+        status = (
+            f"{green_color}PASSED{no_color}"
+            if failed_checks == 0
+            else f"{red_color}FAILED ({failed_checks} checks){no_color}"
+        )
+        cnt_compliant += failed_checks == 0
+        print(
+            f"{repo_path:<{repo_column_width}}  {format_coverage(summary, 'REQUIREMENT'):<18}  {format_coverage(summary, 'RECOMMENDATION'):<18}  {status}"
+        )
+
+    print("-" * len(header))
+    print(f"{cnt_compliant}/{len(rows)} repositories are compliant.")
+    if not args.require_all:
+        print("Note: RECOMMENDATIONs are not included (--require-all NOT set).")
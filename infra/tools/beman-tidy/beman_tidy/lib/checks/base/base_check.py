@@ -1,10 +1,45 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import functools
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from ..system.registry import get_beman_standard_check_name_by_class
+from ...profiler import profiler
+from ...utils.snapshot import RepositorySnapshot
+
+# The check methods called by the framework, measured as profiler spans (e.g., --trace).
+TRACED_CHECK_METHODS = ["pre_check", "check", "fix"]
+
+
+def traced_check_method(method):
+    """
+    Decorator: run a check method inside a profiler span named "<check name>:<method name>"
+    - e.g., "README.TITLE:pre_check". A no-op if the profiler is not enabled.
+
+    Overrides calling super() (e.g., FileBaseCheck.pre_check() -> BaseCheck.pre_check())
+    get a single span: only the outermost call is measured.
+    """
+
+    @functools.wraps(method)
+    def traced_method(self, *args, **kwargs):
+        if not profiler.enabled or method.__name__ in self._traced_methods:
+            return method(self, *args, **kwargs)
+
+        self._traced_methods.add(method.__name__)
+        try:
+            with profiler.span(
+                f"{self.name}:{method.__name__}",
+                "method",
+                repository=str(self.repo_path),
+            ):
+                return method(self, *args, **kwargs)
+        finally:
+            self._traced_methods.discard(method.__name__)
+
+    traced_method.traced = True
+    return traced_method
 
 
 class BaseCheck(ABC):
@@ -12,8 +47,18 @@ class BaseCheck(ABC):
     Base class for checks.
     This class is not meant to be used directly, it's meant to be subclassed.
     e.g., check for repository name, check for changelog, check for license, etc.
+
+    The pre_check(), check() and fix() methods of all subclasses are measured as profiler spans
+    (check traced_check_method()), so new checks get them automatically.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method_name in TRACED_CHECK_METHODS:
+            method = cls.__dict__.get(method_name)
+            if method is not None and not getattr(method, "traced", False):
+                setattr(cls, method_name, traced_check_method(method))
+
     def __init__(self, repo_info, beman_standard_check_config, name=None):
         """
         Create a new check instance.
@@ -57,13 +102,28 @@ class BaseCheck(ABC):
         # set log level - e.g. "ERROR" or "WARNING"
         self.log_level = "ERROR" if self.type == "REQUIREMENT" else "WARNING"
         self.log_enabled = False
+        # set log stream - e.g. None (stdout) or a per-check buffer when checks run in parallel
+        self.log_stream = None
+        # set diagnostics - all messages logged by this check (e.g., replayed from the result cache)
+        self.diagnostics = []
+        # set properties - extra results reported with the check verdict (e.g., {"license": "apache-v2"})
+        self.properties = {}
+        # set traced methods - the check methods with an open profiler span (check traced_check_method())
+        self._traced_methods = set()
+
+        # set repo snapshot - shared by all checks of a run (a bare repo_info dict gets its own snapshot)
+        self.snapshot = (
+            repo_info
+            if isinstance(repo_info, RepositorySnapshot)
+            else RepositorySnapshot(repo_info)
+        )
 
-        # set repo info
-        self.repo_info = repo_info
-        assert "name" in repo_info
-        self.repo_name = repo_info["name"]
-        assert "top_level" in repo_info
-        self.repo_path = Path(repo_info["top_level"])
+        # set repo info - the snapshot behaves like the repo_info dict
+        self.repo_info = self.snapshot
+        assert "name" in self.repo_info
+        self.repo_name = self.repo_info["name"]
+        assert "top_level" in self.repo_info
+        self.repo_path = Path(self.repo_info["top_level"])
         assert self.repo_path is not None
         self.library_name = f"beman.{self.repo_name}"
         assert self.library_name is not None
@@ -76,6 +136,7 @@ class BaseCheck(ABC):
         assert len(beman_library_maturity_model["values"]) == 4
         self.beman_library_maturity_model = beman_library_maturity_model["values"]
 
+    @traced_check_method
     def pre_check(self):
         """
         Pre-checks if this rule is properly initialized.
@@ -120,12 +181,38 @@ class BaseCheck(ABC):
         """
         pass
 
+    def inputs(self):
+        """
+        Declares the inputs of the check, used to cache its result between runs.
+        Returns a dictionary with optional keys:
+        - "files": list of file paths - e.g., [self.path]
+        - "directories": list of directory paths (only the direct entries are tracked)
+        - "repo_info": list of repo_info fields - e.g., ["default_branch"]
+
+        The result of a check without declared inputs (None) is never cached.
+        Note: The check name, config, implementation and the repository name are always part of the cache key.
+        """
+        return None
+
+    def repo_info_inputs(self):
+        """
+        The repo_info fields read by the check (the "repo_info" inputs), prefetched before the checks run.
+        Must be cheap and free of side effects: override it if inputs() is expensive to compute.
+        """
+        inputs = self.inputs()
+        return inputs.get("repo_info", []) if inputs is not None else []
+
     def log(self, message, enabled=True):
         """
         Logs a message with the check's log level.
         e.g. [WARN][REPOSITORY.NAME]: The name "${name}" should be snake_case.'
         e.g. [ERROR][TOPLEVEL.CMAKE]: Missing top level CMakeLists.txt.'
         """
+        if enabled:
+            self.diagnostics.append(message)
 
         if self.log_enabled and enabled:
-            print(f"[{self.log_level:<15}][{self.name:<25}]: {message}")
+            print(
+                f"[{self.log_level:<15}][{self.name:<25}]: {message}",
+                file=self.log_stream,
+            )
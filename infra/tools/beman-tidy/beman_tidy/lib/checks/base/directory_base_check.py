@@ -30,7 +30,7 @@ class DirectoryBaseCheck(BaseCheck):
             self.log("The path is not set.")
             return False
 
-        if not self.path.exists():
+        if not self.snapshot.index.exists(self.path):
             self.log(f"The directory '{self.path}' does not exist.")
             return False
 
@@ -54,17 +54,23 @@ class DirectoryBaseCheck(BaseCheck):
         """
         pass
 
+    def inputs(self):
+        """
+        Override.
+        The directory is the only input of the check.
+        """
+        return {"directories": [self.path]}
+
     def read(self) -> list[Path]:
         """
-        Read the directory content.
+        Read the directory content (from the repository index), sorted by name.
         """
-        try:
-            return list(self.path.iterdir())
-        except Exception:
-            return []
+        return [
+            Path(entry.path) for entry in self.snapshot.index.list_directory(self.path)
+        ]
 
     def is_empty(self):
         """
-        Check if the directory is empty.
+        Check if the directory is empty (probed by the repository index - the directory is not listed).
         """
-        return len(self.read()) == 0
+        return self.snapshot.index.is_empty(self.path)
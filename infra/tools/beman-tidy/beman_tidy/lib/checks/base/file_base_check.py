@@ -30,7 +30,7 @@ class FileBaseCheck(BaseCheck):
             self.log("The path is not set.")
             return False
 
-        if not self.path.exists():
+        if not self.snapshot.index.exists(self.path):
             self.log(f"The file '{self.path}' does not exist.")
             return False
 
@@ -54,25 +54,24 @@ class FileBaseCheck(BaseCheck):
         """
         pass
 
+    def inputs(self):
+        """
+        Override.
+        The file is the only input of the check.
+        """
+        return {"files": [self.path]}
+
     def read(self):
         """
-        Read the file content.
+        Read the file content (cached in the repository snapshot).
         """
-        try:
-            with open(self.path, "r") as file:
-                return file.read()
-        except Exception:
-            return ""
+        return self.snapshot.read_text(self.path)
 
     def read_lines(self):
         """
-        Read the file content as lines.
+        Read the file content as lines (cached in the repository snapshot).
         """
-        try:
-            with open(self.path, "r") as file:
-                return file.readlines()
-        except Exception:
-            return []
+        return self.snapshot.read_lines(self.path)
 
     def read_lines_strip(self):
         """
@@ -89,6 +88,8 @@ class FileBaseCheck(BaseCheck):
                 file.write(content)
         except Exception as e:
             self.log(f"Error writing the file '{self.path}': {e}")
+        finally:
+            self.snapshot.invalidate(self.path)
 
     def write_lines(self, lines):
         """
@@ -106,9 +107,9 @@ class FileBaseCheck(BaseCheck):
 
     def is_empty(self):
         """
-        Check if the file is empty.
+        Check if the file is empty (its size, from the repository index - the file is not read).
         """
-        return len(self.read()) == 0
+        return self.snapshot.index.is_empty(self.path)
 
     def has_content(self, content_to_match):
         """
@@ -118,3 +119,11 @@ class FileBaseCheck(BaseCheck):
         if not readme_content or len(readme_content) == 0:
             return False
         return re.search(re.escape(content_to_match), readme_content) is not None
+
+    def count_contents(self, matcher):
+        """
+        Count the occurrences of all the literals of the given MultiLiteralMatcher,
+        with a single scan of the file content.
+        e.g., {"literal1": 1, "literal2": 0}
+        """
+        return matcher.count(self.read())
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import os
+import re
+from abc import abstractmethod
+
 from ..base.file_base_check import FileBaseCheck
+from ..system.registry import register_beman_standard_check
+from ...utils.cmake import CMakeParseError, parse_cmake_listfile
 
 # [CMAKE.*] checks category.
 # All checks in this file extend the CMakeBaseCheck class.
@@ -13,6 +19,55 @@ class CMakeBaseCheck(FileBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config, "CMakeLists.txt")
 
+        # The prefix of the project options - e.g., "BEMAN_EXEMPLAR" for beman.exemplar.
+        self.option_prefix = re.sub(r"[^A-Za-z0-9]", "_", self.library_name).upper()
+
+    def parse_listfile(self):
+        """
+        Parse the CMake listfile (cached in the repository snapshot: each listfile is parsed once per run
+        and shared by all the CMAKE.* checks).
+        @return: The CMakeListfile, or None if the listfile cannot be parsed (the error is logged).
+        """
+        try:
+            return self.snapshot.parse(self.path, parse_cmake_listfile)
+        except CMakeParseError as e:
+            self.log(f"Cannot parse the file '{self.path}': {e}.")
+            return None
+
+    def get_location(self, path, command):
+        """
+        @return: The location of a command, relative to the repository - e.g., "src/beman/exemplar/CMakeLists.txt:5".
+        """
+        return f"{os.path.relpath(path, self.repo_path)}:{command.line}"
+
+    def check_build_option(self, option_name, description, anchor):
+        """
+        Check that the listfile declares the given option() and uses it in an if() condition
+        - e.g., BEMAN_EXEMPLAR_BUILD_TESTS guards the tests.
+        """
+        listfile = self.parse_listfile()
+        if listfile is None:
+            return False
+
+        if option_name not in listfile.get_option_names():
+            self.log(
+                f"Missing option({option_name} ...) in the file '{self.path}' to skip building the {description}. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#{anchor} for more information."
+            )
+            return False
+
+        if option_name not in listfile.get_condition_variables():
+            option = next(
+                command
+                for command in listfile.find_commands("option")
+                if command.arguments[0] == option_name
+            )
+            self.log(
+                f"The option {option_name} (line {option.line}) is never used in an if() condition: the {description} are always built. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#{anchor} for more information."
+            )
+            return False
+
+        return True
+
 
 # TODO CMAKE.DEFAULT
 
@@ -20,16 +75,175 @@ class CMakeBaseCheck(FileBaseCheck):
 # TODO CMAKE.USE_FETCH_CONTENT
 
 
-# TODO CMAKE.PROJECT_NAME
+@register_beman_standard_check("CMAKE.PROJECT_NAME", input_patterns=["CMakeLists.txt"])
+class CMakeProjectNameCheck(CMakeBaseCheck):
+    """
+    Check that the CMake project name is the library name - e.g., project(beman.exemplar ...).
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+    def check(self):
+        listfile = self.parse_listfile()
+        if listfile is None:
+            return False
+
+        project = listfile.find_command("project")
+        if project is None or len(project.arguments) == 0:
+            self.log(
+                f"Missing project({self.library_name} ...) in the file '{self.path}'. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakeproject_name for more information."
+            )
+            return False
+
+        project_name = project.arguments[0]
+        if project_name != self.library_name:
+            self.log(
+                f"Invalid CMake project name '{project_name}' (line {project.line}) vs '{self.library_name}'. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakeproject_name for more information."
+            )
+            return False
+
+        return True
+
+    def fix(self):
+        self.log(
+            f"Please use the library name as CMake project name: project({self.library_name} ...). See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakeproject_name for more information."
+        )
 
 
 # TODO CMAKE.PASSIVE_PROJECTS
 
 
-# TODO CMAKE.LIBRARY_NAME
+class CMakeProjectGraphCheck(CMakeBaseCheck):
+    """
+    Base class for the CMAKE.* checks of the whole CMake project: all the listfiles of the include graph
+    (built once per run and shared by all the CMAKE.* checks, check CMakeIncludeGraph), not only the top-level
+    CMakeLists.txt. Subclasses implement check_graph().
+
+    Note: CMakeProjectGraphCheck is not a registered check!
+    """
+
+    def inputs(self):
+        """
+        Override.
+        All the listfiles of the include graph are inputs of the check.
+        """
+        return {"files": self.snapshot.get_cmake_graph(self.path).get_paths()}
 
+    def repo_info_inputs(self):
+        """
+        Override.
+        No repo_info field: never build the include graph to prefetch the repository information.
+        """
+        return []
 
-# TODO CMAKE.LIBRARY_ALIAS
+    def check(self):
+        """
+        Override.
+        The listfiles that cannot be parsed are logged (once), then the include graph is checked.
+        """
+        graph = self.snapshot.get_cmake_graph(self.path)
+        for path, error in graph.errors.items():
+            self.log(f"Cannot parse the file '{path}': {error}.")
+        return self.check_graph(graph)
+
+    @abstractmethod
+    def check_graph(self, graph):
+        """
+        Check the include graph of the CMake project.
+        @return: True if the check passed, False otherwise.
+        """
+        pass
+
+    def find_libraries(self, graph):
+        """
+        @return: The (absolute path, add_library() command) pairs of the project, without the ALIAS
+                 and IMPORTED libraries - e.g., add_library(beman.exemplar).
+        """
+        return [
+            (path, command)
+            for path, command in graph.find_commands("add_library")
+            if len(command.arguments) > 0
+            and "ALIAS" not in command.arguments[1:]
+            and "IMPORTED" not in command.arguments[1:]
+        ]
+
+
+@register_beman_standard_check(
+    "CMAKE.LIBRARY_NAME",
+    input_patterns=["CMakeLists.txt", "*/CMakeLists.txt", "*.cmake"],
+)
+class CMakeLibraryNameCheck(CMakeProjectGraphCheck):
+    """
+    Check that the CMake project defines the library target beman.<short_name> - e.g., add_library(beman.exemplar).
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+    def check_graph(self, graph):
+        libraries = self.find_libraries(graph)
+        if any(command.arguments[0] == self.library_name for _, command in libraries):
+            return True
+
+        found = ", ".join(
+            f"'{command.arguments[0]}' ({self.get_location(path, command)})"
+            for path, command in libraries
+        )
+        self.log(
+            f"Missing library target '{self.library_name}' in the CMake project (found: {found or 'none'}). See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakelibrary_name for more information."
+        )
+        return False
+
+    def fix(self):
+        self.log(
+            f"Please name the library target of the project '{self.library_name}': add_library({self.library_name} ...). See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakelibrary_name for more information."
+        )
+
+
+@register_beman_standard_check(
+    "CMAKE.LIBRARY_ALIAS",
+    input_patterns=["CMakeLists.txt", "*/CMakeLists.txt", "*.cmake"],
+)
+class CMakeLibraryAliasCheck(CMakeProjectGraphCheck):
+    """
+    Check that the CMake project defines the alias beman::<short_name> of the library target
+    - e.g., add_library(beman::exemplar ALIAS beman.exemplar).
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+        # The alias of the library target - e.g., "beman::exemplar".
+        self.alias_name = f"beman::{self.repo_name}"
+
+    def check_graph(self, graph):
+        aliases = [
+            (path, command)
+            for path, command in graph.find_commands("add_library")
+            if len(command.arguments) == 3
+            and command.arguments[0] == self.alias_name
+            and command.arguments[1] == "ALIAS"
+        ]
+        if len(aliases) == 0:
+            self.log(
+                f"Missing alias target add_library({self.alias_name} ALIAS {self.library_name}) in the CMake project. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakelibrary_alias for more information."
+            )
+            return False
+
+        path, alias = aliases[0]
+        if alias.arguments[2] != self.library_name:
+            self.log(
+                f"Invalid alias target '{self.alias_name}' ({self.get_location(path, alias)}): it aliases '{alias.arguments[2]}' vs '{self.library_name}'. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakelibrary_alias for more information."
+            )
+            return False
+
+        return True
+
+    def fix(self):
+        self.log(
+            f"Please add the alias target of the library: add_library({self.alias_name} ALIAS {self.library_name}). See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakelibrary_alias for more information."
+        )
 
 
 # TODO CMAKE.TARGET_NAMES
@@ -38,10 +252,44 @@ class CMakeBaseCheck(FileBaseCheck):
 # TODO CMAKE.PASSIVE_TARGETS
 
 
-# TODO CMAKE.SKIP_TESTS
+@register_beman_standard_check("CMAKE.SKIP_TESTS", input_patterns=["CMakeLists.txt"])
+class CMakeSkipTestsCheck(CMakeBaseCheck):
+    """
+    Check that the tests can be skipped with the <PREFIX>_BUILD_TESTS option - e.g., BEMAN_EXEMPLAR_BUILD_TESTS.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+    def check(self):
+        return self.check_build_option(
+            f"{self.option_prefix}_BUILD_TESTS", "tests", "cmakeskip_tests"
+        )
+
+    def fix(self):
+        self.log(
+            f"Please add option({self.option_prefix}_BUILD_TESTS ...) and build the tests only if it is set. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakeskip_tests for more information."
+        )
+
+
+@register_beman_standard_check("CMAKE.SKIP_EXAMPLES", input_patterns=["CMakeLists.txt"])
+class CMakeSkipExamplesCheck(CMakeBaseCheck):
+    """
+    Check that the examples can be skipped with the <PREFIX>_BUILD_EXAMPLES option - e.g., BEMAN_EXEMPLAR_BUILD_EXAMPLES.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
 
+    def check(self):
+        return self.check_build_option(
+            f"{self.option_prefix}_BUILD_EXAMPLES", "examples", "cmakeskip_examples"
+        )
 
-# TODO CMAKE.SKIP_EXAMPLES
+    def fix(self):
+        self.log(
+            f"Please add option({self.option_prefix}_BUILD_EXAMPLES ...) and build the examples only if it is set. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cmakeskip_examples for more information."
+        )
 
 
 # TODO CMAKE.AVOID_PASSTHROUGHS
@@ -1,13 +1,253 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import re
+
+from ..base.base_check import BaseCheck
+from ..system.registry import register_beman_standard_check
+from ...utils.cpp import (
+    CPP_ANONYMOUS_NAMESPACE,
+    CPP_EXTENSIONS,
+    scan_cpp_namespaces,
+)
+from ...utils.concurrency import map_batches
+
 # [CPP.*] checks category.
+# All checks in this file scan the C++ files of the library (check CPP_EXTENSIONS), so they extend the BaseCheck class.
+
+
+class CppBaseCheck(BaseCheck):
+    """
+    Base class for the checks scanning the C++ files of the library: include/beman/<short_name>/ and
+    src/beman/<short_name>/.
+
+    Note: CppBaseCheck is not a registered check!
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+        # The library directories, relative to the repository - e.g., ["include/beman/exemplar", "src/beman/exemplar"].
+        self.library_directories = [
+            f"include/beman/{self.repo_name}",
+            f"src/beman/{self.repo_name}",
+        ]
+
+        # The prefix of the library macros - e.g., "BEMAN_EXEMPLAR_" for beman.exemplar.
+        self.macro_prefix = (
+            re.sub(r"[^A-Za-z0-9]", "_", self.library_name).upper() + "_"
+        )
+
+    def iter_library_files(self):
+        """
+        Iterate over the C++ files of the library (repository index entries).
+        """
+        for directory in self.library_directories:
+            yield from self.snapshot.index.iter_files(directory, CPP_EXTENSIONS)
+
+    def scan_library_files(self, parser):
+        """
+        Parse all the C++ files of the library with the given parser (e.g., scan_cpp_namespaces()), on a thread pool.
+        Each file is parsed through the repository snapshot (check RepositorySnapshot.parse()): the results are
+        cached by content hash and shared between the checks.
+
+        @return: The (relative path, result) pairs, sorted by path.
+        """
+
+        return sorted(
+            map_batches(
+                lambda entry: (
+                    entry.relative_path,
+                    self.snapshot.parse(entry.path, parser),
+                ),
+                self.iter_library_files(),
+            )
+        )
+
+    def get_directive_index(self):
+        """
+        Get the preprocessor directive index of the library (built once per run and shared by all the CPP.* checks,
+        check CppDirectiveIndex).
+        """
+        return self.snapshot.get_cpp_directive_index(self.library_directories)
+
+
+@register_beman_standard_check(
+    "CPP.NAMESPACE", input_patterns=["include/beman/*", "src/beman/*"]
+)
+class CppNamespaceCheck(CppBaseCheck):
+    """
+    Check that the C++ files of the library declare their entities in the beman::<short_name> namespace
+    - e.g., "namespace beman::exemplar {" in include/beman/exemplar/identity.hpp.
+
+    The namespace declarations are found by a lightweight lexer (check scan_cpp_namespaces()): comments,
+    string literals and preprocessor directives are skipped. Files without declarations (e.g., only macros
+    or includes) are skipped. Every non-compliant file is reported, with its line number.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+        # The expected namespace - e.g., "beman::exemplar".
+        self.namespace = f"beman::{self.repo_name}"
+
+    def check(self):
+        scanned_files = self.scan_library_files(scan_cpp_namespaces)
+        self.properties["scanned_files"] = len(scanned_files)
+
+        cnt_issues = 0
+        for relative_path, scan in scanned_files:
+            if not scan.has_declarations:
+                continue
+            if any(self.is_library_namespace(ns.name) for ns in scan.namespaces):
+                continue
+
+            cnt_issues += 1
+            invalid = next(
+                (
+                    ns
+                    for ns in scan.namespaces
+                    if not ns.nested
+                    and ns.name not in ("beman", CPP_ANONYMOUS_NAMESPACE)
+                ),
+                None,
+            )
+            if invalid is not None:
+                self.log(
+                    f"{relative_path}:{invalid.line}: Invalid namespace '{invalid.name}'. Expected: '{self.namespace}'."
+                )
+            else:
+                self.log(
+                    f"{relative_path}:1: Missing namespace. Expected: '{self.namespace}'."
+                )
+
+        if cnt_issues > 0:
+            self.log(
+                f"{cnt_issues} of {len(scanned_files)} files do not declare their entities in the '{self.namespace}' namespace. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppnamespace for more information."
+            )
+            return False
+
+        return True
+
+    def fix(self):
+        self.log(
+            f"Please declare the entities of the files listed above in the '{self.namespace}' namespace. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppnamespace for more information."
+        )
+
+    def is_library_namespace(self, name):
+        """
+        Check if a namespace is the library namespace or one of its nested namespaces - e.g., "beman::exemplar::detail".
+        """
+        return name == self.namespace or name.startswith(f"{self.namespace}::")
+
+
+# Macros that are not flags of the library, even though the build may define them.
+# Reserved identifiers (e.g., __cplusplus, __cpp_lib_ranges, _MSC_VER) are predefined by the implementation.
+CPP_PREDEFINED_MACROS = frozenset(["NDEBUG"])
+
+
+def is_reserved_identifier(name):
+    """
+    Check if an identifier is reserved to the implementation - e.g., "__cplusplus", "_MSC_VER".
+    """
+    return "__" in name or (len(name) > 1 and name[0] == "_" and name[1].isupper())
+
+
+@register_beman_standard_check(
+    "CPP.NO_FLAG_FORKING", input_patterns=["include/beman/*", "src/beman/*"]
+)
+class CppNoFlagForkingCheck(CppBaseCheck):
+    """
+    Check that the library does not fork its code on flags: macros tested by the conditional directives
+    (e.g., "#ifdef BEMAN_EXEMPLAR_USE_X") that the build can set - e.g., -DBEMAN_EXEMPLAR_USE_X.
+    A flag is a tested macro that the library does not define, or only defines as an overridable default
+    (check CppMacroDefinition.overridable). The macros of the implementation (e.g., __cplusplus,
+    __cpp_lib_ranges, _MSC_VER) and NDEBUG are not flags.
+
+    The check is a query of the directive index of the library (check get_directive_index()).
+    Every flag is reported, with the location of each of its conditions.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+    def check(self):
+        index = self.get_directive_index()
+        self.properties["scanned_files"] = len(index.paths)
+
+        flags = set()
+        for condition in index.iter_conditions():
+            if not self.is_flag(index, condition.name):
+                continue
+            flags.add(condition.name)
+            self.log(
+                f"{condition.path}:{condition.line}: The code forks on the flag '{condition.name}' (#{condition.directive})."
+            )
+
+        if len(flags) > 0:
+            self.log(
+                f"{len(flags)} flags fork the code of the library: {', '.join(sorted(flags))}. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppno_flag_forking for more information."
+            )
+            return False
+
+        return True
+
+    def fix(self):
+        self.log(
+            "Please remove the conditional directives listed above: the library must not change depending on the flags of the build. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppno_flag_forking for more information."
+        )
+
+    @staticmethod
+    def is_flag(index, name):
+        """
+        Check if a tested macro is a flag: not defined by the library, nor by the implementation.
+        """
+        return (
+            not is_reserved_identifier(name)
+            and name not in CPP_PREDEFINED_MACROS
+            and not index.is_defined(name)
+        )
+
+
+@register_beman_standard_check(
+    "CPP.EXTENSION_IDENTIFIERS", input_patterns=["include/beman/*", "src/beman/*"]
+)
+class CppExtensionIdentifiersCheck(CppBaseCheck):
+    """
+    Check that the macros defined by the library use its prefix - e.g., BEMAN_EXEMPLAR_IDENTITY_HPP.
+    Macros share a single global namespace: the identifiers the library adds to it must not collide with
+    the identifiers of the users or of the other libraries. Macros #undef'd in the same file are local
+    (check CppMacroDefinition.local) and are not checked.
+
+    The check is a query of the directive index of the library (check get_directive_index()).
+    Every non-compliant definition is reported, with its location.
+    """
 
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
 
-# TODO CPP.NAMESPACE
+    def check(self):
+        index = self.get_directive_index()
+        self.properties["scanned_files"] = len(index.paths)
 
+        cnt_issues = 0
+        for definition in index.iter_definitions():
+            if definition.local or definition.name.startswith(self.macro_prefix):
+                continue
+            cnt_issues += 1
+            self.log(
+                f"{definition.path}:{definition.line}: Invalid macro name '{definition.name}'. Expected prefix: '{self.macro_prefix}'."
+            )
 
-# TODO CPP.NO_FLAG_FORKING
+        if cnt_issues > 0:
+            self.log(
+                f"{cnt_issues} macros of the library do not start with '{self.macro_prefix}'. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppextension_identifiers for more information."
+            )
+            return False
 
+        return True
 
-# TODO CPP.EXTENSION_IDENTIFIERS
+    def fix(self):
+        self.log(
+            f"Please prefix the macros listed above with '{self.macro_prefix}', or #undef them after use. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#cppextension_identifiers for more information."
+        )
@@ -36,7 +36,10 @@ class BemanTreeDirectoryCheck(DirectoryBaseCheck):
 # TODO DIRECTORY.IMPLEMENTATION_HEADERS
 
 
-@register_beman_standard_check("DIRECTORY.SOURCES")
+@register_beman_standard_check(
+    "DIRECTORY.SOURCES",
+    input_patterns=["src/*", "source/*", "sources/*", "lib/*", "library/*"],
+)
 class DirectorySourcesCheck(BemanTreeDirectoryCheck):
     """
     Check if the sources directory is src/beman/<short_name>.
@@ -45,6 +48,9 @@ class DirectorySourcesCheck(BemanTreeDirectoryCheck):
     Example for a repo named "exemplar": src/beman/exemplar
     """
 
+    # Known source locations which are not allowed by the Beman Standard.
+    forbidden_source_locations = ["source/", "sources/", "lib/", "library/"]
+
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config, "src")
 
@@ -53,20 +59,28 @@ class DirectorySourcesCheck(BemanTreeDirectoryCheck):
         # (a repo without any source files location is still valid - header only libraries)
         return True
 
+    def inputs(self):
+        # Only the existence of the source locations matters.
+        return {
+            "directories": [self.repo_path]
+            + [self.repo_path / prefix for prefix in ["src/", "src/beman/"]]
+        }
+
     def check(self):
         # TODO: This is a temporary implementation. Use CMakeLists.txt to actually get the source files location.
         # Should not allow other known source locations.
-        forbidden_source_locations = ["source/", "sources/", "lib/", "library/"]
-        for forbidden_prefix in forbidden_source_locations:
+        for forbidden_prefix in self.forbidden_source_locations:
             forbidden_prefix = self.repo_path / forbidden_prefix
-            if forbidden_prefix.exists():
+            if self.snapshot.index.exists(forbidden_prefix):
                 self.log(
                     f"Please move source files from {forbidden_prefix} to src/beman/{self.repo_name}. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#directorysources for more information."
                 )
                 return False
 
         # If `src/` exists, src/beman/<short_name> also should exist.
-        if (self.repo_path / "src/").exists() and not self.path.exists():
+        if self.snapshot.index.exists(
+            self.repo_path / "src/"
+        ) and not self.snapshot.index.exists(self.path):
             self.log(
                 f"Please use the required source files location: src/beman/{self.repo_name}. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#directorysources for more information."
             )
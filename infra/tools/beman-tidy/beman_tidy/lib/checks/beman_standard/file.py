@@ -1,19 +1,328 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import os
+
+from ..base.base_check import BaseCheck
+from ..system.registry import register_beman_standard_check
+from ...utils.concurrency import map_batches
+from ...utils.cpp import CPP_EXTENSIONS, CPP_SOURCE_EXTENSIONS
+from ...utils.name_rules import NameRuleEngine
+from ...utils.standard_config import compile_regexes
+
 # [FILE.*] checks category.
-# All checks in this file extend the FileBaseCheck class.
+# All checks in this file extend the FileBaseCheck class, except the checks scanning
+# all the files of the repository (e.g., FILE.LICENSE_ID, FILE.CPP_NAMES), which extend the BaseCheck class.
 #
 # Note: FileBaseCheck is not a registered check!
 
 
-# TODO FILE.NAMES
+# The directory classes of the C++ files, relative to the repository (check NameRuleEngine).
+CPP_DIRECTORY_CLASSES = {
+    "headers": ["include/"],
+    "sources": ["src/"],
+    "tests": ["tests/"],
+    "examples": ["examples/"],
+}
+
+# The file name rules of FILE.CPP_NAMES and FILE.TEST_NAMES, per directory class.
+# The "regex" of these checks in .beman-standard.yml is not specified yet (a placeholder).
+CPP_NAMES_RULES = {
+    "headers": ["${snake_case}.hpp"],
+    "sources": ["${snake_case}.cpp", "${snake_case}.hpp"],
+    "tests": ["${snake_case}.cpp", "${snake_case}.hpp"],
+    "examples": ["${snake_case}.cpp", "${snake_case}.hpp"],
+}
+TEST_NAMES_RULES = {
+    "tests": ["${snake_case}.test.cpp"],
+}
+
+
+class FileNameRulesBaseCheck(BaseCheck):
+    """
+    Base class for the checks of the file names: all the files walked by the repository index (e.g., the files
+    tracked by git) are checked in a single pass against the rules of their directory class
+    (check CPP_DIRECTORY_CLASSES and NameRuleEngine). Every non-compliant file is reported.
+
+    Note: FileNameRulesBaseCheck is not a registered check!
+    """
+
+    def __init__(
+        self, repo_info, beman_standard_check_config, rules, extensions, anchor
+    ):
+        super().__init__(repo_info, beman_standard_check_config)
+
+        # The file name rules, compiled once.
+        self.engine = NameRuleEngine(CPP_DIRECTORY_CLASSES, rules, extensions)
+        # The anchor of the check in BEMAN_STANDARD.md - e.g., "filecpp_names".
+        self.anchor = anchor
+
+    def check(self):
+        cnt_checked_files, violations = self.engine.evaluate(
+            entry.relative_path for entry in self.snapshot.index.iter_files()
+        )
+        self.properties["scanned_files"] = cnt_checked_files
+
+        for violation in sorted(violations, key=lambda violation: violation.path):
+            expected = " or ".join(f"'{template}'" for template in violation.templates)
+            self.log(f"{violation.path}: Invalid file name. Expected: {expected}.")
+        if len(violations) > 0:
+            self.log(
+                f"{len(violations)} of {cnt_checked_files} files have an invalid name. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#{self.anchor} for more information."
+            )
+            return False
+
+        return True
+
+    def fix(self):
+        # Renaming a file requires updating all its references (e.g., #include, CMakeLists.txt).
+        self.log(
+            f"Please rename the files listed above. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#{self.anchor} for more information."
+        )
+
+
+@register_beman_standard_check(
+    "FILE.CPP_NAMES", input_patterns=["include/*", "src/*", "tests/*", "examples/*"]
+)
+class FileCppNamesCheck(FileNameRulesBaseCheck):
+    """
+    Check that the C++ files have snake_case names, with the .hpp and .cpp extensions (check CPP_NAMES_RULES)
+    - e.g., include/beman/exemplar/identity.hpp, examples/identity_direct_usage.cpp.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(
+            repo_info,
+            beman_standard_check_config,
+            CPP_NAMES_RULES,
+            CPP_EXTENSIONS,
+            "filecpp_names",
+        )
+
+
+@register_beman_standard_check("FILE.TEST_NAMES", input_patterns=["tests/*"])
+class FileTestNamesCheck(FileNameRulesBaseCheck):
+    """
+    Check that the C++ source files of the tests are named ${snake_case}.test.cpp (check TEST_NAMES_RULES)
+    - e.g., tests/beman/exemplar/identity.test.cpp. The headers of the tests are not checked.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(
+            repo_info,
+            beman_standard_check_config,
+            TEST_NAMES_RULES,
+            CPP_SOURCE_EXTENSIONS,
+            "filetest_names",
+        )
+
+
+# The comment style of the SPDX license identifier, per file name or extension.
+# Files with other names or extensions are not scanned.
+LICENSE_ID_FILE_NAME_STYLES = {
+    "CMakeLists.txt": "#",
+}
+LICENSE_ID_EXTENSION_STYLES = {
+    **dict.fromkeys(
+        [".c", ".cc", ".cpp", ".cxx", ".c++", ".cppm", ".ixx"],
+        "//",
+    ),
+    **dict.fromkeys(
+        [".h", ".hh", ".hpp", ".hxx", ".h++", ".inl", ".ipp", ".tpp"],
+        "//",
+    ),
+    **dict.fromkeys([".cmake", ".py", ".sh"], "#"),
+    ".md": "<!--",
+}
+
+# The expected SPDX license identifier line, per comment style (check FILE.LICENSE_ID in .beman-standard.yml).
+LICENSE_ID_EXAMPLES = {
+    "//": "// SPDX-License-Identifier: <SPDX License Expression>",
+    "#": "# SPDX-License-Identifier: <SPDX License Expression>",
+    "<!--": "<!-- SPDX-License-Identifier: <SPDX License Expression> -->",
+}
+
+# The SPDX license identifier must be in the first lines of a file (e.g., after a shebang or a title):
+# only the first LICENSE_ID_READ_SIZE bytes of each file are read.
+LICENSE_ID_MAX_LINES = 10
+LICENSE_ID_READ_SIZE = 4096
+
+# Files are scanned in batches, on a thread pool (check map_batches()): only their beginning is read,
+# so the batches are larger than the default ones.
+LICENSE_ID_BATCH_SIZE = 256
+
+# Directories with this file are vendored from another Beman repository (check beman-submodule),
+# which is responsible for their license identifiers.
+BEMAN_SUBMODULE_FILE_NAME = ".beman_submodule"
+
+# A bare SPDX license identifier - e.g., inside a multi-line HTML comment.
+_bare_license_id_regex = compile_regexes(
+    "SPDX-License-Identifier: <SPDX License Expression>"
+)[0]
+
+
+def get_license_id_style(file_name):
+    """
+    Get the comment style of the SPDX license identifier of a file - e.g., "//" for "identity.hpp".
+    @return: The comment style (a key of LICENSE_ID_EXAMPLES), or None if the file is not scanned.
+    """
+    style = LICENSE_ID_FILE_NAME_STYLES.get(file_name)
+    if style is None:
+        style = LICENSE_ID_EXTENSION_STYLES.get(os.path.splitext(file_name)[1])
+    return style
+
+
+def scan_license_id(path, style, regexes):
+    """
+    Scan the beginning of a file for its SPDX license identifier (a bounded read: LICENSE_ID_READ_SIZE bytes).
+    - style: the expected comment style - e.g., "//" (check get_license_id_style()).
+    - regexes: the accepted SPDX license identifier lines (the "regex" of FILE.LICENSE_ID).
+    Markdown files may also use a multi-line HTML comment - e.g., "<!--\\nSPDX-License-Identifier: ...\\n-->".
+
+    @return: None if the file is compliant (or empty, or binary, or cannot be read),
+             otherwise the line number and the issue - e.g., (1, "Missing SPDX license identifier").
+    """
+    try:
+        with open(path, "rb") as file:
+            head = file.read(LICENSE_ID_READ_SIZE)
+    except OSError:
+        return None
+    if not head or b"\0" in head:
+        return None  # empty or binary file
+
+    in_html_comment = False
+    lines = head.decode("utf-8", errors="replace").splitlines()
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if "SPDX-License-Identifier" not in line:
+            if style == "<!--":
+                if line.startswith("<!--") and "-->" not in line:
+                    in_html_comment = True
+                elif "-->" in line:
+                    in_html_comment = False
+            continue
+
+        if line_number > LICENSE_ID_MAX_LINES:
+            return (
+                line_number,
+                f"The SPDX license identifier must be in the first {LICENSE_ID_MAX_LINES} lines",
+            )
+        if line.startswith(style) and any(regex.fullmatch(line) for regex in regexes):
+            return None
+        if in_html_comment and _bare_license_id_regex.fullmatch(line):
+            return None
+        return line_number, "Invalid SPDX license identifier"
+
+    return 1, "Missing SPDX license identifier"
+
+
+@register_beman_standard_check(
+    "FILE.LICENSE_ID",
+    # The files scanned by FILE.LICENSE_ID (check LICENSE_ID_FILE_NAME_STYLES and LICENSE_ID_EXTENSION_STYLES).
+    input_patterns=[
+        "CMakeLists.txt",
+        "*/CMakeLists.txt",
+        "*.c",
+        "*.cc",
+        "*.cpp",
+        "*.cxx",
+        "*.c++",
+        "*.cppm",
+        "*.ixx",
+        "*.h",
+        "*.hh",
+        "*.hpp",
+        "*.hxx",
+        "*.h++",
+        "*.inl",
+        "*.ipp",
+        "*.tpp",
+        "*.cmake",
+        "*.py",
+        "*.sh",
+        "*.md",
+    ],
+)
+class FileLicenseIdCheck(BaseCheck):
+    """
+    Check that the source, build and documentation files of the repository start with an SPDX license identifier
+    in the comment style of the file (check LICENSE_ID_EXTENSION_STYLES) - e.g.,
+    "// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception" for "include/beman/exemplar/identity.hpp".
+
+    All the files walked by the repository index are scanned (e.g., the files tracked by git), except
+    empty files and files vendored from another Beman repository. Only the beginning of each file is read
+    (check scan_license_id()), on a thread pool. Every non-compliant file is reported, with its line number.
+    """
+
+    def __init__(self, repo_info, beman_standard_check_config):
+        super().__init__(repo_info, beman_standard_check_config)
+
+        # The accepted SPDX license identifier lines - e.g., "// SPDX-License-Identifier: (.+?)".
+        self.regexes = self.config["regex"]
+
+        # Vendored directories (check BEMAN_SUBMODULE_FILE_NAME): absolute path -> True if vendored.
+        self._vendored_directories = {}
+
+    def check(self):
+        files = [
+            (entry.path, entry.relative_path, style)
+            for entry in self.snapshot.index.iter_files()
+            if (style := get_license_id_style(entry.name)) is not None
+            and not self.is_vendored(os.path.dirname(entry.path))
+        ]
+
+        issues = [
+            issue
+            for issue in map_batches(self.scan_file, files, LICENSE_ID_BATCH_SIZE)
+            if issue is not None
+        ]
+        cnt_scanned_files = len(files)
+
+        self.properties["scanned_files"] = cnt_scanned_files
+        for relative_path, line_number, issue, style in sorted(issues):
+            self.log(
+                f"{relative_path}:{line_number}: {issue}. Expected: '{LICENSE_ID_EXAMPLES[style]}'."
+            )
+        if len(issues) > 0:
+            self.log(
+                f"{len(issues)} of {cnt_scanned_files} files do not start with a valid SPDX license identifier. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#filelicense_id for more information."
+            )
+            return False
 
+        return True
 
-# TODO FILE.TEST_NAMES
+    def fix(self):
+        # The license of each file is not known, so it cannot be added automatically.
+        self.log(
+            "Please add the SPDX license identifier of the project at the beginning of each file listed above. See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#filelicense_id for more information."
+        )
 
+    def scan_file(self, file):
+        """
+        Scan a file: a (path, relative path, comment style) tuple.
+        @return: The issue - a (relative path, line number, issue, comment style) tuple - or None if compliant.
+        """
+        path, relative_path, style = file
+        issue = scan_license_id(path, style, self.regexes)
+        return None if issue is None else (relative_path, *issue, style)
 
-# TODO FILE.LICENSE_ID
+    def is_vendored(self, directory):
+        """
+        Check if a directory is vendored from another Beman repository (check BEMAN_SUBMODULE_FILE_NAME),
+        itself or one of its parents up to the repository top level (cached).
+        """
+        vendored = self._vendored_directories.get(directory)
+        if vendored is None:
+            parent = os.path.dirname(directory)
+            vendored = self.snapshot.index.is_file(
+                os.path.join(directory, BEMAN_SUBMODULE_FILE_NAME)
+            ) or (
+                directory != self.snapshot.index.top_level
+                and parent != directory
+                and self.is_vendored(parent)
+            )
+            self._vendored_directories[directory] = vendored
+        return vendored
 
 
 # TODO FILE.COPYRIGHT
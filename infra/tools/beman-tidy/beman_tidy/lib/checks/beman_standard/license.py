@@ -1,67 +1,123 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
-import re
-import filecmp
 import textwrap
-from pathlib import Path
 
 from ..base.file_base_check import FileBaseCheck
 from ..system.registry import register_beman_standard_check
+from ...utils.license_index import get_license_index
 
 # [LICENSE.*] checks category.
 # All checks in this file extend the LicenseBaseCheck class.
 #
 # Note: LicenseBaseCheck is not a registered check!
 
+# The licenses approved by LICENSE.APPROVED: license id (check .beman-standard.yml) -> name in the LICENSE header.
+APPROVED_LICENSE_NAMES = {
+    "apache-v2": "Apache License v2.0 with LLVM Exceptions",
+    "boost-v1": "Boost Software License 1.0",
+    "mit": "MIT License",
+}
+
+# The license required by LICENSE.APACHE_LLVM.
+APACHE_LLVM_LICENSE_ID = "apache-v2"
+
+# The fixed sections of an approved LICENSE file: header, (non-empty) license body, footer.
+_license_separator = "=" * 78
+APPROVED_LICENSE_HEADER_PREFIX = (
+    f"{_license_separator}\nThe Beman Project is under the "
+)
+APPROVED_LICENSE_HEADER_SUFFIX = f":\n{_license_separator}\n\n"
+APPROVED_LICENSE_FOOTER = (
+    f"\n\n{_license_separator}\n"
+    "Software from third parties included in the Beman Project:\n"
+    f"{_license_separator}\n"
+    + textwrap.dedent("""
+        The Beman Project contains third party software which is under different license
+        terms. All such code will be identified clearly using at least one of two
+        mechanisms:
+        1) It will be in a separate directory tree with its own `LICENSE.txt` or
+           `LICENSE` file at the top containing the specific license and restrictions
+           which apply to that software, or
+        2) It will contain specific license and restriction terms at the top of every
+           file.
+        """).strip()
+)
+
+
+def match_approved_license(content):
+    """
+    Match the layout of an approved LICENSE file, section by section:
+    - the fixed header, naming one of APPROVED_LICENSE_NAMES;
+    - a non-empty license body;
+    - the fixed footer (anything may follow it).
+
+    Only literal comparisons and a substring search are used (no regex backtracking),
+    so the time is linear in the size of the content - even for large or crafted LICENSE files.
+
+    @return: The id of the approved license (e.g., "apache-v2"), or None if the content does not match.
+    """
+    if not content.startswith(APPROVED_LICENSE_HEADER_PREFIX):
+        return None
+
+    for license_id, license_name in APPROVED_LICENSE_NAMES.items():
+        header = (
+            APPROVED_LICENSE_HEADER_PREFIX
+            + license_name
+            + APPROVED_LICENSE_HEADER_SUFFIX
+        )
+        if not content.startswith(header):
+            continue
+
+        # The body is not empty: the footer starts at least one character after the header.
+        if content.find(APPROVED_LICENSE_FOOTER, len(header) + 1) == -1:
+            return None
+        return license_id
+
+    return None
+
 
 class LicenseBaseCheck(FileBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config, "LICENSE")
 
+        # The fingerprint index of the approved licenses.
+        self.license_index = get_license_index(
+            beman_standard_check_config["LICENSE.APPROVED"]["licenses"]
+        )
+
+    def match_license_fingerprint(self):
+        """
+        Look up the fingerprint of the LICENSE file (a single streamed hash) in the approved licenses index.
+        Records the matched license in self.properties["license"].
+        @return: The approved license (check LicenseIndex), or None if the LICENSE file is not a reference one.
+        """
+        license = self.license_index.match_file(self.path)
+        if license is not None:
+            self.properties["license"] = license["id"]
+        return license
+
 
-@register_beman_standard_check("LICENSE.APPROVED")
+@register_beman_standard_check("LICENSE.APPROVED", input_patterns=["LICENSE"])
 class LicenseApprovedCheck(LicenseBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
 
     def check(self):
-        content = self.read()
-
-        # Regex for LICENSE check
-        # - fixed header matching
-        # - non empty body matching
-        # - fixed footer matching
-        regex = re.compile(
-            textwrap.dedent(r"""
-                ^={78}
-                The Beman Project is under the (Apache License v2\.0 with LLVM Exceptions|Boost Software License 1\.0|MIT License):
-                ={78}
-
-                (.+?)
-
-                ={78}
-                Software from third parties included in the Beman Project:
-                ={78}
-                The Beman Project contains third party software which is under different license
-                terms\. All such code will be identified clearly using at least one of two
-                mechanisms:
-                1\) It will be in a separate directory tree with its own `LICENSE\.txt` or
-                   `LICENSE` file at the top containing the specific license and restrictions
-                   which apply to that software, or
-                2\) It will contain specific license and restriction terms at the top of every
-                   file\.
-                """).strip(),
-            re.DOTALL,
-        )
+        # Fast path: the LICENSE file is one of the reference files.
+        if self.match_license_fingerprint() is not None:
+            return True
 
-        if not regex.match(content):
+        # Otherwise (e.g., an MIT LICENSE with its copyright line), check the layout of the file.
+        license_id = match_approved_license(self.read())
+        if license_id is None:
             self.log(
                 "LICENSE file does not match the required format. "
                 "See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#licenseapproved for more information."
             )
             return False
 
+        self.properties["license"] = license_id
         return True
 
     def fix(self):
@@ -71,16 +127,21 @@ class LicenseApprovedCheck(LicenseBaseCheck):
         )
 
 
-@register_beman_standard_check("LICENSE.APACHE_LLVM")
+@register_beman_standard_check("LICENSE.APACHE_LLVM", input_patterns=["LICENSE"])
 class LicenseApacheLLVMCheck(LicenseBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
 
+        # The reference LICENSE file: Apache License v2.0 with LLVM Exceptions.
+        self.ref_license = self.license_index.get(APACHE_LLVM_LICENSE_ID)["path"]
+
+    def inputs(self):
+        return {"files": [self.path, self.ref_license]}
+
     def check(self):
-        # Compare LICENSE file stored at self.path with the reference one.
-        target_license = self.path
-        ref_license = Path(__file__).parents[6] / "LICENSE"
-        if not filecmp.cmp(target_license, ref_license, shallow=False):
+        # Compare the fingerprint of the LICENSE file with the reference one (modulo whitespace).
+        license = self.match_license_fingerprint()
+        if license is None or license["id"] != APACHE_LLVM_LICENSE_ID:
             self.log(
                 "Please update the LICENSE file to include the Apache License v2.0 with LLVM Exceptions. "
                 "See https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md#licenseapache_llvm for more information."
@@ -96,7 +157,7 @@ class LicenseApacheLLVMCheck(LicenseBaseCheck):
         )
 
 
-@register_beman_standard_check("LICENSE.CRITERIA")
+@register_beman_standard_check("LICENSE.CRITERIA", input_patterns=["LICENSE"])
 class LicenseCriteriaCheck(LicenseBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -16,7 +16,7 @@ class ReadmeBaseCheck(FileBaseCheck):
         super().__init__(repo_info, beman_standard_check_config, "README.md")
 
 
-@register_beman_standard_check("README.TITLE")
+@register_beman_standard_check("README.TITLE", input_patterns=["README.md"])
 class ReadmeTitleCheck(ReadmeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -44,7 +44,7 @@ class ReadmeTitleCheck(ReadmeBaseCheck):
         return True
 
 
-@register_beman_standard_check("README.BADGES")
+@register_beman_standard_check("README.BADGES", input_patterns=["README.md"])
 class ReadmeBadgesCheck(ReadmeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -63,8 +63,11 @@ class ReadmeBadgesCheck(ReadmeBaseCheck):
                     len(badges) == 2
                 )  # The number of standard targets specified in the Beman Standard.
 
+        # Count all the badges with a single scan of the file.
+        badge_counts = self.count_contents(self.config["values_matcher"])
+
         def count_badges(badges):
-            return len([badge for badge in badges if self.has_content(badge)])
+            return len([badge for badge in badges if badge_counts[badge] > 0])
 
         count_failed = 0
         for category_data in self.config["values"]:
@@ -87,7 +90,7 @@ class ReadmeBadgesCheck(ReadmeBaseCheck):
         return True
 
 
-@register_beman_standard_check("README.IMPLEMENTS")
+@register_beman_standard_check("README.IMPLEMENTS", input_patterns=["README.md"])
 class ReadmeImplementsCheck(ReadmeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -125,7 +128,7 @@ class ReadmeImplementsCheck(ReadmeBaseCheck):
         return True
 
 
-@register_beman_standard_check("README.LIBRARY_STATUS")
+@register_beman_standard_check("README.LIBRARY_STATUS", input_patterns=["README.md"])
 class ReadmeLibraryStatusCheck(ReadmeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -138,7 +141,8 @@ class ReadmeLibraryStatusCheck(ReadmeBaseCheck):
         assert len(statuses) == len(self.beman_library_maturity_model)
 
         # Check if at least one of the required status values is present.
-        status_count = len([status for status in statuses if self.has_content(status)])
+        status_counts = self.count_contents(self.config["values_matcher"])
+        status_count = len([status for status in statuses if status_counts[status] > 0])
         if status_count != 1:
             self.log(
                 f"The file '{self.path}' does not contain exactly one of the required statuses from {statuses}"
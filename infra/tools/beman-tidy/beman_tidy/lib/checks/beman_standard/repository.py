@@ -14,7 +14,9 @@ from ..system.registry import register_beman_standard_check
 # TODO REPOSITORY.NAME
 
 
-@register_beman_standard_check("REPOSITORY.CODEOWNERS")
+@register_beman_standard_check(
+    "REPOSITORY.CODEOWNERS", input_patterns=[".github/CODEOWNERS"]
+)
 class RepositoryCodeownersCheck(FileBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config, ".github/CODEOWNERS")
@@ -30,11 +32,14 @@ class RepositoryCodeownersCheck(FileBaseCheck):
         )
 
 
-@register_beman_standard_check("REPOSITORY.DEFAULT_BRANCH")
+@register_beman_standard_check("REPOSITORY.DEFAULT_BRANCH", repo_metadata=True)
 class RepositoryDefaultBranchCheck(BaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
 
+    def inputs(self):
+        return {"repo_info": ["default_branch"]}
+
     def check(self):
         default_branch = self.repo_info["default_branch"]
         if default_branch != "main":
@@ -12,7 +12,7 @@ from ..system.registry import register_beman_standard_check
 # Note: ToplevelBaseCheck is not a registered check!
 
 
-@register_beman_standard_check("TOPLEVEL.CMAKE")
+@register_beman_standard_check("TOPLEVEL.CMAKE", input_patterns=["CMakeLists.txt"])
 class ToplevelCmakeCheck(CMakeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -28,7 +28,7 @@ class ToplevelCmakeCheck(CMakeBaseCheck):
         )
 
 
-@register_beman_standard_check("TOPLEVEL.LICENSE")
+@register_beman_standard_check("TOPLEVEL.LICENSE", input_patterns=["LICENSE"])
 class ToplevelLicenseCheck(LicenseBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -44,7 +44,7 @@ class ToplevelLicenseCheck(LicenseBaseCheck):
         )
 
 
-@register_beman_standard_check("TOPLEVEL.README")
+@register_beman_standard_check("TOPLEVEL.README", input_patterns=["README.md"])
 class ToplevelReadmeCheck(ReadmeBaseCheck):
     def __init__(self, repo_info, beman_standard_check_config):
         super().__init__(repo_info, beman_standard_check_config)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+# Generated by `python3 -m beman_tidy.lib.checks.system.manifest`. DO NOT EDIT.
+# check name -> module, input patterns and repo metadata dependency.
+BEMAN_STANDARD_CHECK_MANIFEST = {
+    "CMAKE.PROJECT_NAME": {
+        "module": "beman_tidy.lib.checks.beman_standard.cmake",
+        "input_patterns": ["CMakeLists.txt"],
+        "repo_metadata": False,
+    },
+    "CMAKE.LIBRARY_NAME": {
+        "module": "beman_tidy.lib.checks.beman_standard.cmake",
+        "input_patterns": ["CMakeLists.txt", "*/CMakeLists.txt", "*.cmake"],
+        "repo_metadata": False,
+    },
+    "CMAKE.LIBRARY_ALIAS": {
+        "module": "beman_tidy.lib.checks.beman_standard.cmake",
+        "input_patterns": ["CMakeLists.txt", "*/CMakeLists.txt", "*.cmake"],
+        "repo_metadata": False,
+    },
+    "CMAKE.SKIP_TESTS": {
+        "module": "beman_tidy.lib.checks.beman_standard.cmake",
+        "input_patterns": ["CMakeLists.txt"],
+        "repo_metadata": False,
+    },
+    "CMAKE.SKIP_EXAMPLES": {
+        "module": "beman_tidy.lib.checks.beman_standard.cmake",
+        "input_patterns": ["CMakeLists.txt"],
+        "repo_metadata": False,
+    },
+    "CPP.NAMESPACE": {
+        "module": "beman_tidy.lib.checks.beman_standard.cpp",
+        "input_patterns": ["include/beman/*", "src/beman/*"],
+        "repo_metadata": False,
+    },
+    "CPP.NO_FLAG_FORKING": {
+        "module": "beman_tidy.lib.checks.beman_standard.cpp",
+        "input_patterns": ["include/beman/*", "src/beman/*"],
+        "repo_metadata": False,
+    },
+    "CPP.EXTENSION_IDENTIFIERS": {
+        "module": "beman_tidy.lib.checks.beman_standard.cpp",
+        "input_patterns": ["include/beman/*", "src/beman/*"],
+        "repo_metadata": False,
+    },
+    "DIRECTORY.SOURCES": {
+        "module": "beman_tidy.lib.checks.beman_standard.directory",
+        "input_patterns": ["src/*", "source/*", "sources/*", "lib/*", "library/*"],
+        "repo_metadata": False,
+    },
+    "FILE.CPP_NAMES": {
+        "module": "beman_tidy.lib.checks.beman_standard.file",
+        "input_patterns": ["include/*", "src/*", "tests/*", "examples/*"],
+        "repo_metadata": False,
+    },
+    "FILE.TEST_NAMES": {
+        "module": "beman_tidy.lib.checks.beman_standard.file",
+        "input_patterns": ["tests/*"],
+        "repo_metadata": False,
+    },
+    "FILE.LICENSE_ID": {
+        "module": "beman_tidy.lib.checks.beman_standard.file",
+        "input_patterns": [
+            "CMakeLists.txt",
+            "*/CMakeLists.txt",
+            "*.c",
+            "*.cc",
+            "*.cpp",
+            "*.cxx",
+            "*.c++",
+            "*.cppm",
+            "*.ixx",
+            "*.h",
+            "*.hh",
+            "*.hpp",
+            "*.hxx",
+            "*.h++",
+            "*.inl",
+            "*.ipp",
+            "*.tpp",
+            "*.cmake",
+            "*.py",
+            "*.sh",
+            "*.md",
+        ],
+        "repo_metadata": False,
+    },
+    "LICENSE.APPROVED": {
+        "module": "beman_tidy.lib.checks.beman_standard.license",
+        "input_patterns": ["LICENSE"],
+        "repo_metadata": False,
+    },
+    "LICENSE.APACHE_LLVM": {
+        "module": "beman_tidy.lib.checks.beman_standard.license",
+        "input_patterns": ["LICENSE"],
+        "repo_metadata": False,
+    },
+    "LICENSE.CRITERIA": {
+        "module": "beman_tidy.lib.checks.beman_standard.license",
+        "input_patterns": ["LICENSE"],
+        "repo_metadata": False,
+    },
+    "README.TITLE": {
+        "module": "beman_tidy.lib.checks.beman_standard.readme",
+        "input_patterns": ["README.md"],
+        "repo_metadata": False,
+    },
+    "README.BADGES": {
+        "module": "beman_tidy.lib.checks.beman_standard.readme",
+        "input_patterns": ["README.md"],
+        "repo_metadata": False,
+    },
+    "README.IMPLEMENTS": {
+        "module": "beman_tidy.lib.checks.beman_standard.readme",
+        "input_patterns": ["README.md"],
+        "repo_metadata": False,
+    },
+    "README.LIBRARY_STATUS": {
+        "module": "beman_tidy.lib.checks.beman_standard.readme",
+        "input_patterns": ["README.md"],
+        "repo_metadata": False,
+    },
+    "REPOSITORY.CODEOWNERS": {
+        "module": "beman_tidy.lib.checks.beman_standard.repository",
+        "input_patterns": [".github/CODEOWNERS"],
+        "repo_metadata": False,
+    },
+    "REPOSITORY.DEFAULT_BRANCH": {
+        "module": "beman_tidy.lib.checks.beman_standard.repository",
+        "input_patterns": None,
+        "repo_metadata": True,
+    },
+    "TOPLEVEL.CMAKE": {
+        "module": "beman_tidy.lib.checks.beman_standard.toplevel",
+        "input_patterns": ["CMakeLists.txt"],
+        "repo_metadata": False,
+    },
+    "TOPLEVEL.LICENSE": {
+        "module": "beman_tidy.lib.checks.beman_standard.toplevel",
+        "input_patterns": ["LICENSE"],
+        "repo_metadata": False,
+    },
+    "TOPLEVEL.README": {
+        "module": "beman_tidy.lib.checks.beman_standard.toplevel",
+        "input_patterns": ["README.md"],
+        "repo_metadata": False,
+    },
+}
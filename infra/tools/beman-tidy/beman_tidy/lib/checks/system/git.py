@@ -16,6 +16,9 @@ class DisallowFixInplaceAndUnstagedChangesCheck(BaseCheck):
             repo_info, beman_standard_check_config, "INTERNAL.NO_UNSTAGED_CHANGES"
         )
 
+    def inputs(self):
+        return {"repo_info": ["unstaged_changes"]}
+
     def check(self):
         """
         Should not allow fix if there are unstaged changes.
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import ast
+import importlib
+import json
+from pathlib import Path
+
+from .beman_standard_manifest import BEMAN_STANDARD_CHECK_MANIFEST
+from .registry import get_beman_standard_check_by_name
+
+# The package with the implemented checks of The Beman Standard.
+BEMAN_STANDARD_CHECKS_PACKAGE = "beman_tidy.lib.checks.beman_standard"
+
+# The generated manifest module (check build_beman_standard_check_manifest()).
+BEMAN_STANDARD_CHECK_MANIFEST_PATH = (
+    Path(__file__).parent / "beman_standard_manifest.py"
+)
+
+
+def get_beman_standard_check_manifest():
+    """
+    Get the static manifest of the implemented checks - without importing any check module.
+    e.g., {"README.TITLE": {"module": "beman_tidy.lib.checks.beman_standard.readme",
+                            "input_patterns": ["README.md"], "repo_metadata": False}, ...}
+    """
+    return BEMAN_STANDARD_CHECK_MANIFEST
+
+
+def load_beman_standard_checks(check_names):
+    """
+    Import only the check modules needed by the given checks (in the manifest order).
+    Not implemented checks are ignored.
+
+    @return: A dictionary check name -> check class, for the implemented checks.
+    """
+    for module in dict.fromkeys(
+        BEMAN_STANDARD_CHECK_MANIFEST[check_name]["module"]
+        for check_name in check_names
+        if check_name in BEMAN_STANDARD_CHECK_MANIFEST
+    ):
+        importlib.import_module(module)
+
+    return {
+        check_name: get_beman_standard_check_by_name(check_name)
+        for check_name in check_names
+        if check_name in BEMAN_STANDARD_CHECK_MANIFEST
+    }
+
+
+def build_beman_standard_check_manifest():
+    """
+    Build the manifest from the @register_beman_standard_check decorators of the check modules.
+    The modules are parsed, not imported.
+    """
+    manifest = {}
+    package_path = Path(__file__).parent.parent / "beman_standard"
+    for module_path in sorted(package_path.glob("*.py")):
+        if module_path.name == "__init__.py":
+            continue
+
+        module = f"{BEMAN_STANDARD_CHECKS_PACKAGE}.{module_path.stem}"
+        for node in ast.walk(ast.parse(module_path.read_text())):
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for decorator in node.decorator_list:
+                if not (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Name)
+                    and decorator.func.id == "register_beman_standard_check"
+                ):
+                    continue
+
+                check_name = ast.literal_eval(decorator.args[0])
+                keywords = {
+                    keyword.arg: ast.literal_eval(keyword.value)
+                    for keyword in decorator.keywords
+                }
+                manifest[check_name] = {
+                    "module": module,
+                    "input_patterns": keywords.get("input_patterns"),
+                    "repo_metadata": keywords.get("repo_metadata", False),
+                }
+    return manifest
+
+
+def write_beman_standard_check_manifest(path=BEMAN_STANDARD_CHECK_MANIFEST_PATH):
+    """
+    Regenerate the manifest module.
+    """
+    with open(path, "w") as file:
+        file.write(
+            "#!/usr/bin/env python3\n"
+            "# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception\n"
+            "\n"
+            "# Generated by `python3 -m beman_tidy.lib.checks.system.manifest`. DO NOT EDIT.\n"
+            "# check name -> module, input patterns and repo metadata dependency.\n"
+            "BEMAN_STANDARD_CHECK_MANIFEST = {\n"
+        )
+        for check_name, entry in build_beman_standard_check_manifest().items():
+            file.write(f"    {json.dumps(check_name)}: {{\n")
+            for key, value in entry.items():
+                # json.dumps() writes str/list values as Python literals (double quotes).
+                value = (
+                    repr(value)
+                    if value is None or isinstance(value, bool)
+                    else json.dumps(value)
+                )
+                file.write(f"        {json.dumps(key)}: {value},\n")
+            file.write("    },\n")
+        file.write("}\n")
+
+
+if __name__ == "__main__":
+    write_beman_standard_check_manifest()
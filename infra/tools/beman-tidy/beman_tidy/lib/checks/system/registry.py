@@ -1,27 +1,43 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
-from typing import Dict, Type, List
+from fnmatch import fnmatchcase
+from typing import Dict, Type, List, Optional
 
 # Registry to store all The Beman Standard check classes.
 _beman_standard_check_registry: Dict[str, Type] = {}
 
+# Registry to store the input path patterns of The Beman Standard checks.
+# check name -> (input_patterns, repo_metadata)
+_beman_standard_check_inputs_registry: Dict[str, tuple] = {}
 
-def register_beman_standard_check(check: str):
+
+def register_beman_standard_check(
+    check: str,
+    input_patterns: Optional[List[str]] = None,
+    repo_metadata: bool = False,
+):
     """
     Decorator to register a check class with a specific ID.
 
     Usage:
-        @register_beman_standard_check("README.TITLE")
+        @register_beman_standard_check("README.TITLE", input_patterns=["README.md"])
         class ReadmeTitleCheck(ReadmeBaseCheck):
             ...
 
+    Optional arguments (used to select the checks affected by a git diff - e.g., --changed-since):
+    - input_patterns: fnmatch patterns of the repository paths the check reads - e.g., ["README.md"], ["src/*"].
+      None means unknown inputs: the check is always selected.
+    - repo_metadata: the check depends on repository metadata (e.g., the default branch),
+      which is never visible in a diff: the check is always selected.
+
     Notes: Only register most derived check classes, which are actually part from
     The Beman Standard - e.g., README.TITLE, README.BADGES, etc.
     """
 
     def decorator(check_class: Type) -> Type:
         _beman_standard_check_registry[check] = check_class
+        _beman_standard_check_inputs_registry[check] = (input_patterns, repo_metadata)
         return check_class
 
     return decorator
@@ -48,3 +64,35 @@ def get_beman_standard_check_name_by_class(target_check_class: Type) -> str:
         if check_class == target_check_class:
             return check_name
     return None
+
+
+def get_beman_standard_checks_affected_by_paths(
+    check_names: List[str], changed_paths: List[str]
+) -> List[str]:
+    """
+    Get the checks (from check_names, in the same order) affected by the changed paths.
+    The changed paths are relative to the repository top level - e.g., ["README.md", "src/beman/exemplar/identity.cpp"].
+
+    Checks with unknown inputs or depending on repository metadata are always selected.
+    Not registered checks are never selected.
+    """
+    affected_checks = []
+    for check_name in check_names:
+        if check_name not in _beman_standard_check_inputs_registry:
+            continue
+
+        input_patterns, repo_metadata = _beman_standard_check_inputs_registry[
+            check_name
+        ]
+        if (
+            repo_metadata
+            or input_patterns is None
+            or any(
+                fnmatchcase(path, pattern)
+                for path in changed_paths
+                for pattern in input_patterns
+            )
+        ):
+            affected_checks.append(check_name)
+
+    return affected_checks
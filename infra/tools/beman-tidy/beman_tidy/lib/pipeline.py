@@ -1,23 +1,25 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import io
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from .checks.system.registry import get_registered_beman_standard_checks
+from .checks.system.manifest import (
+    get_beman_standard_check_manifest,
+    load_beman_standard_checks,
+)
+from .checks.system.registry import get_beman_standard_checks_affected_by_paths
 from .checks.system.git import DisallowFixInplaceAndUnstagedChangesCheck
+from .profiler import profiler
+from .result_cache import ResultCache, RESULT_CACHE_DIR_NAME
+from .utils.git import get_changed_paths
+from .utils.snapshot import RepositorySnapshot
 
-# import all the implemented checks.
-# TODO: Consider removing F403 from ignored lint checks
-from .checks.beman_standard.cmake import *  # noqa: F401, F403
-from .checks.beman_standard.cpp import *  # noqa: F401, F403
-from .checks.beman_standard.directory import *  # noqa: F401, F403
-from .checks.beman_standard.file import *  # noqa: F401, F403
-from .checks.beman_standard.general import *  # noqa: F401, F403
-from .checks.beman_standard.license import *  # noqa: F401, F403
-from .checks.beman_standard.readme import *  # noqa: F401, F403
-from .checks.beman_standard.release import *  # noqa: F401, F403
-from .checks.beman_standard.repository import *  # noqa: F401, F403
-from .checks.beman_standard.toplevel import *  # noqa: F401, F403
+# The check modules are not imported here: only the modules of the checks to run
+# are loaded (check load_beman_standard_checks()).
 
 red_color = "\033[91m"
 green_color = "\033[92m"
@@ -26,50 +28,206 @@ gray_color = "\033[90m"
 no_color = "\033[0m"
 
 
-def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
+def run_checks_pipeline(
+    checks_to_run, args, beman_standard_check_config, reporter=None
+):
     """
     Run the checks pipeline for The Beman Standard.
     Read-only checks if args.fix_inplace is False, otherwise try to fix the issues in-place.
     Verbosity is controlled by args.verbose.
+    Checks run on args.jobs worker threads (serially if args.jobs is 1 or args.fix_inplace is True).
+    The result of each check (and the summary) is reported to the optional reporter as soon as it completes.
 
     @return: The number of failed checks.
     """
+    summary = collect_checks_pipeline_summary(
+        checks_to_run, args, beman_standard_check_config, reporter
+    )
+    with profiler.span("summary", "summary", repository=args.repo_path):
+        failed_checks = print_checks_pipeline_summary(summary, args)
+    if reporter is not None:
+        reporter.report_summary(args.repo_path, summary, failed_checks)
+    return failed_checks
+
+
+def collect_checks_pipeline_summary(
+    checks_to_run, args, beman_standard_check_config, reporter=None
+):
+    """
+    Run the checks for The Beman Standard and collect the results, without printing the summary.
+    Check run_checks_pipeline() for the details.
+
+    @return: The summary of the run - a dictionary of counters per check type:
+             "passed", "failed", "skipped", "implemented", "not_affected" and "all".
+             In changed-files mode, "implemented" only counts the checks run (affected by the changed paths),
+             the other implemented checks are "not_affected".
+    """
 
     """
     Helper function to log messages.
     """
 
-    def log(msg):
+    def log(msg, log_stream=None):
         if args.verbose:
-            print(msg)
+            print(msg, file=log_stream)
+
+    # The repository snapshot is shared by all the checks of this run.
+    repo_snapshot = RepositorySnapshot(
+        args.repo_info,
+        include_untracked=args.include_untracked,
+        include_ignored=args.include_ignored,
+    )
+
+    # The result cache is optional (--cache) and never used with --fix-inplace.
+    result_cache = (
+        ResultCache(
+            args.cache_dir
+            if args.cache_dir is not None
+            else Path(args.repo_info["top_level"]) / RESULT_CACHE_DIR_NAME
+        )
+        if args.cache and not args.fix_inplace
+        else None
+    )
 
     """
-    Helper function to run a check.
-    @param check_class: The check class type to run.
+    Helper function to create a check instance.
+    @param check_class: The check class type to create.
     @param log_enabled: Whether to log the check result.
-    @return: True if the check passed, False otherwise.
+    @return: The check instance.
     """
 
-    def run_check(check_class, log_enabled=args.verbose):
-        check_instance = check_class(args.repo_info, beman_standard_check_config)
+    def create_check(check_class, log_enabled=args.verbose):
+        check_instance = check_class(repo_snapshot, beman_standard_check_config)
         check_instance.log_enabled = log_enabled
-        check_type = check_instance.type
+        return check_instance
 
-        log(f"Running check [{check_instance.type}][{check_instance.name}] ... ")
+    """
+    Helper function to compute the repo_info fields needed by the given checks.
+    The git queries run concurrently (a plain repo_info dictionary is already computed).
+    @param check_instances: The check instances to run.
+    """
 
-        if (check_instance.pre_check() and check_instance.check()) or (
-            args.fix_inplace and check_instance.fix()
+    def prefetch_repo_info(check_instances):
+        if not hasattr(args.repo_info, "prefetch"):
+            return
+        fields = ["top_level", "name"]
+        for check_instance in check_instances:
+            fields += check_instance.repo_info_inputs()
+        with profiler.span(
+            "repo_info.prefetch", "repo_info", repository=args.repo_path
         ):
+            args.repo_info.prefetch(fields)
+
+    """
+    Helper function to run a check.
+    @param check_instance: The check instance to run.
+    @param log_stream: Where to write the check logs (default: stdout).
+    @return: True if the check passed, False otherwise.
+    """
+
+    def run_check(check_instance, log_stream=None):
+        with profiler.span(check_instance.name, "check", repository=args.repo_path):
+            return run_check_helper(check_instance, log_stream)
+
+    def run_check_helper(check_instance, log_stream):
+        check_instance.log_stream = log_stream
+        check_type = check_instance.type
+        start_time = time.perf_counter()
+
+        log(
+            f"Running check [{check_instance.type}][{check_instance.name}] ... ",
+            log_stream,
+        )
+
+        # Reuse the cached result (and replay its diagnostics) if the check inputs are unchanged.
+        cache_key = (
+            result_cache.get_key(check_instance) if result_cache is not None else None
+        )
+        cached_result = (
+            result_cache.get(check_instance, cache_key)
+            if result_cache is not None
+            else None
+        )
+        if cached_result is not None:
+            for message in cached_result["diagnostics"]:
+                check_instance.log(message)
+            check_instance.properties.update(cached_result.get("properties", {}))
+            passed = cached_result["passed"]
+        else:
+            passed = bool(check_instance.pre_check() and check_instance.check())
+            if result_cache is not None:
+                result_cache.put(check_instance, cache_key, passed)
+
+        passed = bool(passed or (args.fix_inplace and check_instance.fix()))
+
+        if reporter is not None and not check_instance.name.startswith("INTERNAL."):
+            path = getattr(check_instance, "path", None)
+            reporter.report_check(
+                {
+                    "repository": args.repo_path,
+                    "name": check_instance.name,
+                    "type": check_type,
+                    "verdict": "passed" if passed else "failed",
+                    "duration": time.perf_counter() - start_time,
+                    "cached": cached_result is not None,
+                    "diagnostics": list(check_instance.diagnostics),
+                    "properties": dict(check_instance.properties),
+                    "path": str(path) if path is not None else None,
+                }
+            )
+
+        # e.g., " (license: apache-v2)"
+        properties = "".join(
+            f" ({key}: {value})" for key, value in check_instance.properties.items()
+        )
+        if passed:
             log(
-                f"\tcheck [{check_instance.type}][{check_instance.name}] ... {green_color}PASSED{no_color}\n"
+                f"\tcheck [{check_instance.type}][{check_instance.name}] ... {green_color}PASSED{no_color}{properties}\n",
+                log_stream,
             )
             return check_type, True
         else:
             log(
-                f"\tcheck [{check_instance.type}][{check_instance.name}] ... {red_color}FAILED{no_color}\n"
+                f"\tcheck [{check_instance.type}][{check_instance.name}] ... {red_color}FAILED{no_color}{properties}\n",
+                log_stream,
             )
             return check_type, False
 
+    """
+    Helper function to run a list of independent checks.
+    Serial mode streams the logs directly to stdout.
+    Parallel mode buffers the logs of each check and prints them in the given order,
+    so the output is the same as for a serial run.
+    @param check_classes: The check class types to run.
+    @return: The list of (check_type, passed) results, in the same order as check_classes.
+    """
+
+    def run_checks(check_classes):
+        check_instances = [create_check(check_class) for check_class in check_classes]
+        prefetch_repo_info(check_instances)
+
+        # --fix-inplace checks are modifying the repository, so never run them concurrently.
+        jobs = 1 if args.fix_inplace else args.jobs
+        if jobs <= 1 or len(check_instances) <= 1:
+            return [run_check(check_instance) for check_instance in check_instances]
+
+        def run_check_buffered(check_instance):
+            log_stream = io.StringIO()
+            result = run_check(check_instance, log_stream=log_stream)
+            return result, log_stream.getvalue()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(run_check_buffered, check_instance)
+                for check_instance in check_instances
+            ]
+            for future in futures:
+                result, output = future.result()
+                print(output, end="")
+                results.append(result)
+        return results
+
     """
     Main pipeline.
     """
@@ -77,11 +235,31 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
     def run_pipeline_helper():
         # Internal checks
         if args.fix_inplace:
-            run_check(DisallowFixInplaceAndUnstagedChangesCheck, log_enabled=True)
+            run_check(
+                create_check(
+                    DisallowFixInplaceAndUnstagedChangesCheck, log_enabled=True
+                )
+            )
 
-        implemented_checks = get_registered_beman_standard_checks()
+        # Import only the check modules needed for this run.
+        implemented_checks = load_beman_standard_checks(checks_to_run)
+        implemented_check_names = get_beman_standard_check_manifest()
         all_checks = beman_standard_check_config
 
+        # Changed-files mode: only run the checks affected by the changed paths.
+        selected_checks = checks_to_run
+        changed_files_mode = args.changed_since is not None or args.staged
+        if changed_files_mode:
+            changed_paths = get_changed_paths(
+                args.repo_info["top_level"], args.changed_since, args.staged
+            )
+            selected_checks = get_beman_standard_checks_affected_by_paths(
+                checks_to_run, changed_paths
+            )
+            log(
+                f"Changed-files mode: {len(changed_paths)} changed paths, running {len(selected_checks)} affected checks.\n"
+            )
+
         cnt_passed = {
             "REQUIREMENT": 0,
             "RECOMMENDATION": 0,
@@ -90,11 +268,12 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
             "REQUIREMENT": 0,
             "RECOMMENDATION": 0,
         }
-        for check_name in checks_to_run:
-            if check_name not in implemented_checks:
-                continue
-
-            check_type, passed = run_check(implemented_checks[check_name])
+        check_classes = [
+            implemented_checks[check_name]
+            for check_name in selected_checks
+            if check_name in implemented_checks
+        ]
+        for check_type, passed in run_checks(check_classes):
             if passed:
                 cnt_passed[check_type] += 1
             else:
@@ -112,12 +291,20 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
             "REQUIREMENT": 0,
             "RECOMMENDATION": 0,
         }
+        cnt_not_affected = {
+            "REQUIREMENT": 0,
+            "RECOMMENDATION": 0,
+        }
+        selected_check_names = set(selected_checks)
         for check_name in all_checks:
             check_type = all_checks[check_name]["type"]
             cnt_all_beman_standard_checks[check_type] += 1
 
-            if check_name not in implemented_checks:
+            if check_name not in implemented_check_names:
                 cnt_skipped[check_type] += 1
+            elif changed_files_mode and check_name not in selected_check_names:
+                # Not run: the coverage only counts the checks of the changed paths.
+                cnt_not_affected[check_type] += 1
             else:
                 cnt_implemented_checks[check_type] += 1
 
@@ -126,6 +313,7 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
             cnt_failed,
             cnt_skipped,
             cnt_implemented_checks,
+            cnt_not_affected,
             cnt_all_beman_standard_checks,
         )
 
@@ -135,10 +323,36 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
         cnt_failed,
         cnt_skipped,
         cnt_implemented_checks,
+        cnt_not_affected,
         cnt_all_beman_standard_checks,
     ) = run_pipeline_helper()
     log("\nbeman-tidy pipeline finished.\n")
 
+    if result_cache is not None:
+        result_cache.save()
+
+    return {
+        "passed": cnt_passed,
+        "failed": cnt_failed,
+        "skipped": cnt_skipped,
+        "implemented": cnt_implemented_checks,
+        "not_affected": cnt_not_affected,
+        "all": cnt_all_beman_standard_checks,
+    }
+
+
+def print_checks_pipeline_summary(summary, args):
+    """
+    Print the summary and the coverage of a checks pipeline run.
+    RECOMMENDATIONs are included only if args.require_all is set.
+
+    @return: The number of failed checks.
+    """
+    cnt_passed = summary["passed"]
+    cnt_failed = summary["failed"]
+    cnt_skipped = summary["skipped"]
+    cnt_implemented_checks = summary["implemented"]
+
     # Always print the summary.
     print(
         f"Summary    REQUIREMENT: {green_color} {cnt_passed['REQUIREMENT']} checks PASSED{no_color}, {red_color}{cnt_failed['REQUIREMENT']} checks FAILED{no_color}, {gray_color}{cnt_skipped['REQUIREMENT']} skipped (NOT implemented).{no_color}"
@@ -147,18 +361,25 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
         f"Summary RECOMMENDATION: {green_color} {cnt_passed['RECOMMENDATION']} checks PASSED{no_color}, {red_color}{cnt_failed['RECOMMENDATION']} checks FAILED{no_color}, {gray_color}{cnt_skipped['RECOMMENDATION']} skipped (NOT implemented).{no_color}"
     )
 
+    # Changed-files mode: the checks not affected by the changed paths are not run.
+    cnt_not_affected = summary.get("not_affected", {})
+    if sum(cnt_not_affected.values()) > 0:
+        print(
+            f"{gray_color}Summary   NOT AFFECTED: {cnt_not_affected['REQUIREMENT']} REQUIREMENTs, {cnt_not_affected['RECOMMENDATION']} RECOMMENDATIONs NOT run (not affected by the changed files).{no_color}"
+        )
+
     # Always print the coverage.
-    coverage_requirement = round(
-        cnt_passed["REQUIREMENT"] / cnt_implemented_checks["REQUIREMENT"] * 100, 2
+    coverage_requirement = __calculate_coverage(
+        cnt_passed["REQUIREMENT"], cnt_implemented_checks["REQUIREMENT"]
     )
-    coverage_recommendation = round(
-        cnt_passed["RECOMMENDATION"] / cnt_implemented_checks["RECOMMENDATION"] * 100, 2
+    coverage_recommendation = __calculate_coverage(
+        cnt_passed["RECOMMENDATION"], cnt_implemented_checks["RECOMMENDATION"]
     )
     total_passed = cnt_passed["REQUIREMENT"] + cnt_passed["RECOMMENDATION"]
     total_implemented = (
         cnt_implemented_checks["REQUIREMENT"] + cnt_implemented_checks["RECOMMENDATION"]
     )
-    total_coverage = round((total_passed) / (total_implemented) * 100, 2)
+    total_coverage = __calculate_coverage(total_passed, total_implemented)
     print(
         f"\n{__calculate_coverage_color(coverage_requirement)}Coverage    REQUIREMENT: {coverage_requirement:{6}.2f}% ({cnt_passed['REQUIREMENT']}/{cnt_implemented_checks['REQUIREMENT']} checks passed).{no_color}"
     )
@@ -179,6 +400,14 @@ def run_checks_pipeline(checks_to_run, args, beman_standard_check_config):
     return total_cnt_failed
 
 
+def __calculate_coverage(cnt_passed, cnt_implemented):
+    """
+    Returns the coverage percentage, rounded to 2 decimals (0 if no check is implemented - e.g., in changed-files
+    mode, no check of this type is affected)
+    """
+    return round(cnt_passed / cnt_implemented * 100, 2) if cnt_implemented else 0
+
+
 def __calculate_coverage_color(cov):
     """
     Returns the colour for the coverage print based on severity
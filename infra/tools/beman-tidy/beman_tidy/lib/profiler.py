@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+
+# Bump when the layout of the profile JSON file changes.
+PROFILE_VERSION = 2
+
+# The spans open in the current context (innermost last) - the I/O is accounted to all of them.
+_current_spans = contextvars.ContextVar("beman_tidy_current_spans", default=())
+
+# The enabled profilers. Audit hooks cannot be removed: a single hook is installed per process, on the first
+# enable(), and it is a no-op while no profiler is enabled (check _audit_hook()).
+_enabled_profilers = set()
+_audit_hook_installed = False
+_audit_lock = threading.Lock()
+
+
+class Profiler:
+    """
+    Collects per-span metrics of a beman-tidy run (--profile): wall time, CPU time, files opened
+    (count and size) and subprocesses spawned.
+
+    A span is a named region - e.g., a check, the repository information or the config load
+    (the spans of a run can also be exported as a timeline, check write_trace()):
+        with profiler.span("README.TITLE", "check", repository="/path/to/exemplar"):
+            ...
+
+    Spans are no-ops until enable() is called (and again after disable()). Files and subprocesses are accounted
+    with an audit hook (check sys.addaudithook()), so all the I/O of the span is visible, including the I/O of
+    libraries.
+    Notes:
+    - bytes_opened is the size of the files opened for reading, not the bytes actually read: a bounded read
+      (e.g., the first 4 KiB of a file) or a memory-mapped file counts its whole size.
+    - cpu_time is the CPU time of the thread running the span (not of subprocesses).
+    - The metrics of nested spans are included in their parent spans.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """
+        Start collecting the spans (the audit hook is installed once per process).
+        """
+        global _audit_hook_installed
+        with _audit_lock:
+            self.enabled = True
+            _enabled_profilers.add(self)
+            if not _audit_hook_installed:
+                sys.addaudithook(_audit_hook)
+                _audit_hook_installed = True
+
+    def disable(self):
+        """
+        Stop collecting the spans. The audit hook stays installed, but is a no-op if no profiler is enabled.
+        """
+        with _audit_lock:
+            self.enabled = False
+            _enabled_profilers.discard(self)
+
+    @contextlib.contextmanager
+    def span(self, name, category, **properties):
+        """
+        Measure a region of code. The record is added to self.records when the span ends.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        record = {
+            "name": name,
+            "category": category,
+            **properties,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "start_time": time.time(),
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "bytes_opened": 0,
+            "files_opened": 0,
+            "subprocesses": 0,
+        }
+        token = _current_spans.set(_current_spans.get() + (record,))
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.thread_time()
+        try:
+            yield record
+        finally:
+            record["wall_time"] = time.perf_counter() - start_wall_time
+            record["cpu_time"] = time.thread_time() - start_cpu_time
+            _current_spans.reset(token)
+            with self._lock:
+                self.records.append(record)
+
+    def add_records(self, records):
+        """
+        Add the records collected by another profiler - e.g., by a batch worker process.
+        """
+        with self._lock:
+            self.records.extend(records)
+
+    def pop_records(self):
+        """
+        Get and clear the collected records.
+        """
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+
+def _audit_hook(event, args):
+    """
+    The audit hook of the profilers: account the files opened and the subprocesses to the open spans.
+    """
+    if not _enabled_profilers:
+        return
+    if event != "open" and event != "subprocess.Popen":
+        return
+    spans = _current_spans.get()
+    if not spans:
+        return
+
+    if event == "subprocess.Popen":
+        with _audit_lock:
+            for span in spans:
+                span["subprocesses"] += 1
+        return
+
+    # open(path, mode, flags) - mode is None for os.open().
+    path, mode, flags = args
+    if path is None or isinstance(path, int):
+        return
+    reading = (
+        flags & (os.O_WRONLY | os.O_RDWR) == 0
+        if mode is None
+        else "r" in mode and "+" not in mode
+    )
+    size = 0
+    if reading:
+        try:
+            size = os.stat(path).st_size
+        except (OSError, ValueError):
+            pass
+    with _audit_lock:
+        for span in spans:
+            span["files_opened"] += 1
+            span["bytes_opened"] += size
+
+
+# The profiler of the current process, shared by all the modules.
+profiler = Profiler()
+
+
+def print_profile_table(records):
+    """
+    Print the profile records, sorted by wall time (slowest first).
+    The check method spans (e.g., "README.TITLE:check") are only exported by write_trace():
+    they are already included in the check spans.
+    """
+    records = [record for record in records if record["category"] != "method"]
+    # The repository column is only useful for batch runs.
+    show_repository = (
+        len(
+            {
+                record["repository"]
+                for record in records
+                if record.get("repository") is not None
+            }
+        )
+        > 1
+    )
+    name_width = max([len("Span")] + [len(record["name"]) for record in records])
+    repository_width = max(
+        [len("Repository")]
+        + [len(record.get("repository") or "-") for record in records]
+    )
+
+    header = f"{'Span':<{name_width}}  {'Category':<10}  {'Wall (ms)':>10}  {'CPU (ms)':>10}  {'Opened (KiB)':>12}  {'Files':>6}  {'Procs':>6}"
+    if show_repository:
+        header = f"{'Repository':<{repository_width}}  {header}"
+    print("Profile:")
+    print(header)
+    print("-" * len(header))
+    for record in sorted(records, key=lambda record: record["wall_time"], reverse=True):
+        row = (
+            f"{record['name']:<{name_width}}  {record['category']:<10}  "
+            f"{record['wall_time'] * 1000:>10.2f}  {record['cpu_time'] * 1000:>10.2f}  "
+            f"{record['bytes_opened'] / 1024:>12.1f}  {record['files_opened']:>6}  {record['subprocesses']:>6}"
+        )
+        if show_repository:
+            row = f"{record.get('repository') or '-':<{repository_width}}  {row}"
+        print(row)
+    print("-" * len(header))
+
+
+def write_profile(records, path):
+    """
+    Write the profile records to a JSON file - e.g., to compare them across releases.
+    """
+    with open(path, "w") as file:
+        json.dump({"version": PROFILE_VERSION, "records": records}, file, indent=2)
+        file.write("\n")
+
+
+def write_trace(records, path):
+    """
+    Write the profile records as Chrome trace events (--trace) - a timeline of the run,
+    e.g., to see which checks overlapped or where the batch workers sat idle.
+    Open the file with https://ui.perfetto.dev or chrome://tracing.
+
+    Each record is a complete ("X") event on the lane of its process and thread.
+    The metrics of the record (e.g., cpu_time, bytes_opened) are the event args.
+    """
+    main_pid = os.getpid()
+    trace_events = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "beman-tidy" if pid == main_pid else "beman-tidy worker"},
+        }
+        for pid in sorted({record["pid"] for record in records} | {main_pid})
+    ]
+    for record in sorted(records, key=lambda record: record["start_time"]):
+        trace_events.append(
+            {
+                "name": record["name"],
+                "cat": record["category"],
+                "ph": "X",
+                # Timestamps and durations are in microseconds.
+                "ts": round(record["start_time"] * 1e6, 3),
+                "dur": round(record["wall_time"] * 1e6, 3),
+                "pid": record["pid"],
+                "tid": record["tid"],
+                "args": {
+                    key: value
+                    for key, value in record.items()
+                    if key
+                    not in ["name", "category", "pid", "tid", "start_time", "wall_time"]
+                },
+            }
+        )
+
+    with open(path, "w") as file:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+        file.write("\n")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import json
+import threading
+from pathlib import Path
+
+# The output formats (--format).
+REPORT_FORMATS = ["text", "ndjson", "sarif"]
+
+# The Beman Standard document, used for the SARIF rule links - e.g., <url>#readmetitle.
+BEMAN_STANDARD_URL = (
+    "https://github.com/bemanproject/beman/blob/main/docs/BEMAN_STANDARD.md"
+)
+
+
+def create_reporter(report_format, stream, beman_standard_check_config):
+    """
+    Create the reporter for the given output format (check REPORT_FORMATS), writing to stream.
+    """
+    if report_format == "ndjson":
+        return NdjsonReporter(stream)
+    if report_format == "sarif":
+        return SarifReporter(stream, beman_standard_check_config)
+    return Reporter(stream)
+
+
+class Reporter:
+    """
+    Base reporter: receives the check results as soon as they complete.
+    The default (text) reporter writes nothing - the pipeline prints the human-readable output.
+
+    A check result is a dictionary - e.g.,
+    {"repository": "/path/to/exemplar", "name": "README.TITLE", "type": "RECOMMENDATION",
+     "verdict": "failed", "duration": 0.0012, "cached": False, "diagnostics": ["..."], "properties": {},
+     "path": "/path/to/exemplar/README.md"}
+    The properties are check specific - e.g., {"license": "apache-v2"} for LICENSE.APPROVED.
+
+    Reporters are thread-safe: checks running in parallel report concurrently.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def report_check(self, result):
+        """
+        Report the result of a check.
+        """
+        pass
+
+    def report_summary(self, repository, summary, failed_checks):
+        """
+        Report the summary of a repository (check collect_checks_pipeline_summary()).
+        """
+        pass
+
+    def report_error(self, repository, message):
+        """
+        Report a repository which could not be checked (e.g., not a valid Git repository).
+        """
+        pass
+
+    def close(self):
+        """
+        Finish the report.
+        """
+        pass
+
+    def write(self, text):
+        with self._lock:
+            self.stream.write(text)
+            self.stream.flush()
+
+
+class BufferedReporter(Reporter):
+    """
+    Reporter keeping the reports of a single repository in memory - e.g., in a batch worker process,
+    to be replayed by the parent process reporter (check replay_reports()).
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.reports = []
+
+    def report_check(self, result):
+        with self._lock:
+            self.reports.append(("report_check", (result,)))
+
+    def report_summary(self, repository, summary, failed_checks):
+        with self._lock:
+            self.reports.append(
+                ("report_summary", (repository, summary, failed_checks))
+            )
+
+    def report_error(self, repository, message):
+        with self._lock:
+            self.reports.append(("report_error", (repository, message)))
+
+
+def replay_reports(reports, reporter):
+    """
+    Forward the reports buffered by a BufferedReporter (its picklable reports list) to the given reporter.
+    """
+    for method, arguments in reports:
+        getattr(reporter, method)(*arguments)
+
+
+class NdjsonReporter(Reporter):
+    """
+    Newline-delimited JSON: one JSON object per line, written as soon as it is reported.
+    The "event" key is "check", "summary" or "error".
+    """
+
+    def report_check(self, result):
+        self.write(json.dumps({"event": "check", **result}) + "\n")
+
+    def report_summary(self, repository, summary, failed_checks):
+        self.write(
+            json.dumps(
+                {
+                    "event": "summary",
+                    "repository": repository,
+                    **summary,
+                    "failed_checks": failed_checks,
+                }
+            )
+            + "\n"
+        )
+
+    def report_error(self, repository, message):
+        self.write(
+            json.dumps({"event": "error", "repository": repository, "message": message})
+            + "\n"
+        )
+
+
+class SarifReporter(Reporter):
+    """
+    SARIF 2.1.0 log with a single run. The results are streamed inside the "results" array,
+    so the complete log is never held in memory. close() must be called to finish the JSON document.
+    """
+
+    def __init__(self, stream, beman_standard_check_config):
+        super().__init__(stream)
+        self._cnt_results = 0
+
+        rules = [
+            {
+                "id": check_name,
+                "shortDescription": {"text": check_name},
+                "helpUri": f"{BEMAN_STANDARD_URL}#{check_name.lower().replace('.', '')}",
+                "properties": {"type": check_config["type"]},
+            }
+            for check_name, check_config in beman_standard_check_config.items()
+        ]
+        tool = {
+            "driver": {
+                "name": "beman-tidy",
+                "informationUri": "https://github.com/bemanproject/infra/tree/main/tools/beman-tidy",
+                "rules": rules,
+            }
+        }
+        # Open the log, the run and its results array: {"$schema": ..., "runs": [{"tool": ..., "results": [
+        log_header = json.dumps(
+            {
+                "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+                "version": "2.1.0",
+            }
+        )[:-1]
+        run_header = json.dumps({"tool": tool})[:-1]
+        self.write(f'{log_header}, "runs": [{run_header}, "results": [\n')
+
+        # Repositories which could not be checked, reported as tool execution notifications.
+        self._errors = []
+
+    def report_check(self, result):
+        sarif_result = {
+            "ruleId": result["name"],
+            "kind": "pass" if result["verdict"] == "passed" else "fail",
+            "level": (
+                "none"
+                if result["verdict"] == "passed"
+                else "error"
+                if result["type"] == "REQUIREMENT"
+                else "warning"
+            ),
+            "message": {
+                "text": "\n".join(result["diagnostics"])
+                or f"check [{result['type']}][{result['name']}] {result['verdict']}"
+            },
+            "properties": {
+                "repository": result["repository"],
+                "type": result["type"],
+                "duration": result["duration"],
+                "cached": result["cached"],
+                **result.get("properties", {}),
+            },
+        }
+        if result.get("path") is not None:
+            sarif_result["locations"] = [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {
+                            "uri": Path(result["path"]).absolute().as_uri()
+                        }
+                    }
+                }
+            ]
+
+        with self._lock:
+            separator = ",\n" if self._cnt_results > 0 else ""
+            self._cnt_results += 1
+            self.stream.write(separator + json.dumps(sarif_result))
+            self.stream.flush()
+
+    def report_error(self, repository, message):
+        with self._lock:
+            self._errors.append(
+                {
+                    "level": "error",
+                    "message": {"text": f"{repository}: {message}"},
+                }
+            )
+
+    def close(self):
+        invocation = {
+            "executionSuccessful": len(self._errors) == 0,
+            "toolExecutionNotifications": self._errors,
+        }
+        # Close the results array, the run and the log.
+        self.write(f'\n], "invocations": [{json.dumps(invocation)}]}}]}}\n')
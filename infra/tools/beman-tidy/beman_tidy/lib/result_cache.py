@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Bump when the cache layout or the key derivation changes.
+RESULT_CACHE_VERSION = 1
+
+# Default cache directory name, created at the top level of the checked repository.
+RESULT_CACHE_DIR_NAME = ".beman-tidy-cache"
+
+
+class ResultCache:
+    """
+    Persistent incremental cache of check results, stored in a .beman-tidy-cache/ directory.
+
+    A check result (verdict and diagnostics) is keyed by a content hash of the check inputs
+    (check_instance.inputs(): files, directories and repo_info fields), the check config entry
+    and a fingerprint of the check implementation. Unchanged checks reuse the stored result.
+
+    Stat metadata (size, mtime, inode) of the inputs is stored too, so untouched inputs are
+    not hashed again.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_path = self.cache_dir / "results.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # Latest result per check: check name -> {"key": ..., "passed": ..., "diagnostics": [...]}
+        self._results = {}
+        # Input digests: "<kind>:<absolute path>" -> [size, mtime_ns, inode, digest]
+        self._stats = {}
+        # Implementation fingerprints: module file -> digest
+        self._fingerprints = {}
+
+        try:
+            with open(self.cache_path, "r") as file:
+                data = json.load(file)
+            if data.get("version") == RESULT_CACHE_VERSION:
+                self._results = data["results"]
+                self._stats = data["stats"]
+        except Exception:
+            # Missing or corrupted cache: start from scratch.
+            pass
+
+    def get(self, check_instance, key):
+        """
+        Get the cached result for the given check instance and its cache key (check get_key()).
+        @return: The cached {"passed": ..., "diagnostics": [...], "properties": {...}} or None (cache miss / not cacheable).
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            result = self._results.get(check_instance.name)
+        if result is None or result["key"] != key:
+            return None
+        return result
+
+    def put(self, check_instance, key, passed):
+        """
+        Store the result of the given check instance and its cache key (no-op for not cacheable checks).
+        """
+        if key is None:
+            return
+
+        with self._lock:
+            self._results[check_instance.name] = {
+                "key": key,
+                "passed": passed,
+                "diagnostics": list(check_instance.diagnostics),
+                "properties": dict(check_instance.properties),
+            }
+            self._dirty = True
+
+    def save(self):
+        """
+        Write the cache to disk (atomically). Errors are ignored - the cache is an optimization.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": RESULT_CACHE_VERSION,
+                "results": self._results,
+                "stats": self._stats,
+            }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            gitignore_path = self.cache_dir / ".gitignore"
+            if not gitignore_path.exists():
+                gitignore_path.write_text("# Automatically created by beman-tidy.\n*\n")
+
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self.cache_path)
+        except Exception:
+            pass
+
+    def get_key(self, check_instance):
+        """
+        Compute the cache key of a check instance: a hash of everything its result depends on.
+        @return: The key or None if the check does not declare its inputs.
+        """
+        inputs = check_instance.inputs()
+        if inputs is None:
+            return None
+
+        key_data = {
+            "check": check_instance.name,
+            "config": check_instance.config,
+            "implementation": self.get_implementation_fingerprint(check_instance),
+            "repo_name": check_instance.repo_name,
+            "files": {
+                self.__relative_path(check_instance, path): self.get_file_digest(path)
+                for path in inputs.get("files", [])
+            },
+            "directories": {
+                self.__relative_path(check_instance, path): self.get_directory_digest(
+                    path
+                )
+                for path in inputs.get("directories", [])
+            },
+            "repo_info": {
+                field: str(check_instance.repo_info[field])
+                for field in inputs.get("repo_info", [])
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=repr).encode()
+        ).hexdigest()
+
+    def get_implementation_fingerprint(self, check_instance):
+        """
+        Hash the source code of the modules implementing the check (the check class and its bases).
+        """
+        digests = []
+        for check_class in type(check_instance).__mro__:
+            if not check_class.__module__.startswith("beman_tidy"):
+                continue
+            module_path = sys.modules[check_class.__module__].__file__
+            with self._lock:
+                digest = self._fingerprints.get(module_path)
+            if digest is None:
+                digest = hashlib.sha256(Path(module_path).read_bytes()).hexdigest()
+                with self._lock:
+                    self._fingerprints[module_path] = digest
+            digests.append(digest)
+        return hashlib.sha256("".join(digests).encode()).hexdigest()
+
+    def get_file_digest(self, path):
+        """
+        Get the content hash of a file input. The stored digest is reused if the stat metadata is unchanged.
+        """
+        return self.__get_digest(
+            path,
+            "file",
+            lambda: hashlib.sha256(Path(path).read_bytes()).hexdigest(),
+        )
+
+    def get_directory_digest(self, path):
+        """
+        Get the hash of a directory input: its direct entries (names and types).
+        The stored digest is reused if the stat metadata is unchanged (adding/removing entries changes mtime).
+        """
+
+        def hash_directory():
+            entries = sorted(
+                f"{entry.name}/" if entry.is_dir() else entry.name
+                for entry in os.scandir(path)
+            )
+            return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+        return self.__get_digest(path, "directory", hash_directory)
+
+    def __get_digest(self, path, kind, compute_digest):
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return "missing"
+
+        stat_key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        with self._lock:
+            entry = self._stats.get(f"{kind}:{path}")
+        if entry is not None and entry[:3] == stat_key:
+            return entry[3]
+
+        try:
+            digest = compute_digest()
+        except OSError:
+            return "unreadable"
+
+        # Do not trust the stat metadata of files modified right now: a later change in
+        # the same timestamp tick would not be detected ("racily clean" entries).
+        if time.time_ns() - stat.st_mtime_ns > 2 * 10**9:
+            with self._lock:
+                self._stats[f"{kind}:{path}"] = stat_key + [digest]
+                self._dirty = True
+        return digest
+
+    @staticmethod
+    def __relative_path(check_instance, path):
+        try:
+            return (
+                Path(path)
+                .absolute()
+                .relative_to(check_instance.repo_path.absolute())
+                .as_posix()
+            )
+        except ValueError:
+            return Path(path).absolute().as_posix()
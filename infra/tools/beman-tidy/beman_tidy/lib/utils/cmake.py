@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import os
+import re
+
+from .concurrency import map_batches
+
+# CMake language tokens (check https://cmake.org/cmake/help/latest/manual/cmake-language.7.html).
+_space_regex = re.compile(r"[ \t\r\n]+")
+_bracket_open_regex = re.compile(r"\[(=*)\[")
+_line_comment_regex = re.compile(r"#[^\n]*")
+_identifier_regex = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_open_paren_regex = re.compile(r"[ \t]*\(")
+_quoted_argument_regex = re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL)
+# Unquoted arguments may contain quoted parts (legacy) - e.g., -DFOO="bar baz".
+_unquoted_argument_regex = re.compile(
+    r'(?:[^\s()#"\\]|\\.)(?:[^\s()#"\\]|\\.|"(?:[^"\\]|\\.)*")*', re.DOTALL
+)
+_escape_sequence_regex = re.compile(r"\\(.)", re.DOTALL)
+_escape_sequences = {"t": "\t", "r": "\r", "n": "\n", ";": "\\;", "\n": ""}
+
+# Variable references - e.g., "${CMAKE_CURRENT_SOURCE_DIR}".
+_variable_reference_regex = re.compile(r"\$\{([A-Za-z0-9_.+-]+)\}")
+
+
+class CMakeParseError(Exception):
+    """
+    Error raised when a CMake listfile cannot be parsed - e.g., an unterminated command invocation.
+    """
+
+    def __init__(self, message, line):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+class CMakeCommand:
+    """
+    A command invocation of a CMake listfile - e.g., add_library(beman.exemplar STATIC).
+    - name: the command name, lowercase (CMake command names are case-insensitive) - e.g., "add_library"
+    - arguments: the argument values, without quotes or brackets - e.g., ["beman.exemplar", "STATIC"].
+      Escape sequences are decoded, variable references (e.g., "${PROJECT_NAME}") are kept as is.
+      Nested parentheses are separate arguments - e.g., if((A) OR B) -> ["(", "A", ")", "OR", "B"].
+    - line, end_line: the line numbers of the command name and of the closing parenthesis (1-based).
+    """
+
+    __slots__ = ("name", "arguments", "line", "end_line")
+
+    def __init__(self, name, arguments, line, end_line):
+        self.name = name
+        self.arguments = arguments
+        self.line = line
+        self.end_line = end_line
+
+    def __eq__(self, other):
+        return isinstance(other, CMakeCommand) and (
+            self.name,
+            self.arguments,
+            self.line,
+            self.end_line,
+        ) == (other.name, other.arguments, other.line, other.end_line)
+
+    def __repr__(self):
+        return f"CMakeCommand({self.name!r}, {self.arguments!r}, line={self.line})"
+
+
+class CMakeListfile:
+    """
+    A parsed CMake listfile: the list of its command invocations, in order (check parse_cmake_listfile()).
+    Commands are indexed by name, so queries do not scan the listfile - e.g.,
+        listfile.find_commands("add_library") -> all the add_library() calls
+        listfile.get_option_names() -> ["BEMAN_EXEMPLAR_BUILD_TESTS", ...]
+    """
+
+    def __init__(self, commands):
+        self.commands = commands
+
+        # command name -> command invocations, in order.
+        self._commands_by_name = {}
+        for command in commands:
+            self._commands_by_name.setdefault(command.name, []).append(command)
+
+    def find_commands(self, *names):
+        """
+        @return: The invocations of the given commands (case-insensitive), in order - e.g., find_commands("project").
+        """
+        if len(names) == 1:
+            return list(self._commands_by_name.get(names[0].lower(), []))
+        names = {name.lower() for name in names}
+        return [command for command in self.commands if command.name in names]
+
+    def find_command(self, name):
+        """
+        @return: The first invocation of the given command, or None.
+        """
+        commands = self._commands_by_name.get(name.lower())
+        return commands[0] if commands else None
+
+    def get_option_names(self):
+        """
+        @return: The names of the options declared with option(), in order.
+        """
+        return [
+            command.arguments[0]
+            for command in self.find_commands("option")
+            if len(command.arguments) > 0
+        ]
+
+    def get_condition_variables(self):
+        """
+        @return: The set of the arguments used in the conditions of if() and elseif() - e.g., {"BEMAN_EXEMPLAR_BUILD_TESTS"}.
+        """
+        return {
+            argument
+            for command in self.find_commands("if", "elseif")
+            for argument in command.arguments
+        }
+
+
+def parse_cmake_listfile(text):
+    """
+    Parse the content of a CMake listfile (e.g., CMakeLists.txt, *.cmake) into its command invocations:
+    a single linear scan, following the CMake language grammar (comments, bracket, quoted and unquoted arguments).
+    Variables, generator expressions and control flow are not evaluated.
+
+    @return: The CMakeListfile.
+    @raise CMakeParseError: If the listfile is not valid CMake code.
+    """
+    commands = []
+    position = 0
+    line = 1
+    length = len(text)
+
+    def skip(end):
+        nonlocal position, line
+        line += text.count("\n", position, end)
+        position = end
+
+    def skip_bracket(match, what):
+        """
+        Skip a bracket argument or comment: [[...]], [=[...]=], ...
+        @return: The bracket content.
+        """
+        closing = f"]{match.group(1)}]"
+        end = text.find(closing, match.end())
+        if end < 0:
+            raise CMakeParseError(f"Unterminated bracket {what}", line)
+        content = text[match.end() : end]
+        skip(end + len(closing))
+        # A newline right after the opening bracket is not part of the content.
+        if content.startswith("\r\n"):
+            return content[2:]
+        return content[1:] if content.startswith("\n") else content
+
+    def skip_comment():
+        """
+        Skip a line or bracket comment starting at position (a "#").
+        """
+        match = _bracket_open_regex.match(text, position + 1)
+        if match is not None:
+            skip_bracket(match, "comment")
+        else:
+            skip(_line_comment_regex.match(text, position).end())
+
+    while True:
+        match = _space_regex.match(text, position)
+        if match is not None:
+            skip(match.end())
+        if position >= length:
+            break
+
+        if text[position] == "#":
+            skip_comment()
+            continue
+
+        match = _identifier_regex.match(text, position)
+        if match is None:
+            raise CMakeParseError(
+                f"Expected a command name, found {text[position]!r}", line
+            )
+        name, command_line = match.group(0).lower(), line
+        skip(match.end())
+        match = _open_paren_regex.match(text, position)
+        if match is None:
+            raise CMakeParseError(f"Expected '(' after {name}", line)
+        skip(match.end())
+
+        # The arguments, up to the matching closing parenthesis.
+        arguments = []
+        depth = 0
+        while True:
+            match = _space_regex.match(text, position)
+            if match is not None:
+                skip(match.end())
+            if position >= length:
+                raise CMakeParseError(
+                    f"Unterminated command invocation {name}()", command_line
+                )
+
+            char = text[position]
+            if char == ")":
+                skip(position + 1)
+                if depth == 0:
+                    break
+                depth -= 1
+                arguments.append(")")
+            elif char == "(":
+                skip(position + 1)
+                depth += 1
+                arguments.append("(")
+            elif char == "#":
+                skip_comment()
+            elif char == "[" and (match := _bracket_open_regex.match(text, position)):
+                arguments.append(skip_bracket(match, "argument"))
+            elif char == '"':
+                match = _quoted_argument_regex.match(text, position)
+                if match is None:
+                    raise CMakeParseError("Unterminated quoted argument", line)
+                arguments.append(decode_cmake_escape_sequences(match.group(1)))
+                skip(match.end())
+            else:
+                match = _unquoted_argument_regex.match(text, position)
+                if match is None:
+                    raise CMakeParseError(f"Unexpected character {char!r}", line)
+                arguments.append(decode_cmake_escape_sequences(match.group(0)))
+                skip(match.end())
+
+        commands.append(CMakeCommand(name, arguments, command_line, line))
+
+    return CMakeListfile(commands)
+
+
+def decode_cmake_escape_sequences(value):
+    """
+    Decode the escape sequences of an argument - e.g., "\\t" -> tab, "\\(" -> "(".
+    "\\;" is kept (it prevents the list splitting), an escaped newline is a line continuation.
+    """
+    if "\\" not in value:
+        return value
+    return _escape_sequence_regex.sub(
+        lambda match: _escape_sequences.get(match.group(1), match.group(1)), value
+    )
+
+
+class CMakeInclusion:
+    """
+    An add_subdirectory() or include() of a listfile of the include graph (check CMakeIncludeGraph).
+    - command: the command invocation - e.g., add_subdirectory(src/beman/exemplar)
+    - path: the absolute path of the included listfile - e.g., "/path/to/exemplar/src/beman/exemplar/CMakeLists.txt",
+      or None if it cannot be resolved (e.g., a variable reference) or it is a CMake module (e.g., include(CTest)).
+    """
+
+    __slots__ = ("command", "path")
+
+    def __init__(self, command, path):
+        self.command = command
+        self.path = path
+
+    def is_optional(self):
+        """
+        Check if the included listfile may be missing - e.g., include(local.cmake OPTIONAL).
+        """
+        return (
+            self.command.name == "include" and "OPTIONAL" in self.command.arguments[1:]
+        )
+
+    def __repr__(self):
+        return f"CMakeInclusion({self.command.name!r}, {self.path!r})"
+
+
+class CMakeIncludeGraph:
+    """
+    The listfiles of a CMake project, from its top-level CMakeLists.txt, joined by add_subdirectory() and include()
+    (check build_cmake_include_graph()).
+    - root: the absolute path of the top-level listfile
+    - listfiles: absolute path -> CMakeListfile, for all the parsed listfiles of the project
+    - inclusions: absolute path -> the CMakeInclusion of the listfile, in order
+    - errors: absolute path -> CMakeParseError, for the listfiles that cannot be parsed
+    - missing: the (absolute path, CMakeInclusion) pairs of the included listfiles that do not exist
+    Conditions are not evaluated: all the branches of an if() are followed.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.listfiles = {}
+        self.inclusions = {}
+        self.errors = {}
+        self.missing = []
+
+    def iter_listfiles(self):
+        """
+        Iterate over the (absolute path, CMakeListfile) pairs in configure order: each listfile is followed
+        by the listfiles it includes, depth-first. Each listfile is visited once.
+        """
+        visited = set()
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            if path in visited or path not in self.listfiles:
+                continue
+            visited.add(path)
+            yield path, self.listfiles[path]
+            stack.extend(
+                inclusion.path
+                for inclusion in reversed(self.inclusions.get(path, []))
+                if inclusion.path is not None
+            )
+
+    def get_paths(self):
+        """
+        @return: The absolute paths of all the listfiles of the graph: parsed, not parsed (errors) and missing.
+        """
+        return [
+            *self.listfiles,
+            *self.errors,
+            *(inclusion.path for _, inclusion in self.missing),
+        ]
+
+    def find_commands(self, *names):
+        """
+        @return: The (absolute path, CMakeCommand) pairs of the invocations of the given commands in all the
+                 listfiles of the project, in configure order - e.g., find_commands("add_library").
+        """
+        return [
+            (path, command)
+            for path, listfile in self.iter_listfiles()
+            for command in listfile.find_commands(*names)
+        ]
+
+
+def build_cmake_include_graph(snapshot, path):
+    """
+    Build the include graph of a CMake project from its top-level listfile (e.g., CMakeLists.txt).
+
+    The graph is built level by level (breadth-first): the listfiles of a level are read, parsed and resolved
+    in batches, on a thread pool (check map_batches()). Listfiles are read and parsed through the repository
+    snapshot (check RepositorySnapshot.parse()), so each distinct content is parsed once per run.
+
+    Included paths are resolved like CMake does, without evaluating the listfiles:
+    - add_subdirectory(<dir>): <dir>/CMakeLists.txt, relative to the current source directory;
+    - include(<file>): relative to the current source directory, and include(<module>): <module>.cmake in the
+      CMAKE_MODULE_PATH directories (set() and list(APPEND|PREPEND) of the listfile and its parents);
+      other modules are CMake modules (e.g., include(CTest)) and are not followed;
+    - the variables CMAKE_SOURCE_DIR, PROJECT_SOURCE_DIR, CMAKE_CURRENT_SOURCE_DIR and CMAKE_CURRENT_LIST_DIR
+      are expanded; paths with other variable references are not followed.
+
+    @return: The CMakeIncludeGraph (an empty graph if the top-level listfile does not exist).
+    """
+    root = os.path.abspath(path)
+    graph = CMakeIncludeGraph(root)
+    source_dir = os.path.dirname(root)
+    variables = {"CMAKE_SOURCE_DIR": source_dir, "PROJECT_SOURCE_DIR": source_dir}
+
+    def load_listfile(item):
+        """
+        Load a listfile: a (listfile path, current source directory, CMAKE_MODULE_PATH) tuple.
+        @return: The (listfile, error, resolved inclusions) tuple - (None, None, None) if the listfile is missing.
+        """
+        listfile_path, current_source_dir, module_path = item
+        if not snapshot.index.is_file(listfile_path):
+            return None, None, None
+        try:
+            listfile = snapshot.parse(listfile_path, parse_cmake_listfile)
+        except CMakeParseError as e:
+            return None, e, None
+        inclusions = list(
+            _resolve_inclusions(
+                listfile,
+                {
+                    **variables,
+                    "CMAKE_CURRENT_SOURCE_DIR": current_source_dir,
+                    "CMAKE_CURRENT_LIST_DIR": os.path.dirname(listfile_path),
+                },
+                module_path,
+                snapshot.index,
+            )
+        )
+        return listfile, None, inclusions
+
+    # The listfiles of the current level - (listfile path, current source directory, CMAKE_MODULE_PATH) -
+    # and how each one is included - (including listfile path, CMakeInclusion), None for the top-level listfile.
+    level = [(root, source_dir, [])]
+    level_inclusions = [None]
+    seen = {root}
+    while level:
+        results = map_batches(load_listfile, level)
+        next_level, next_level_inclusions = [], []
+        for (listfile_path, _, _), included_by, (
+            listfile,
+            error,
+            inclusions,
+        ) in zip(level, level_inclusions, results):
+            if error is not None:
+                graph.errors[listfile_path] = error
+                continue
+            if listfile is None:
+                if included_by is not None and not included_by[1].is_optional():
+                    graph.missing.append(included_by)
+                continue
+
+            graph.listfiles[listfile_path] = listfile
+            graph.inclusions[listfile_path] = []
+            for (
+                inclusion,
+                inclusion_source_dir,
+                inclusion_module_path,
+            ) in inclusions:
+                graph.inclusions[listfile_path].append(inclusion)
+                if inclusion.path is not None and inclusion.path not in seen:
+                    seen.add(inclusion.path)
+                    next_level.append(
+                        (
+                            inclusion.path,
+                            inclusion_source_dir,
+                            inclusion_module_path,
+                        )
+                    )
+                    next_level_inclusions.append((listfile_path, inclusion))
+        level, level_inclusions = next_level, next_level_inclusions
+
+    return graph
+
+
+def _resolve_inclusions(listfile, variables, module_path, index):
+    """
+    Resolve the add_subdirectory() and include() of a listfile, in order (check build_cmake_include_graph()).
+    @return: The (CMakeInclusion, source directory, CMAKE_MODULE_PATH) tuples: the source directory and
+             the module path of the included listfile.
+    """
+    current_source_dir = variables["CMAKE_CURRENT_SOURCE_DIR"]
+    module_path = list(module_path)
+    for command in listfile.find_commands("add_subdirectory", "include", "set", "list"):
+        arguments = command.arguments
+        if len(arguments) == 0:
+            continue
+
+        if command.name == "set" and arguments[0] == "CMAKE_MODULE_PATH":
+            module_path = _expand_paths(arguments[1:], variables, current_source_dir)
+        elif (
+            command.name == "list"
+            and len(arguments) > 2
+            and arguments[0] in ("APPEND", "PREPEND")
+            and arguments[1] == "CMAKE_MODULE_PATH"
+        ):
+            paths = _expand_paths(arguments[2:], variables, current_source_dir)
+            module_path = (
+                module_path + paths if arguments[0] == "APPEND" else paths + module_path
+            )
+        elif command.name == "add_subdirectory":
+            directory = _expand_path(arguments[0], variables, current_source_dir)
+            if directory is None:
+                yield CMakeInclusion(command, None), None, None
+            else:
+                path = os.path.join(directory, "CMakeLists.txt")
+                yield CMakeInclusion(command, path), directory, module_path
+        elif command.name == "include":
+            name = arguments[0]
+            if "/" in name or name.endswith(".cmake") or "${" in name:
+                path = _expand_path(name, variables, current_source_dir)
+            else:
+                # A module: the first <name>.cmake of CMAKE_MODULE_PATH, or a CMake module.
+                path = next(
+                    (
+                        os.path.join(directory, f"{name}.cmake")
+                        for directory in module_path
+                        if index.is_file(os.path.join(directory, f"{name}.cmake"))
+                    ),
+                    None,
+                )
+            # Included listfiles run in the scope of the including listfile.
+            yield CMakeInclusion(command, path), current_source_dir, module_path
+
+
+def _expand_path(value, variables, current_source_dir):
+    """
+    Expand the known variable references of a path, relative to the current source directory.
+    @return: The normalized absolute path, or None if the path has other variable references
+             or generator expressions.
+    """
+    value = _variable_reference_regex.sub(
+        lambda match: variables.get(match.group(1), match.group(0)), value
+    )
+    if "${" in value or "$<" in value or "$ENV{" in value:
+        return None
+    return os.path.normpath(os.path.join(current_source_dir, value))
+
+
+def _expand_paths(values, variables, current_source_dir):
+    """
+    Expand a list of paths (e.g., the values of CMAKE_MODULE_PATH), skipping the paths that cannot be expanded.
+    """
+    paths = []
+    for value in values:
+        for item in value.split(";"):
+            path = _expand_path(item, variables, current_source_dir) if item else None
+            if path is not None:
+                paths.append(path)
+    return paths
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import contextvars
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+# The items are mapped in batches, on a thread pool (check map_batches()).
+MAP_BATCH_SIZE = 64
+
+
+def map_batches(function, items, batch_size=MAP_BATCH_SIZE):
+    """
+    Apply the function to each item (e.g., read and parse a file), in batches of batch_size items, on a thread pool.
+
+    The worker threads run in a copy of the caller's context, so they are part of the caller's check
+    (e.g., the files opened are accounted to its --profile span).
+
+    @return: The list of the results, in the order of the items.
+    """
+
+    def map_batch(batch):
+        return [function(item) for item in batch]
+
+    with ThreadPoolExecutor() as executor:
+        context = contextvars.copy_context()
+        return list(
+            itertools.chain.from_iterable(
+                executor.map(
+                    lambda batch: context.copy().run(map_batch, batch),
+                    itertools.batched(items, batch_size),
+                )
+            )
+        )
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import itertools
+import mmap
+import re
+
+from .concurrency import map_batches
+
+# The extensions of the C++ headers and source files.
+CPP_HEADER_EXTENSIONS = [".h", ".hh", ".hpp", ".hxx", ".h++", ".inl", ".ipp", ".tpp"]
+CPP_SOURCE_EXTENSIONS = [".c", ".cc", ".cpp", ".cxx", ".c++", ".cppm", ".ixx"]
+CPP_EXTENSIONS = CPP_HEADER_EXTENSIONS + CPP_SOURCE_EXTENSIONS
+
+# The C++ tokens of the namespace scanner (check scan_cpp_namespaces()), in priority order. Only the namespace
+# declarations and the "{", "}" and ";" tokens are named groups: comments, literals and directives are skipped.
+# Everything else (identifiers, numbers, operators) is skipped by the regex engine: the leading lookahead
+# rejects most positions with a single character test. Digit separators (e.g., 1'000) are not character
+# literals: they are preceded by a digit. Outside of comments and literals, "#" only starts directives.
+_cpp_token_regex = re.compile(
+    r"""
+    (?=[/#"'{};nRuUL])
+    (?:
+      //(?:[^\n\\]|\\.)*
+    | /\*.*?(?:\*/|\Z)
+    | \#(?:[^\n\\/]|\\.|/(?![/*]))*
+    | (?<!\w)(?:u8|u|U|L)?R"([^()\\\s"]{0,16})\(.*?(?:\)\1"|\Z)
+    | "(?:[^"\\\n]|\\.)*"
+    | (?:(?<!\w)(?:u8|u|U|L)|(?<![\w.]))'(?:[^'\\\n]|\\.)*'
+    | (?<!\w)using\s+namespace(?!\w)
+    | (?<!\w)namespace(?!\w)
+      \s*(?:\[\[[^\]]*\]\]\s*)?
+      (?P<namespace_name>(?:inline\s+)?[A-Za-z_]\w*(?:\s*::\s*(?:inline\s+)?[A-Za-z_]\w*)*)?
+      \s*(?:\[\[[^\]]*\]\]\s*)?
+      (?P<namespace>\{)
+    | (?P<brace>[{}])
+    | (?P<semicolon>;)
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_cpp_inline_regex = re.compile(r"^inline\s+")
+
+# The name of an anonymous namespace, in qualified names - e.g., "beman::exemplar::(anonymous)".
+CPP_ANONYMOUS_NAMESPACE = "(anonymous)"
+
+
+class CppNamespace:
+    """
+    A namespace declaration of a C++ file (check scan_cpp_namespaces()).
+    - name: the qualified name, with the enclosing namespaces - e.g., "beman::exemplar" for
+      "namespace beman::exemplar {" or for "namespace exemplar {" inside "namespace beman {"
+    - line: the line number of the namespace keyword (1-based)
+    - nested: True if the declaration is inside another namespace
+    """
+
+    __slots__ = ("name", "line", "nested")
+
+    def __init__(self, name, line, nested):
+        self.name = name
+        self.line = line
+        self.nested = nested
+
+    def __eq__(self, other):
+        return isinstance(other, CppNamespace) and (
+            self.name,
+            self.line,
+            self.nested,
+        ) == (other.name, other.line, other.nested)
+
+    def __repr__(self):
+        return f"CppNamespace({self.name!r}, line={self.line})"
+
+
+class CppNamespaceScan:
+    """
+    The result of scan_cpp_namespaces() for a C++ file.
+    - namespaces: the namespace declarations, in order (check CppNamespace)
+    - has_declarations: True if the file has code outside the comments and preprocessor directives
+      - any "{", "}" or ";" (e.g., False for a header with only macros)
+    """
+
+    __slots__ = ("namespaces", "has_declarations")
+
+    def __init__(self, namespaces, has_declarations):
+        self.namespaces = namespaces
+        self.has_declarations = has_declarations
+
+    def __repr__(self):
+        return f"CppNamespaceScan({self.namespaces!r}, has_declarations={self.has_declarations})"
+
+
+def scan_cpp_namespaces(text):
+    """
+    Scan the namespace declarations of a C++ file: a lightweight lexer (not a parser), a single regex scan.
+    Comments, string and character literals (including raw strings and prefixes), numbers (including digit
+    separators) and preprocessor directives are skipped, so "namespace" in them is never matched.
+    - "namespace a::b {", nested namespaces and inline namespaces are declarations;
+    - "using namespace a;" and namespace aliases ("namespace fs = std::filesystem;") are not.
+    Macros are not expanded - e.g., a namespace opened by a macro is not found.
+
+    @return: The CppNamespaceScan.
+    """
+    namespaces = []
+    has_declarations = False
+
+    # The open braces: the names of the namespaces opened by each one ([] for other braces).
+    scopes = []
+    # The enclosing namespaces.
+    enclosing = []
+
+    # Line numbers are counted incrementally, only for the namespace declarations.
+    line, line_position = 1, 0
+
+    for match in _cpp_token_regex.finditer(text):
+        kind = match.lastgroup
+        if kind is None:
+            continue  # comment, literal or directive
+        has_declarations = True
+
+        if kind == "brace":
+            if match.group() == "{":
+                scopes.append([])
+            elif scopes:
+                del enclosing[len(enclosing) - len(scopes.pop()) :]
+        elif kind == "namespace":
+            names = [
+                _cpp_inline_regex.sub("", name.strip()) or CPP_ANONYMOUS_NAMESPACE
+                for name in (match.group("namespace_name") or "").split("::")
+            ]
+            line += text.count("\n", line_position, match.start())
+            line_position = match.start()
+            namespaces.append(
+                CppNamespace("::".join(enclosing + names), line, len(enclosing) > 0)
+            )
+            scopes.append(names)
+            enclosing.extend(names)
+
+    return CppNamespaceScan(namespaces, has_declarations)
+
+
+# A preprocessor directive: "#" and the directive name, with the arguments and their line continuations.
+# The regex runs on the raw bytes of the file (check scan_cpp_directives()). It starts with the "#" literal,
+# so the regex engine skips to the next "#" with a fast search: the line start is checked for each match.
+_cpp_directive_regex = re.compile(
+    rb"#[ \t]*(?P<name>[A-Za-z_]\w*)(?P<arguments>(?:[^\n\\]|\\\r?\n|\\.)*)",
+    re.DOTALL,
+)
+_cpp_line_continuation_regex = re.compile(r"\\\r?\n")
+_cpp_directive_comment_regex = re.compile(r"//.*|/\*.*?(?:\*/|$)")
+_cpp_macro_definition_regex = re.compile(
+    r"([A-Za-z_]\w*)(\([^)]*\))?\s*(.*)", re.DOTALL
+)
+# The macros guarded by a condition: "#ifndef X" and "#if !defined(X)".
+_cpp_negated_defined_regex = re.compile(r"!\s*defined\s*(?:\(\s*(\w+)\s*\)|(\w+))")
+# The parts of a condition that are not macro names: header names, attribute names, literals.
+_cpp_condition_ignored_regex = re.compile(
+    r"__has_\w+\s*\([^)]*\)|\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'"
+)
+_cpp_condition_identifier_regex = re.compile(r"(?<![\w.])[A-Za-z_]\w*")
+
+# The identifiers of a condition that are not macro names - e.g., "#if defined(X) and not Y".
+CPP_CONDITION_KEYWORDS = frozenset(
+    [
+        "defined",
+        "true",
+        "false",
+        "and",
+        "and_eq",
+        "bitand",
+        "bitor",
+        "compl",
+        "not",
+        "not_eq",
+        "or",
+        "or_eq",
+        "xor",
+        "xor_eq",
+    ]
+)
+
+# The conditional directives, and the macros they test (check CppMacroCondition).
+CPP_CONDITIONAL_DIRECTIVES = frozenset(
+    ["if", "ifdef", "ifndef", "elif", "elifdef", "elifndef"]
+)
+
+
+class CppDirective:
+    """
+    A preprocessor directive of a C++ file (check scan_cpp_directives()).
+    - name: the directive name - e.g., "define", "ifndef"
+    - line: the line number of the directive (1-based)
+    - arguments: the text after the name, without comments and line continuations, with single spaces
+      - e.g., "BEMAN_EXEMPLAR_IDENTITY_HPP"
+    """
+
+    __slots__ = ("name", "line", "arguments")
+
+    def __init__(self, name, line, arguments):
+        self.name = name
+        self.line = line
+        self.arguments = arguments
+
+    def __eq__(self, other):
+        return isinstance(other, CppDirective) and (
+            self.name,
+            self.line,
+            self.arguments,
+        ) == (other.name, other.line, other.arguments)
+
+    def __repr__(self):
+        return f"CppDirective({self.name!r}, line={self.line}, arguments={self.arguments!r})"
+
+
+def scan_cpp_directives(path):
+    """
+    Scan the preprocessor directives of a C++ file: only the lines starting with "#", in a single regex pass.
+    The file is memory mapped, so it is never read as a whole (e.g., big generated headers): only the directives
+    are decoded. Line continuations are joined, comments are removed from the arguments and blanks are collapsed.
+    Directives inside block comments or raw strings are not told apart from the others (not a full lexer).
+
+    @return: The directives of the file, in order ([] if the file is empty or cannot be read).
+    """
+    try:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                directives = []
+                line, line_position = 1, 0
+                for match in _cpp_directive_regex.finditer(content):
+                    # Only blanks before a directive - e.g., not "// #if" or "x = 1; #define".
+                    start = match.start()
+                    line_start = content.rfind(b"\n", 0, start) + 1
+                    if content[line_start:start].strip(b" \t"):
+                        continue
+
+                    # Only the bytes between two directives are counted (a bounded slice, not a copy of the file).
+                    line += content[line_position:start].count(b"\n")
+                    line_position = start
+                    arguments = match.group("arguments").decode(
+                        "utf-8", errors="replace"
+                    )
+                    arguments = _cpp_line_continuation_regex.sub(" ", arguments)
+                    arguments = _cpp_directive_comment_regex.sub(" ", arguments)
+                    directives.append(
+                        CppDirective(
+                            match.group("name").decode("ascii"),
+                            line,
+                            " ".join(arguments.split()),
+                        )
+                    )
+                return directives
+    except (OSError, ValueError):
+        return []  # e.g., an empty file cannot be memory mapped
+
+
+class CppMacroDefinition:
+    """
+    A macro definition of the library (check CppDirectiveIndex).
+    - name: the macro name - e.g., "BEMAN_EXEMPLAR_IDENTITY_HPP"
+    - path: the file, relative to the repository - e.g., "include/beman/exemplar/identity.hpp"
+    - line: the line number of the #define directive
+    - has_value: False for an empty definition - e.g., an include guard
+    - overridable: True for a default value, defined only if the macro is not defined yet (e.g., by the build)
+      - e.g., "#ifndef BEMAN_EXEMPLAR_USE_X" / "#define BEMAN_EXEMPLAR_USE_X 0"
+    - local: True if the macro is #undef'd later in the same file (e.g., a helper macro)
+    """
+
+    __slots__ = ("name", "path", "line", "has_value", "overridable", "local")
+
+    def __init__(self, name, path, line, has_value, overridable):
+        self.name = name
+        self.path = path
+        self.line = line
+        self.has_value = has_value
+        self.overridable = overridable
+        self.local = False
+
+    def __repr__(self):
+        return f"CppMacroDefinition({self.name!r}, {self.path}:{self.line})"
+
+
+class CppMacroCondition:
+    """
+    A macro tested by a conditional directive of the library (check CppDirectiveIndex).
+    - name: the macro name - e.g., "BEMAN_EXEMPLAR_USE_X"
+    - path: the file, relative to the repository
+    - line: the line number of the conditional directive
+    - directive: the directive name - e.g., "if", "ifdef"
+    """
+
+    __slots__ = ("name", "path", "line", "directive")
+
+    def __init__(self, name, path, line, directive):
+        self.name = name
+        self.path = path
+        self.line = line
+        self.directive = directive
+
+    def __repr__(self):
+        return f"CppMacroCondition({self.name!r}, {self.path}:{self.line})"
+
+
+class CppDirectiveIndex:
+    """
+    The preprocessor directive index of the C++ files of the library (check build_cpp_directive_index()):
+    which macros are defined and which macros are tested by conditional directives, across all the files.
+    - paths: the scanned files, relative to the repository, sorted
+    - definitions: macro name -> CppMacroDefinition list, in (path, line) order
+    - conditions: macro name -> CppMacroCondition list, in (path, line) order
+      The guards of the definitions (e.g., include guards) are not conditions: "#ifndef X" / "#define X".
+    """
+
+    def __init__(self):
+        self.paths = []
+        self.definitions = {}
+        self.conditions = {}
+
+    def is_defined(self, name):
+        """
+        Check if the library defines the given macro, with a definition that cannot be overridden
+        (check CppMacroDefinition.overridable).
+        """
+        return any(
+            not definition.overridable for definition in self.definitions.get(name, [])
+        )
+
+    def iter_definitions(self):
+        """
+        Iterate over all the macro definitions, in (path, line) order.
+        """
+        return iter(
+            sorted(
+                itertools.chain.from_iterable(self.definitions.values()),
+                key=lambda definition: (definition.path, definition.line),
+            )
+        )
+
+    def iter_conditions(self):
+        """
+        Iterate over all the macro conditions, in (path, line) order.
+        """
+        return iter(
+            sorted(
+                itertools.chain.from_iterable(self.conditions.values()),
+                key=lambda condition: (condition.path, condition.line),
+            )
+        )
+
+
+def get_cpp_condition_macros(directive):
+    """
+    Get the macros tested by a conditional directive - e.g., ["X", "Y"] for "#if defined(X) && Y > 1".
+    Header and attribute names (e.g., "__has_include(<version>)") and literals are not macros.
+
+    @return: The macro names, in order ([] for other directives).
+    """
+    if directive.name not in CPP_CONDITIONAL_DIRECTIVES:
+        return []
+    if directive.name in ("ifdef", "ifndef", "elifdef", "elifndef"):
+        return directive.arguments.split()[:1]
+    expression = _cpp_condition_ignored_regex.sub(" ", directive.arguments)
+    return [
+        name
+        for name in _cpp_condition_identifier_regex.findall(expression)
+        if name not in CPP_CONDITION_KEYWORDS
+    ]
+
+
+def _get_guarded_macro(directive):
+    """
+    @return: The macro guarded by a conditional directive ("#ifndef X", "#if !defined(X)"), or None.
+    """
+    if directive.name == "ifndef":
+        return directive.arguments.split()[0] if directive.arguments else None
+    if directive.name == "if":
+        match = _cpp_negated_defined_regex.fullmatch(directive.arguments)
+        if match is not None:
+            return match.group(1) or match.group(2)
+    return None
+
+
+def _index_cpp_directives(path, directives):
+    """
+    Index the directives of a file (check CppDirectiveIndex).
+    @return: The CppMacroDefinition and CppMacroCondition lists of the file.
+    """
+    definitions, conditions = [], []
+    # The open conditional blocks: [guarded macro or None, the conditions of the directive].
+    blocks = []
+    for directive in directives:
+        if directive.name in ("if", "ifdef", "ifndef"):
+            block_conditions = [
+                CppMacroCondition(name, path, directive.line, directive.name)
+                for name in get_cpp_condition_macros(directive)
+            ]
+            blocks.append([_get_guarded_macro(directive), block_conditions])
+            conditions.extend(block_conditions)
+        elif directive.name in CPP_CONDITIONAL_DIRECTIVES:  # elif, elifdef, elifndef
+            conditions.extend(
+                CppMacroCondition(name, path, directive.line, directive.name)
+                for name in get_cpp_condition_macros(directive)
+            )
+            if blocks:
+                blocks[-1][0] = None
+        elif directive.name == "else":
+            if blocks:
+                blocks[-1][0] = None
+        elif directive.name == "endif":
+            if blocks:
+                blocks.pop()
+        elif directive.name == "define":
+            match = _cpp_macro_definition_regex.match(directive.arguments)
+            if match is None:
+                continue
+            name, has_value = match.group(1), bool(match.group(3))
+            guarded = bool(blocks) and blocks[-1][0] == name
+            if guarded:
+                # The guard is not a condition of the library - e.g., an include guard.
+                for condition in blocks[-1][1]:
+                    if condition.name == name:
+                        conditions.remove(condition)
+                blocks[-1][1] = []
+            definitions.append(
+                CppMacroDefinition(
+                    name, path, directive.line, has_value, guarded and has_value
+                )
+            )
+        elif directive.name == "undef":
+            name = directive.arguments.split()[0] if directive.arguments else None
+            for definition in definitions:
+                if definition.name == name:
+                    definition.local = True
+    return definitions, conditions
+
+
+def build_cpp_directive_index(snapshot, directories):
+    """
+    Build the preprocessor directive index of the C++ files (check CPP_EXTENSIONS) under the given directories,
+    relative to the repository - e.g., ["include/beman/exemplar", "src/beman/exemplar"].
+
+    A single pass over the files: each file is memory mapped and only its directives are scanned
+    (check scan_cpp_directives()), in batches, on a thread pool (check map_batches()).
+
+    @return: The CppDirectiveIndex.
+    """
+
+    def index_file(entry):
+        return (
+            entry.relative_path,
+            *_index_cpp_directives(
+                entry.relative_path, scan_cpp_directives(entry.path)
+            ),
+        )
+
+    files = itertools.chain.from_iterable(
+        snapshot.index.iter_files(directory, CPP_EXTENSIONS)
+        for directory in directories
+    )
+    index = CppDirectiveIndex()
+    for path, definitions, conditions in sorted(
+        map_batches(index_file, files), key=lambda result: result[0]
+    ):
+        index.paths.append(path)
+        for definition in definitions:
+            index.definitions.setdefault(definition.name, []).append(definition)
+        for condition in conditions:
+            index.conditions.setdefault(condition.name, []).append(condition)
+    return index
@@ -1,62 +1,203 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import contextvars
 import sys
-import yaml
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from git import Repo, InvalidGitRepositoryError
+from .git_dir import GitDirectory, NotAGitRepositoryError, run_git
 
+# The backends used to read the repository information (--git-backend).
+GIT_BACKENDS = ["native", "gitpython"]
 
-def get_repo_info(path: str):
+
+class RepositoryInfo(Mapping):
     """
-    Get information about the repository at the given path.
-    Returns data as a dictionary.
+    Lazy information about a Git repository, with the same keys as the former repo_info dictionary:
+    "top_level", "name", "remote_url", "current_branch", "default_branch", "commit_hash",
+    "status" and "unstaged_changes".
+
+    Each field is computed on first access and cached - e.g., `git status` is never run if no
+    check needs repo_info["status"]. Use prefetch() to compute several fields concurrently.
+
+    Subclasses (the Git backends) implement one get_<field>() method per field.
     """
 
-    path: Path = Path(path)
-    try:
+    fields = [
+        "top_level",
+        "name",
+        "remote_url",
+        "current_branch",
+        "default_branch",
+        "commit_hash",
+        "status",
+        "unstaged_changes",
+    ]
+
+    def __init__(self, path: Path):
+        self.path = path
+
+        self._values = {}
+        self._field_locks = {field: threading.Lock() for field in self.fields}
+
+    def __getitem__(self, field):
+        if field not in self._field_locks:
+            raise KeyError(field)
+        if field in self._values:
+            return self._values[field]
+
+        with self._field_locks[field]:
+            if field not in self._values:
+                try:
+                    self._values[field] = getattr(self, f"get_{field}")()
+                except Exception:
+                    print(
+                        f"An error occurred while getting repository information ({field}). Check {self.path}."
+                    )
+                    sys.exit(1)
+            return self._values[field]
+
+    def __contains__(self, field):
+        # Do not compute the field just to check the key.
+        return field in self._field_locks
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def prefetch(self, fields):
+        """
+        Compute the given fields, running the independent git queries concurrently.
+        """
+        missing_fields = [
+            field
+            for field in dict.fromkeys(fields)
+            if field in self._field_locks and field not in self._values
+        ]
+        if len(missing_fields) <= 1:
+            for field in missing_fields:
+                self[field]
+            return
+
+        # Each query runs in a copy of the caller context (e.g., the profiler spans).
+        with ThreadPoolExecutor(max_workers=len(missing_fields)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.__getitem__, field)
+                for field in missing_fields
+            ]
+            for future in futures:
+                future.result()
+
+    def get_name(self):
+        # Get the repository name (directory name of the top level)
+        return self["top_level"].name
+
+
+class NativeRepositoryInfo(RepositoryInfo):
+    """
+    Repository information read straight from the .git directory (check GitDirectory).
+    Only the working tree state (status, unstaged changes) runs the `git` binary.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.git_directory = GitDirectory.discover(path)
+
+    def get_top_level(self):
+        return self.git_directory.top_level
+
+    def get_remote_url(self):
+        # Get the remote URL (assuming 'origin' is the remote name)
+        return self.git_directory.get_config_value("remote", "origin", "url")
+
+    def get_current_branch(self):
+        head = self.git_directory.read_ref("HEAD")
+        if head is None or not head.startswith("ref: refs/heads/"):
+            raise ValueError("HEAD is detached.")
+        return head[len("ref: refs/heads/") :]
+
+    def get_default_branch(self):
+        return self.git_directory.read_symbolic_ref("refs/remotes/origin/HEAD").split(
+            "/"
+        )[-1]
+
+    def get_commit_hash(self):
+        return self.git_directory.resolve_ref("HEAD")
+
+    def get_status(self):
+        return self.git_directory.run_git("status")
+
+    def get_unstaged_changes(self):
+        return self.git_directory.run_git("diff", "--stat")
+
+
+class GitPythonRepositoryInfo(RepositoryInfo):
+    """
+    Repository information read with GitPython (imported on demand, as it is slow to import).
+    """
+
+    def __init__(self, path: Path):
+        from git import Repo, InvalidGitRepositoryError, NoSuchPathError
+
+        super().__init__(path)
+
         # Initialize the repository object
-        repo = Repo(path.absolute(), search_parent_directories=True)
+        try:
+            self.repo = Repo(path.absolute(), search_parent_directories=True)
+        except (InvalidGitRepositoryError, NoSuchPathError) as e:
+            raise NotAGitRepositoryError(str(e)) from e
 
-        # Get the top-level directory of the repository
-        top_level_dir = Path(repo.git.rev_parse("--show-toplevel"))
+        # GitPython objects reading .git files (config, refs) are not thread-safe,
+        # while `git` commands run in separate processes.
+        self._repo_lock = threading.Lock()
 
-        # Get the repository name (directory name of the top level)
-        repo_name = top_level_dir.name
+    def get_top_level(self):
+        # Get the top-level directory of the repository
+        return Path(self.repo.git.rev_parse("--show-toplevel"))
 
+    def get_remote_url(self):
         # Get the remote URL (assuming 'origin' is the remote name)
-        remote_url = None
-        if "origin" in repo.remotes:
-            remote_url = repo.remotes.origin.url
-
-        # Get the current branch
-        current_branch = repo.active_branch.name
-
-        # Get the default branch
-        split_head = repo.git.symbolic_ref("refs/remotes/origin/HEAD").split("/")
-        default_branch = split_head[-1]
-
-        # Get the commit hash
-        commit_hash = repo.head.commit.hexsha
-
-        # Get the status of the repository
-        status = repo.git.status()
-
-        # Get unstaged changes
-        unstaged_changes = repo.git.diff("--stat")
-
-        return {
-            "top_level": top_level_dir,
-            "name": repo_name,
-            "remote_url": remote_url,
-            "current_branch": current_branch,
-            "default_branch": default_branch,
-            "commit_hash": commit_hash,
-            "status": status,
-            "unstaged_changes": unstaged_changes,
-        }
-    except InvalidGitRepositoryError:
+        with self._repo_lock:
+            if "origin" in self.repo.remotes:
+                return self.repo.remotes.origin.url
+            return None
+
+    def get_current_branch(self):
+        with self._repo_lock:
+            return self.repo.active_branch.name
+
+    def get_default_branch(self):
+        return self.repo.git.symbolic_ref("refs/remotes/origin/HEAD").split("/")[-1]
+
+    def get_commit_hash(self):
+        with self._repo_lock:
+            return self.repo.head.commit.hexsha
+
+    def get_status(self):
+        return self.repo.git.status()
+
+    def get_unstaged_changes(self):
+        return self.repo.git.diff("--stat")
+
+
+def get_repo_info(path: str, backend: str = "native"):
+    """
+    Get information about the repository at the given path.
+    Returns a lazy RepositoryInfo, which behaves like a (read-only) dictionary.
+    The backend is one of GIT_BACKENDS - e.g., "native" (default) reads the .git directory directly.
+    """
+
+    path: Path = Path(path)
+    try:
+        if backend == "gitpython":
+            return GitPythonRepositoryInfo(path)
+        return NativeRepositoryInfo(path)
+    except NotAGitRepositoryError:
         print(f"The path '{path}' is not inside a valid Git repository.")
         sys.exit(1)
     except Exception:
@@ -64,63 +205,36 @@ def get_repo_info(path: str):
         sys.exit(1)
 
 
-def get_beman_standard_config_path():
+def get_changed_paths(path: str, since: str = None, staged: bool = False):
     """
-    Get the path to the Beman Standard YAML configuration file.
+    Get the paths changed in the repository at the given path, relative to its top level.
+    - staged: the changes staged in the index (e.g., for pre-commit).
+    - since: the changes between the given revision and the working tree, including untracked
+      (but not ignored) files (e.g., for PR CI: origin/main).
+    Renames are reported as a deleted and an added path.
     """
-    return Path(__file__).parent.parent.parent / ".beman-standard.yml"
-
+    try:
+        top_level = GitDirectory.discover(path).top_level
+        if staged:
+            diff = run_git(
+                top_level, "diff", "--cached", "--name-only", "--no-renames", "-z"
+            )
+            untracked = ""
+        else:
+            diff = run_git(
+                top_level, "diff", "--name-only", "--no-renames", "-z", since, "--"
+            )
+            untracked = run_git(
+                top_level, "ls-files", "--others", "--exclude-standard", "-z"
+            )
+    except Exception as e:
+        print(f"An error occurred while getting the changed paths. Check {path}: {e}")
+        sys.exit(1)
 
-def load_beman_standard_config(path=get_beman_standard_config_path()):
-    """
-    Load the Beman Standard YAML configuration file from the given path.
-    """
-    with open(path, "r") as file:
-        beman_standard_yml = yaml.safe_load(file)
-
-    beman_standard_check_config = {}
-    for check_name in beman_standard_yml:
-        check_config = {
-            "name": check_name,
-            "full_text_body": "",
-            "type": "",
-            "regex": "",
-            "file_name": "",
-            "directory_name": "",
-            "badge_lines": "",
-            "status_lines": "",
-            "licenses": "",
-            "default_group": "",
-        }
-        for entry in beman_standard_yml[check_name]:
-            if "type" in entry:
-                check_config["type"] = entry["type"]
-            elif "value" in entry:  # e.g., "a string value"
-                check_config["value"] = entry["value"]
-            # e.g., ["a string value", "another string value"]
-            elif "values" in entry:
-                check_config["values"] = entry["values"]
-            elif "regex" in entry:
-                # TODO: Implement the regex check.
-                pass
-            elif "file_name" in entry:
-                check_config["file_name"] = entry["file_name"]
-            elif "directory_name" in entry:
-                pass
-            elif "values" in entry:
-                # TODO: Implement the values check.
-                pass
-            elif "status_lines" in entry:
-                # TODO: Implement the status check.
-                pass
-            elif "licenses" in entry:
-                # TODO: Implement the license check.
-                pass
-            elif "default_group" in entry:
-                check_config["default_group"] = entry["default_group"]
-            else:
-                raise ValueError(f"Invalid entry in Beman Standard YAML: {entry}")
-
-        beman_standard_check_config[check_name] = check_config
-
-    return beman_standard_check_config
+    return sorted(
+        set(
+            changed_path
+            for changed_path in (diff + untracked).split("\0")
+            if changed_path
+        )
+    )
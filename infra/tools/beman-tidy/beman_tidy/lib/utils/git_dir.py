@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+
+class GitError(Exception):
+    """
+    Error raised when the Git metadata cannot be read or a `git` command fails.
+    """
+
+
+class NotAGitRepositoryError(GitError):
+    """
+    Error raised when a path is not inside a Git working tree.
+    """
+
+
+class GitDirectory:
+    """
+    Read-only access to the metadata of a Git working tree, straight from its .git directory
+    (HEAD, loose refs, packed-refs and config) - no `git` process and no GitPython import.
+
+    Supports linked worktrees and submodules: a .git file ("gitdir: <path>") points to the
+    per-worktree git directory, whose "commondir" file points to the shared one (refs, config).
+    """
+
+    def __init__(self, top_level: Path, git_dir: Path):
+        # The top-level directory of the working tree - e.g., /path/to/exemplar
+        self.top_level = top_level
+        # The per-worktree git directory (HEAD) - e.g., /path/to/exemplar/.git
+        self.git_dir = git_dir
+        # The shared git directory (refs, packed-refs, config)
+        self.common_dir = git_dir
+        commondir_path = git_dir / "commondir"
+        if commondir_path.is_file():
+            self.common_dir = (git_dir / commondir_path.read_text().strip()).resolve()
+
+        self._packed_refs = None
+        self._config = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def discover(cls, path):
+        """
+        Find the working tree containing the given path (searching parent directories).
+        @return: The GitDirectory of the working tree.
+        """
+        path = Path(path).absolute()
+        if not path.exists():
+            raise NotAGitRepositoryError(f"No such path: {path}")
+        if not path.is_dir():
+            path = path.parent
+
+        for directory in [path, *path.parents]:
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # gitdir indirection - e.g., "gitdir: ../.git/worktrees/feature"
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    raise NotAGitRepositoryError(f"Invalid .git file: {dot_git}")
+                git_dir = (directory / content[len("gitdir:") :].strip()).resolve()
+            else:
+                continue
+
+            if not (git_dir / "HEAD").is_file():
+                raise NotAGitRepositoryError(f"Invalid git directory: {git_dir}")
+            return cls(directory.resolve(), git_dir)
+
+        raise NotAGitRepositoryError(f"Not inside a Git working tree: {path}")
+
+    def read_ref(self, name):
+        """
+        Read a loose ref - e.g., "HEAD" -> "ref: refs/heads/main" or a commit hash.
+        @return: The ref content or None if the ref has no loose file.
+        """
+        # HEAD (and other pseudo refs) are per-worktree, refs/ are shared.
+        base_dir = self.common_dir if name.startswith("refs/") else self.git_dir
+        try:
+            return (base_dir / name).read_text().strip()
+        except OSError:
+            return None
+
+    def resolve_ref(self, name):
+        """
+        Resolve a ref to a commit hash, following symbolic refs - e.g., "HEAD" -> "1a2b3c...".
+        """
+        for _ in range(10):
+            content = self.read_ref(name)
+            if content is None:
+                content = self.get_packed_refs().get(name)
+            if content is None:
+                raise GitError(f"Reference not found: {name}")
+            if not content.startswith("ref:"):
+                return content
+            name = content[len("ref:") :].strip()
+        raise GitError(f"Too many levels of symbolic references: {name}")
+
+    def read_symbolic_ref(self, name):
+        """
+        Read the target of a symbolic ref - e.g., "refs/remotes/origin/HEAD" -> "refs/remotes/origin/main".
+        """
+        content = self.read_ref(name)
+        if content is None or not content.startswith("ref:"):
+            raise GitError(f"Not a symbolic reference: {name}")
+        return content[len("ref:") :].strip()
+
+    def get_packed_refs(self):
+        """
+        Get the refs from the packed-refs file (cached): ref name -> commit hash.
+        """
+        with self._lock:
+            if self._packed_refs is None:
+                self._packed_refs = {}
+                try:
+                    lines = (self.common_dir / "packed-refs").read_text().splitlines()
+                except OSError:
+                    lines = []
+                for line in lines:
+                    # Skip the header ("# pack-refs with: ...") and peeled tags ("^<hash>").
+                    if not line or line.startswith(("#", "^")):
+                        continue
+                    commit_hash, _, name = line.partition(" ")
+                    self._packed_refs[name] = commit_hash
+            return self._packed_refs
+
+    def get_config_value(self, section, subsection, key):
+        """
+        Get a value from the repository config - e.g., ("remote", "origin", "url").
+        @return: The (last) value or None if missing.
+        """
+        with self._lock:
+            if self._config is None:
+                try:
+                    text = (self.common_dir / "config").read_text()
+                except OSError:
+                    text = ""
+                self._config = parse_git_config(text)
+            return self._config.get((section.lower(), subsection, key.lower()))
+
+    def run_git(self, *args):
+        """
+        Run a `git` command in the working tree. Check run_git().
+        """
+        return run_git(self.top_level, *args)
+
+
+# e.g., [core], [remote "origin"], [branch "main"]
+_config_section_regex = re.compile(r'^\[\s*([^\s\]"]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+
+def parse_git_config(text):
+    """
+    Parse the content of a Git config file (the subset needed by beman-tidy: sections and values).
+    @return: A dictionary (section, subsection, key) -> value. Sections and keys are lower-cased.
+    """
+    config = {}
+    section, subsection = None, None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+
+        match = _config_section_regex.match(line)
+        if match:
+            section = match.group(1).lower()
+            subsection = match.group(2)
+            if subsection is not None:
+                subsection = re.sub(r"\\(.)", r"\1", subsection)
+            elif "." in section:
+                # Deprecated syntax - e.g., [remote.origin]
+                section, _, subsection = section.partition(".")
+            line = line[match.end() :].strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+
+        if section is None:
+            continue
+        key, _, value = line.partition("=")
+        # A key without value is a boolean true.
+        config[(section, subsection, key.strip().lower())] = (
+            _parse_git_config_value(value) if "=" in line else "true"
+        )
+    return config
+
+
+def _parse_git_config_value(value):
+    """
+    Parse a config value: strip comments and quotes, unescape the escape sequences.
+    """
+    result = []
+    in_quotes = False
+    escapes = {"n": "\n", "t": "\t", "b": "\b", '"': '"', "\\": "\\"}
+    i = 0
+    while i < len(value):
+        char = value[i]
+        if char == "\\" and i + 1 < len(value):
+            result.append(escapes.get(value[i + 1], value[i + 1]))
+            i += 2
+            continue
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char in "#;" and not in_quotes:
+            break
+        else:
+            result.append(char)
+        i += 1
+    return "".join(result).strip()
+
+
+def run_git(cwd, *args):
+    """
+    Run a `git` command in the given directory.
+    @return: The output of the command (without the trailing newline).
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError as e:
+        raise GitError(f"Cannot run git: {e}") from e
+
+    if result.returncode != 0:
+        raise GitError(
+            f"'git {' '.join(args)}' failed with exit code {result.returncode}: {result.stderr.strip()}"
+        )
+    output = result.stdout
+    return output[:-1] if output.endswith("\n") else output
+
+
+def iter_git_files(cwd, untracked=True, chunk_size=64 * 1024):
+    """
+    List the files of the working tree with a single `git ls-files -z` call, streamed as a generator:
+    paths are yielded (relative to cwd, using "/") while git is still listing.
+    - untracked: also list the untracked files that are not ignored (.gitignore, .git/info/exclude, ...).
+    Ignored files (e.g., build/) are never listed. Tracked files deleted from the working tree may be listed.
+    """
+    args = ["ls-files", "-z", "--cached"]
+    if untracked:
+        args += ["--others", "--exclude-standard"]
+    try:
+        process = subprocess.Popen(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError as e:
+        raise GitError(f"Cannot run git: {e}") from e
+
+    with process:
+        pending = b""
+        previous_path = None
+        while chunk := process.stdout.read(chunk_size):
+            *paths, pending = (pending + chunk).split(b"\0")
+            for path in paths:
+                # Unmerged files are listed once per stage.
+                if path != previous_path:
+                    previous_path = path
+                    yield os.fsdecode(path)
+        stderr = process.stderr.read()
+
+    if process.returncode != 0:
+        raise GitError(
+            f"'git {' '.join(args)}' failed with exit code {process.returncode}: "
+            f"{stderr.decode(errors='replace').strip()}"
+        )
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import hashlib
+import os
+import threading
+
+from .standard_config import get_beman_standard_config_path
+
+# The license indexes of this process: licenses key -> LicenseIndex (check get_license_index()).
+_license_indexes = {}
+_license_indexes_lock = threading.Lock()
+
+
+def get_license_digest(path):
+    """
+    Get the fingerprint of a LICENSE file: the SHA-256 of its normalized text.
+    The file is streamed line by line (never fully loaded) and normalized:
+    - line endings are "\\n" (e.g., CRLF files are accepted);
+    - trailing whitespace is removed from each line;
+    - leading and trailing blank lines are ignored.
+
+    @return: The hex digest, or None if the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    cnt_blank_lines = 0
+    started = False
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            for line in file:
+                line = line.rstrip()
+                if not line:
+                    # Blank lines are only hashed if a non-blank line follows.
+                    cnt_blank_lines += started
+                    continue
+
+                if started:
+                    digest.update(b"\n" * (cnt_blank_lines + 1))
+                digest.update(line.encode())
+                started = True
+                cnt_blank_lines = 0
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class LicenseIndex:
+    """
+    Fingerprint index of the approved licenses (the "licenses" of LICENSE.APPROVED in the Beman Standard YAML file):
+    license fingerprint (check get_license_digest()) -> license.
+
+    A license is a dictionary - e.g.,
+    {"id": "apache-v2", "spdx": "Apache License v2.0 with LLVM Exceptions",
+     "path": "/path/to/beman_tidy/docs/licenses/apache-v2.txt", "digest": "..."}
+    The reference files ("path") are relative to the Beman Standard YAML file.
+    """
+
+    def __init__(self, licenses, base_path):
+        # license id -> license
+        self.licenses = {}
+        # digest -> license
+        self._licenses_by_digest = {}
+        # Files larger than this are never hashed (check match_file()).
+        self.max_file_size = 0
+
+        for license in licenses:
+            license = dict(license)
+            if "path" in license:
+                license["path"] = base_path / license["path"]
+                license["digest"] = get_license_digest(license["path"])
+            self.licenses[license["id"]] = license
+            if license.get("digest") is not None:
+                self._licenses_by_digest[license["digest"]] = license
+                self.max_file_size = max(
+                    self.max_file_size, 2 * os.path.getsize(license["path"])
+                )
+
+    def lookup(self, digest):
+        """
+        @return: The approved license with the given fingerprint, or None.
+        """
+        return self._licenses_by_digest.get(digest)
+
+    def match_file(self, path):
+        """
+        Match a LICENSE file against the approved licenses: a single streamed hash and a lookup.
+        Files more than twice as large as all the reference files (e.g., huge or crafted files)
+        are not considered reference files and are not hashed.
+
+        @return: The approved license matching the file, or None.
+        """
+        try:
+            if os.path.getsize(path) > self.max_file_size:
+                return None
+        except OSError:
+            return None
+        return self.lookup(get_license_digest(path))
+
+    def get(self, license_id):
+        """
+        @return: The approved license with the given id (e.g., "apache-v2"), or None.
+        """
+        return self.licenses.get(license_id)
+
+
+def get_license_index(licenses, base_path=get_beman_standard_config_path().parent):
+    """
+    Get the fingerprint index of the given approved licenses - built once per process,
+    so the reference files are hashed only once.
+    """
+    key = (
+        str(base_path),
+        tuple((license["id"], license.get("path")) for license in licenses),
+    )
+    with _license_indexes_lock:
+        license_index = _license_indexes.get(key)
+        if license_index is None:
+            license_index = LicenseIndex(licenses, base_path)
+            _license_indexes[key] = license_index
+    return license_index
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import re
+
+
+class MultiLiteralMatcher:
+    """
+    Count the occurrences of many literal strings with a single scan of a text.
+
+    All the literals are compiled once into one regex alternation (longest literal first).
+    If the literals can overlap each other (e.g., "ab" and "bc", or "a" and "ab"),
+    the scan tries every position of the text (zero-width lookahead), otherwise the regex
+    engine can skip over each match.
+
+    Usage:
+        matcher = MultiLiteralMatcher(["![Badge A](a.svg)", "![Badge B](b.svg)"])
+        matcher.count(readme_content) # {"![Badge A](a.svg)": 1, "![Badge B](b.svg)": 0}
+    """
+
+    def __init__(self, literals):
+        # The unique, non-empty literals in the given order.
+        self.literals = list(dict.fromkeys(literal for literal in literals if literal))
+
+        # The alternation matches the first alternative, so prefer the longest literals.
+        alternatives = "|".join(
+            re.escape(literal)
+            for literal in sorted(self.literals, key=len, reverse=True)
+        )
+        self.overlapping = self.__can_overlap(self.literals)
+        self.regex = (
+            re.compile(f"(?=({alternatives}))")
+            if self.overlapping
+            else re.compile(f"({alternatives})")
+        )
+
+        # When literals overlap, a match of a literal is also a match of all its prefix literals.
+        self.prefixes = {
+            literal: [
+                other
+                for other in self.literals
+                if other != literal and literal.startswith(other)
+            ]
+            for literal in self.literals
+        }
+
+    def __repr__(self):
+        return f"MultiLiteralMatcher({self.literals!r})"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, MultiLiteralMatcher) and self.literals == other.literals
+        )
+
+    def __hash__(self):
+        return hash(tuple(self.literals))
+
+    def count(self, text):
+        """
+        Count the occurrences of each literal in text.
+        @return: A dictionary literal -> number of occurrences (0 for missing literals).
+        """
+        counts = dict.fromkeys(self.literals, 0)
+        if not text or not self.literals:
+            return counts
+
+        for match in self.regex.finditer(text):
+            literal = match.group(1)
+            counts[literal] += 1
+            for prefix in self.prefixes[literal]:
+                counts[prefix] += 1
+
+        return counts
+
+    @staticmethod
+    def __can_overlap(literals):
+        """
+        Check if two occurrences of the literals can overlap in a text:
+        a proper suffix of a literal is a prefix of a literal (itself included) or contains a literal.
+        """
+        first_chars = {literal[0] for literal in literals}
+        for literal in literals:
+            if any(
+                other != literal and literal.startswith(other) for other in literals
+            ):
+                return True
+            for i in range(1, len(literal)):
+                if literal[i] not in first_chars:
+                    continue
+                suffix = literal[i:]
+                if any(
+                    other.startswith(suffix) or suffix.startswith(other)
+                    for other in literals
+                ):
+                    return True
+        return False
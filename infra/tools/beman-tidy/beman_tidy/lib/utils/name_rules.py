@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import re
+
+from .string import SNAKE_CASE_PATTERN
+
+# The variables of the file name templates - e.g., "${snake_case}.test.cpp".
+NAME_TEMPLATE_PATTERNS = {
+    "snake_case": SNAKE_CASE_PATTERN,
+}
+
+# e.g., "${snake_case}"
+_name_template_variable_regex = re.compile(r"\$\{(\w+)\}")
+
+
+def compile_name_template(template):
+    """
+    Compile a file name template into a regex pattern: the text is matched literally, ${<variable>} become
+    their pattern (check NAME_TEMPLATE_PATTERNS).
+    e.g., "${snake_case}.test.cpp" -> r"(?:[a-z0-9]+|[a-z0-9][a-z0-9_.]+[a-z0-9])\\.test\\.cpp"
+
+    @return: The regex pattern (not compiled). Raises ValueError for an unknown variable.
+    """
+    parts = []
+    last_end = 0
+    for match in _name_template_variable_regex.finditer(template):
+        variable = match.group(1)
+        if variable not in NAME_TEMPLATE_PATTERNS:
+            raise ValueError(f"Unknown variable '${{{variable}}}' in '{template}'")
+        parts.append(re.escape(template[last_end : match.start()]))
+        parts.append(f"(?:{NAME_TEMPLATE_PATTERNS[variable]})")
+        last_end = match.end()
+    parts.append(re.escape(template[last_end:]))
+    return "".join(parts)
+
+
+class NameRuleViolation:
+    """
+    A file whose name matches none of the rules of its directory class (check NameRuleEngine.evaluate()).
+    - path: the path, relative to the repository - e.g., "tests/beman/exemplar/identity_test.cpp"
+    - directory_class: the directory class - e.g., "tests"
+    - templates: the expected name templates - e.g., ["${snake_case}.test.cpp"]
+    """
+
+    __slots__ = ("path", "directory_class", "templates")
+
+    def __init__(self, path, directory_class, templates):
+        self.path = path
+        self.directory_class = directory_class
+        self.templates = templates
+
+    def __repr__(self):
+        return f"NameRuleViolation({self.path!r}, {self.directory_class!r})"
+
+
+class NameRuleEngine:
+    """
+    Check the file names of a repository against name rules, per directory class, in a single pass.
+
+    - directory_classes: directory class -> directory prefixes, relative to the repository
+      - e.g., {"tests": ["tests/"], "headers": ["include/"]}
+    - rules: directory class -> file name templates - e.g., {"tests": ["${snake_case}.test.cpp"]}
+    - extensions: the extensions of the files with rules - e.g., [".cpp", ".hpp"] (default: all files)
+
+    All the rules are compiled once: a single matcher of the directory prefixes (the longest prefix wins),
+    and one combined matcher of each directory class (all its name templates and the extensions).
+    Each path is then checked with two regex matches, whatever the number of rules.
+
+    Usage:
+        engine = NameRuleEngine({"tests": ["tests/"]}, {"tests": ["${snake_case}.test.cpp"]}, [".cpp"])
+        engine.evaluate(["tests/identity.test.cpp", "tests/IdentityTest.cpp", "README.md"])
+        # (2, [NameRuleViolation('tests/IdentityTest.cpp', 'tests')])
+    """
+
+    def __init__(self, directory_classes, rules, extensions=None):
+        self.directory_classes = directory_classes
+        self.rules = rules
+        self.extensions = list(extensions) if extensions is not None else None
+
+        # The directory prefixes: one named group per class, longest prefix first. The classes without rules
+        # exclude their directories from the classes with rules - e.g., "tests/data/" from "tests/".
+        self._group_classes = {}
+        prefixes = []
+        for index, (directory_class, class_prefixes) in enumerate(
+            directory_classes.items()
+        ):
+            group = f"class_{index}"
+            self._group_classes[group] = directory_class
+            prefixes.extend((prefix, group) for prefix in class_prefixes)
+        prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+        self._prefix_regex = re.compile(
+            "|".join(f"(?P<{group}>{re.escape(prefix)})" for prefix, group in prefixes)
+            if prefixes
+            else "(?!)"
+        )
+
+        # The combined name matcher of each class: the "valid" group matches a template, the other alternative
+        # any other name with one of the extensions. Names with other extensions do not match.
+        extensions_lookahead = (
+            "(?=.*(?:{})\\Z)".format(
+                "|".join(re.escape(extension) for extension in self.extensions)
+            )
+            if self.extensions is not None
+            else ""
+        )
+        self._name_regexes = {
+            directory_class: re.compile(
+                "{}(?:(?P<valid>{})|.*)".format(
+                    extensions_lookahead,
+                    "|".join(compile_name_template(template) for template in templates),
+                ),
+                re.DOTALL,
+            )
+            for directory_class, templates in rules.items()
+        }
+
+    def classify(self, relative_path):
+        """
+        Get the directory class of a path - e.g., "tests" for "tests/beman/exemplar/identity.test.cpp".
+        @return: The directory class, or None if the path is not in a directory class.
+        """
+        match = self._prefix_regex.match(relative_path)
+        if match is None:
+            return None
+        # Only one group takes part in a match of the alternation.
+        return self._group_classes[match.lastgroup]
+
+    def evaluate(self, relative_paths):
+        """
+        Check the names of the given paths (relative to the repository, using "/") in a single pass.
+        Paths outside the directory classes, in a class without rules or with other extensions are not checked.
+
+        @return: The number of checked paths and the NameRuleViolation list, in the order of the paths.
+        """
+        prefix_match = self._prefix_regex.match
+        group_classes = self._group_classes
+        name_regexes = self._name_regexes
+
+        cnt_checked = 0
+        violations = []
+        for relative_path in relative_paths:
+            match = prefix_match(relative_path)
+            if match is None:
+                continue
+            directory_class = group_classes[match.lastgroup]
+            name_regex = name_regexes.get(directory_class)
+            if name_regex is None:
+                continue  # no rules
+            # The name is matched in place (no slicing): the last path component.
+            name_match = name_regex.fullmatch(
+                relative_path, relative_path.rfind("/") + 1
+            )
+            if name_match is None:
+                continue  # other extension
+
+            cnt_checked += 1
+            if name_match.lastgroup is None:
+                violations.append(
+                    NameRuleViolation(
+                        relative_path, directory_class, self.rules[directory_class]
+                    )
+                )
+        return cnt_checked, violations
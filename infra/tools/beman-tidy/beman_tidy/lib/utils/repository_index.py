@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import os
+import threading
+from pathlib import Path
+
+from .git_dir import GitDirectory, GitError, NotAGitRepositoryError, iter_git_files
+
+
+class RepositoryEntry:
+    """
+    A file or directory of the repository index.
+    - path: the absolute path - e.g., "/path/to/exemplar/src/beman/exemplar"
+    - relative_path: the path relative to the repository top level, using "/" - e.g., "src/beman/exemplar"
+    - type: "file", "directory" or "other" (symlinks are followed)
+    - size, mtime_ns: the stat metadata, read on first access
+    """
+
+    __slots__ = ("path", "relative_path", "type", "_dir_entry", "_stat")
+
+    def __init__(self, dir_entry, relative_path, entry_type):
+        self.path = dir_entry.path
+        self.relative_path = relative_path
+        self.type = entry_type
+        self._dir_entry = dir_entry
+        self._stat = None
+
+    @property
+    def name(self):
+        return self._dir_entry.name
+
+    @property
+    def size(self):
+        return self.stat().st_size
+
+    @property
+    def mtime_ns(self):
+        return self.stat().st_mtime_ns
+
+    def stat(self):
+        if self._stat is None:
+            self._stat = self._dir_entry.stat()
+        return self._stat
+
+    def is_file(self):
+        return self.type == "file"
+
+    def is_dir(self):
+        return self.type == "directory"
+
+    def __repr__(self):
+        return f"RepositoryEntry({self.relative_path!r}, {self.type!r})"
+
+
+class RepositoryIndex:
+    """
+    Run-scoped index of the repository files, shared by all the checks of a run (check RepositorySnapshot.index).
+    Checks query the index (e.g., exists(), is_empty(), list_directory(), iter_files()) instead of the filesystem.
+
+    The index is filled lazily: each directory is listed (os.scandir()) at most once per run, on first access.
+    Queries about a single path only list its parent directory and see all the files of the working tree.
+
+    Traversals (walk(), iter_files()) only visit the files known to git: a single `git ls-files -z` call
+    per run, shared by the concurrent traversals, so the ignored trees (e.g., build/, _deps/, .cache/) are never
+    walked:
+    - include_untracked: also visit the untracked files that are not ignored (default: True).
+    - include_ignored: visit all the files of the working tree with an os.scandir() walk (--include-ignored).
+    Outside a git working tree, traversals always walk the filesystem. The .git directory is never walked.
+
+    Paths are absolute or relative to the current directory, like the check paths (e.g., self.path).
+    Paths outside the repository (e.g., test data) are indexed the same way.
+    Writes (e.g., --fix-inplace) must call invalidate() for the modified path.
+    """
+
+    def __init__(self, top_level, include_untracked=True, include_ignored=False):
+        self.top_level = os.path.abspath(top_level)
+        self.include_untracked = include_untracked
+        self.include_ignored = include_ignored
+
+        # The traversal source, "git" or "filesystem" (check get_traversal_source()).
+        self._traversal_source = None
+        # The paths listed by git (relative to the top level), listed once (check _get_git_files()).
+        self._git_files = None
+        self._git_files_lock = threading.Lock()
+
+        # Listed directories: absolute path -> {name: RepositoryEntry}, or None if not a directory.
+        self._directories = {}
+        # Probed directories (check is_empty()): absolute path -> True if empty.
+        self._empty_directories = {}
+        # Per-directory locks, so concurrent checks never list the same directory twice.
+        self._directory_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """
+        @return: The entry of the given path, or None if it does not exist.
+        """
+        path = self._absolute_path(path)
+        parent, name = os.path.split(path)
+        if not name:
+            return None  # filesystem root
+        entries = self._list(parent)
+        return entries.get(name) if entries is not None else None
+
+    def exists(self, path):
+        return self.get(path) is not None
+
+    def is_file(self, path):
+        entry = self.get(path)
+        return entry is not None and entry.is_file()
+
+    def is_dir(self, path):
+        entry = self.get(path)
+        return entry is not None and entry.is_dir()
+
+    def is_empty(self, path):
+        """
+        Check if the given file or directory is empty, in constant time (cached for the run):
+        - a file is empty if its size is 0 (a single stat, the file is never read);
+        - a directory is empty if os.scandir() yields no entry (the first entry stops the probe,
+          the directory is never fully listed).
+        @return: True if the path is empty or does not exist.
+        """
+        entry = self.get(path)
+        if entry is None:
+            return True
+        if entry.is_file():
+            try:
+                return entry.size == 0
+            except OSError:
+                return True
+        if not entry.is_dir():
+            return False
+
+        path = entry.path
+        if path in self._directories:
+            return not self._directories[path]
+        if path not in self._empty_directories:
+            try:
+                with os.scandir(path) as dir_entries:
+                    empty = next(dir_entries, None) is None
+            except OSError:
+                empty = True
+            with self._lock:
+                self._empty_directories[path] = empty
+        return self._empty_directories[path]
+
+    def list_directory(self, path):
+        """
+        @return: The entries of the given directory, sorted by name ([] if it is not a directory).
+        """
+        entries = self._list(self._absolute_path(path))
+        return sorted(entries.values(), key=lambda entry: entry.name) if entries else []
+
+    def walk(self, path=None):
+        """
+        Iterate over all the entries under the given directory (default: the repository top level).
+        Each directory is yielded before the files and directories it contains.
+        Symlinked directories are not followed.
+        """
+        path = self._absolute_path(path) if path is not None else self.top_level
+        prefix = self._relative_path(path)
+        inside_top_level = prefix != ".." and not prefix.startswith("../")
+        if self.get_traversal_source() == "git" and inside_top_level:
+            walked = False
+            try:
+                for entry in self._walk_git("" if prefix == "." else prefix + "/"):
+                    walked = True
+                    yield entry
+                return
+            except GitError:
+                if walked:
+                    raise
+                # e.g., git is not installed: walk the filesystem for the rest of the run.
+                self._traversal_source = "filesystem"
+        yield from self._walk_filesystem(path)
+
+    def get_traversal_source(self):
+        """
+        @return: "git" if the traversals are done with `git ls-files`, "filesystem" otherwise.
+        """
+        if self._traversal_source is None:
+            source = "filesystem"
+            if not self.include_ignored:
+                try:
+                    GitDirectory.discover(self.top_level)
+                    source = "git"
+                except NotAGitRepositoryError:
+                    pass
+            self._traversal_source = source
+        return self._traversal_source
+
+    def iter_files(self, prefix="", extensions=None):
+        """
+        Iterate over the files under the given prefix (relative to the repository top level),
+        optionally only with the given extensions.
+        e.g., iter_files("include/beman/exemplar", [".hpp", ".h"])
+        """
+        for entry in self.walk(os.path.join(self.top_level, prefix)):
+            if not entry.is_file():
+                continue
+            if extensions is not None and os.path.splitext(entry.name)[1] not in (
+                extensions
+            ):
+                continue
+            yield entry
+
+    def invalidate(self, path):
+        """
+        Drop the cached listings of the given path and of its parent directories, and the git file list
+        - e.g., after a file was written (or created) by --fix-inplace.
+        """
+        path = self._absolute_path(path)
+        with self._lock:
+            self._git_files = None
+            self._directories.pop(path, None)
+            self._empty_directories.pop(path, None)
+            while True:
+                parent = os.path.dirname(path)
+                self._directories.pop(parent, None)
+                self._empty_directories.pop(parent, None)
+                if parent == path or not parent.startswith(self.top_level):
+                    break
+                path = parent
+
+    def _walk_filesystem(self, path):
+        """
+        Walk the directory with os.scandir(), in depth-first order, sorted by name.
+        """
+        stack = [path]
+        while stack:
+            entries = self.list_directory(stack.pop())
+            for entry in entries:
+                yield entry
+            stack.extend(
+                entry.path
+                for entry in reversed(entries)
+                if entry.is_dir()
+                and entry.name != ".git"
+                and not entry._dir_entry.is_symlink()
+            )
+
+    def _walk_git(self, prefix):
+        """
+        Walk the files listed by git under the given prefix (relative to the top level, ending with "/"),
+        in git order. The directories are yielded on first use.
+        """
+        yielded_directories = set()
+        previous_directory = None
+        entries = None
+        parents_yielded = False
+        for relative_path in self._get_git_files():
+            if not relative_path.startswith(prefix):
+                continue
+            directory, _, name = relative_path.rpartition("/")
+
+            # Files are listed directory by directory: the directory is only listed on change.
+            if directory != previous_directory:
+                previous_directory = directory
+                entries = self._list(
+                    os.path.join(self.top_level, directory)
+                    if directory
+                    else self.top_level
+                )
+                parents_yielded = False
+            entry = entries.get(name) if entries is not None else None
+            if entry is None:
+                continue  # deleted from the working tree
+
+            # The parent directories are yielded before the first file of the directory.
+            if not parents_yielded:
+                parents_yielded = True
+                parts = relative_path[len(prefix) :].split("/")[:-1]
+                for index in range(len(parts)):
+                    parent = prefix + "/".join(parts[: index + 1])
+                    if parent not in yielded_directories:
+                        yielded_directories.add(parent)
+                        yield self.get(os.path.join(self.top_level, parent))
+            yield entry
+
+    def _get_git_files(self):
+        """
+        Get the paths listed by git, cached for the run. Concurrent traversals share a single `git ls-files`
+        call: the first one lists the files, the others wait for the list.
+        """
+        git_files = self._git_files
+        if git_files is None:
+            with self._git_files_lock:
+                git_files = self._git_files
+                if git_files is None:
+                    git_files = list(
+                        iter_git_files(self.top_level, self.include_untracked)
+                    )
+                    with self._lock:
+                        self._git_files = git_files
+        return git_files
+
+    def _absolute_path(self, path):
+        return os.path.abspath(path)
+
+    def _relative_path(self, path):
+        # Fast path: a path under the top level (e.g., a listed directory).
+        if (
+            path.startswith(self.top_level)
+            and path[len(self.top_level) :][:1] == os.sep
+        ):
+            return path[len(self.top_level) + 1 :].replace(os.sep, "/")
+        relative_path = os.path.relpath(path, self.top_level)
+        return Path(relative_path).as_posix()
+
+    def _list(self, path):
+        """
+        List a directory (cached). Returns None if the path is not a directory.
+        """
+        if path in self._directories:
+            return self._directories[path]
+
+        with self._lock:
+            directory_lock = self._directory_locks.setdefault(path, threading.Lock())
+        with directory_lock:
+            if path in self._directories:
+                return self._directories[path]
+
+            # The relative path of the directory, computed once for all its entries.
+            relative_prefix = self._relative_path(path)
+            relative_prefix = "" if relative_prefix == "." else relative_prefix + "/"
+            try:
+                with os.scandir(path) as dir_entries:
+                    entries = {}
+                    for dir_entry in dir_entries:
+                        entry_type = self._get_entry_type(dir_entry)
+                        if entry_type is None:
+                            continue  # broken symlink
+                        entries[dir_entry.name] = RepositoryEntry(
+                            dir_entry,
+                            relative_prefix + dir_entry.name,
+                            entry_type,
+                        )
+            except OSError:
+                entries = None
+
+            with self._lock:
+                self._directories[path] = entries
+            return entries
+
+    @staticmethod
+    def _get_entry_type(dir_entry):
+        try:
+            if dir_entry.is_dir():
+                return "directory"
+            if dir_entry.is_file():
+                return "file"
+            # Neither a file nor a directory: a broken symlink, or e.g. a socket.
+            os.stat(dir_entry.path)
+            return "other"
+        except OSError:
+            return None
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import hashlib
+import io
+import os
+import threading
+
+from .cmake import build_cmake_include_graph
+from .cpp import build_cpp_directive_index
+from .repository_index import RepositoryIndex
+
+
+class RepositorySnapshot:
+    """
+    Run-scoped view of a repository, shared by all the checks of a run.
+
+    It behaves like the repo_info dictionary (e.g., snapshot["name"]) and caches the
+    content of the files read by the checks: each file is read at most once per run,
+    the decoded text and the split lines are shared between all the checks.
+    Parsed files (e.g., CMake listfiles) are cached too, by content: each distinct content is parsed at most once
+    per run (check parse()). The CMake include graph of the project is built once per run (check get_cmake_graph()),
+    and so is the preprocessor directive index of the C++ files (check get_cpp_directive_index()).
+    The files and directories of the repository are queried through the index (check RepositoryIndex).
+    Writes (e.g., --fix-inplace) must call invalidate() for the modified file.
+    """
+
+    def __init__(self, repo_info, include_untracked=True, include_ignored=False):
+        # The repository information - e.g., {"name": "exemplar", "top_level": ..., ...}
+        self.repo_info = repo_info
+        # The files visited by the index traversals (check RepositoryIndex).
+        self.include_untracked = include_untracked
+        self.include_ignored = include_ignored
+
+        # Cached file contents: absolute path -> text.
+        self._files = {}
+        # Cached file lines (split on first use): absolute path -> lines.
+        self._lines = {}
+        # Cached parse results: (content hash, parser) -> (result, exception).
+        self._parsed = {}
+        # Content hashes of the parsed files: absolute path -> content hash.
+        self._content_hashes = {}
+        # CMake include graphs: absolute path of the top-level listfile -> CMakeIncludeGraph.
+        self._cmake_graphs = {}
+        # C++ directive indexes: directories (relative to the repository) -> CppDirectiveIndex.
+        self._cpp_directive_indexes = {}
+        # Per-file (and per-parse) locks, so concurrent checks never read or parse the same file twice.
+        self._file_locks = {}
+        self._lock = threading.Lock()
+
+        # The repository index, created on first use.
+        self._index = None
+
+    def __getitem__(self, key):
+        return self.repo_info[key]
+
+    def __contains__(self, key):
+        return key in self.repo_info
+
+    def get(self, key, default=None):
+        return self.repo_info.get(key, default)
+
+    @property
+    def index(self):
+        """
+        The repository index (check RepositoryIndex) - e.g., snapshot.index.exists(path).
+        """
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = RepositoryIndex(
+                        self.repo_info["top_level"],
+                        include_untracked=self.include_untracked,
+                        include_ignored=self.include_ignored,
+                    )
+        return self._index
+
+    def read_text(self, path):
+        """
+        Read the file content (cached, invalid UTF-8 bytes are replaced). Returns "" if the file cannot be read.
+        """
+        return self._load(self._key(path))
+
+    def read_lines(self, path):
+        """
+        Read the file content as lines (cached). Returns [] if the file cannot be read.
+        The caller owns the returned list.
+        """
+        key = self._key(path)
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = tuple(io.StringIO(self._load(key)).readlines())
+            with self._lock:
+                self._lines[key] = lines
+        return list(lines)
+
+    def parse(self, path, parser):
+        """
+        Parse the file content with the given parser - a function text -> result (e.g., parse_cmake_listfile()).
+        The result is cached by content hash and shared between all the checks: files with the same content
+        (e.g., identical tests/*/CMakeLists.txt) are parsed once. An exception raised by the parser
+        (e.g., a syntax error) is cached too and raised again on each call.
+        """
+        path = self._key(path)
+        key = (self._content_hash(path), parser)
+        parsed = self._parsed.get(key)
+        if parsed is None:
+            with self._get_lock(key):
+                parsed = self._parsed.get(key)
+                if parsed is None:
+                    try:
+                        parsed = (parser(self._load(path)), None)
+                    except Exception as e:
+                        parsed = (None, e)
+                    with self._lock:
+                        self._parsed[key] = parsed
+
+        result, exception = parsed
+        if exception is not None:
+            raise exception
+        return result
+
+    def get_cmake_graph(self, path=None):
+        """
+        Get the CMake include graph of the project (built once per run, check build_cmake_include_graph()).
+        - path: the top-level listfile (default: the top-level CMakeLists.txt of the repository).
+        """
+        if path is None:
+            path = os.path.join(self.repo_info["top_level"], "CMakeLists.txt")
+        key = self._key(path)
+        graph = self._cmake_graphs.get(key)
+        if graph is None:
+            with self._get_lock(("cmake_graph", key)):
+                graph = self._cmake_graphs.get(key)
+                if graph is None:
+                    graph = build_cmake_include_graph(self, key)
+                    with self._lock:
+                        self._cmake_graphs[key] = graph
+        return graph
+
+    def get_cpp_directive_index(self, directories):
+        """
+        Get the preprocessor directive index of the C++ files under the given directories, relative to the
+        repository - e.g., ["include/beman/exemplar", "src/beman/exemplar"] (built once per run,
+        check build_cpp_directive_index()).
+        """
+        key = tuple(directories)
+        index = self._cpp_directive_indexes.get(key)
+        if index is None:
+            with self._get_lock(("cpp_directive_index", key)):
+                index = self._cpp_directive_indexes.get(key)
+                if index is None:
+                    index = build_cpp_directive_index(self, key)
+                    with self._lock:
+                        self._cpp_directive_indexes[key] = index
+        return index
+
+    def invalidate(self, path):
+        """
+        Drop the cached content (and parse results, CMake include graphs, C++ directive indexes) of the given file
+        - e.g., after it was written.
+        """
+        key = self._key(path)
+        with self._lock:
+            self._files.pop(key, None)
+            self._lines.pop(key, None)
+            self._content_hashes.pop(key, None)
+            # A listfile may have been added to or removed from a graph: rebuild them on next use.
+            self._cmake_graphs.clear()
+            self._cpp_directive_indexes.clear()
+        if self._index is not None:
+            self._index.invalidate(path)
+
+    def _key(self, path):
+        return os.path.abspath(path)
+
+    def _get_lock(self, key):
+        """
+        Get the lock of a file (or of a parse result) - e.g., so concurrent checks never read a file twice.
+        """
+        lock = self._file_locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._file_locks.setdefault(key, threading.Lock())
+        return lock
+
+    def _content_hash(self, key):
+        content_hash = self._content_hashes.get(key)
+        if content_hash is None:
+            content_hash = hashlib.sha1(self._load(key).encode()).hexdigest()
+            with self._lock:
+                self._content_hashes[key] = content_hash
+        return content_hash
+
+    def _load(self, key):
+        """
+        Load the content of a file (cached) - key: the absolute path (check _key()).
+        Invalid UTF-8 bytes (e.g., a Latin-1 comment) are replaced, so the rest of the file is still checked.
+        """
+        content = self._files.get(key)
+        if content is not None:
+            return content
+
+        with self._get_lock(key):
+            content = self._files.get(key)
+            if content is None:
+                try:
+                    with open(key, "r", encoding="utf-8", errors="replace") as file:
+                        content = file.read()
+                except Exception:
+                    content = ""
+                with self._lock:
+                    self._files[key] = content
+            return content
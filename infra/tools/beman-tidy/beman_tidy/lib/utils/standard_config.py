@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from .matcher import MultiLiteralMatcher
+
+# Bump when the layout of the config cache (the parsed YAML file, as JSON) changes.
+BEMAN_STANDARD_CONFIG_CACHE_VERSION = 2
+
+
+class CheckConfig:
+    """
+    The compiled config of a check from The Beman Standard YAML configuration file.
+
+    It behaves like the former check config dictionary (e.g., config["type"], "values" in config),
+    with the expensive parts prebuilt once:
+    - regex: the compiled regexes (placeholders like <SPDX License Expression> become capture groups).
+    - values_set / values_matcher: the literals of "values" as a set / a single-scan matcher.
+    - licenses: the parsed licenses - e.g., [{"id": "mit", "spdx": "The MIT License", "path": "..."}].
+
+    The optional keys ("value", "values", "values_set", "values_matcher") are missing
+    (e.g., "value" not in config) if they are not set in the YAML file.
+    """
+
+    __slots__ = (
+        "name",
+        "full_text_body",
+        "type",
+        "regex",
+        "file_name",
+        "directory_name",
+        "badge_lines",
+        "status_lines",
+        "licenses",
+        "default_group",
+        "value",
+        "values",
+        "values_set",
+        "values_matcher",
+    )
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.full_text_body: str = ""
+        self.type: str = ""
+        self.regex: list = []
+        self.file_name: str = ""
+        self.directory_name: str = ""
+        self.badge_lines: str = ""
+        self.status_lines: list = []
+        self.licenses: list = []
+        self.default_group: str = ""
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __eq__(self, other):
+        return isinstance(other, CheckConfig) and dict(self.items()) == dict(
+            other.items()
+        )
+
+    def __repr__(self):
+        # Deterministic (e.g., used by the result cache keys): sets are sorted.
+        items = {
+            key: sorted(value) if isinstance(value, frozenset) else value
+            for key, value in self.items()
+        }
+        return f"CheckConfig({items!r})"
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def __getstate__(self):
+        return dict(self.items())
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+
+def get_beman_standard_config_path():
+    """
+    Get the path to the Beman Standard YAML configuration file.
+    """
+    return Path(__file__).parent.parent.parent / ".beman-standard.yml"
+
+
+def get_beman_standard_config_cache_dir():
+    """
+    Get the directory of the compiled config cache:
+    $BEMAN_TIDY_CACHE_DIR, $XDG_CACHE_HOME/beman-tidy or ~/.cache/beman-tidy.
+    """
+    if os.environ.get("BEMAN_TIDY_CACHE_DIR"):
+        return Path(os.environ["BEMAN_TIDY_CACHE_DIR"])
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "beman-tidy"
+    return Path.home() / ".cache" / "beman-tidy"
+
+
+def load_beman_standard_config(path=get_beman_standard_config_path(), cache=True):
+    """
+    Load the Beman Standard YAML configuration file from the given path.
+    Returns a dictionary check name -> CheckConfig.
+
+    The parsed YAML file is cached on disk as plain JSON (check get_beman_standard_config_cache_dir()), keyed by
+    the hash of the YAML file, so warm starts do not parse the YAML file. The cache holds only data: the compiled
+    objects (e.g., regexes, matchers) are always rebuilt by the current code. Use cache=False to always parse it.
+    """
+    content = Path(path).read_bytes()
+    cache_path = (
+        get_beman_standard_config_cache_dir()
+        / f"beman-standard-v{BEMAN_STANDARD_CONFIG_CACHE_VERSION}-{hashlib.sha256(content).hexdigest()}.json"
+    )
+
+    beman_standard_yml = None
+    if cache:
+        try:
+            with open(cache_path, "r") as file:
+                beman_standard_yml = json.load(file)
+            if not isinstance(beman_standard_yml, dict):
+                beman_standard_yml = None
+        except Exception:
+            # Missing or corrupted cache: parse the YAML file.
+            pass
+
+    if beman_standard_yml is None:
+        beman_standard_yml = parse_beman_standard_yml(content)
+        if cache:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w") as file:
+                    json.dump(beman_standard_yml, file)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                # The cache is an optimization.
+                pass
+
+    return compile_beman_standard_config(beman_standard_yml)
+
+
+def parse_beman_standard_yml(content):
+    """
+    Parse the content of the Beman Standard YAML configuration file.
+    Uses the C (libyaml) loader when available.
+    """
+    # Imported on demand: warm starts use the compiled config cache.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def compile_beman_standard_config(beman_standard_yml):
+    """
+    Compile the parsed Beman Standard YAML configuration file.
+    Returns a dictionary check name -> CheckConfig.
+    """
+    beman_standard_check_config = {}
+    for check_name in beman_standard_yml:
+        check_config = CheckConfig(check_name)
+        for entry in beman_standard_yml[check_name]:
+            if "type" in entry:
+                check_config.type = entry["type"]
+            elif "value" in entry:  # e.g., "a string value"
+                check_config.value = entry["value"]
+            # e.g., ["a string value", "another string value"]
+            elif "values" in entry:
+                check_config.values = entry["values"]
+                literals = get_literals_from_values(entry["values"])
+                check_config.values_set = frozenset(literals)
+                # Match all the literals with a single scan - e.g., all the badges of README.BADGES.
+                check_config.values_matcher = MultiLiteralMatcher(literals)
+            elif "regex" in entry:
+                check_config.regex = compile_regexes(entry["regex"])
+            elif "file_name" in entry:
+                check_config.file_name = entry["file_name"]
+            elif "directory_name" in entry:
+                check_config.directory_name = entry["directory_name"]
+            elif "status_lines" in entry:
+                check_config.status_lines = list(entry["status_lines"])
+            elif "licenses" in entry:
+                check_config.licenses = parse_licenses(entry["licenses"])
+            elif "default_group" in entry:
+                check_config.default_group = entry["default_group"]
+            else:
+                raise ValueError(f"Invalid entry in Beman Standard YAML: {entry}")
+
+        beman_standard_check_config[check_name] = check_config
+
+    return beman_standard_check_config
+
+
+def get_literals_from_values(values):
+    """
+    Get the string literals from a "values" entry of the Beman Standard YAML configuration file.
+    e.g., ["a", "b"] -> ["a", "b"]
+    e.g., [{"category1": ["a", "b"]}, {"category2": ["c"]}] -> ["a", "b", "c"]
+    """
+    literals = []
+    for value in values:
+        if isinstance(value, dict):
+            for category_values in value.values():
+                literals.extend(get_literals_from_values(category_values))
+        elif isinstance(value, list):
+            literals.extend(get_literals_from_values(value))
+        else:
+            literals.append(str(value))
+    return literals
+
+
+# e.g., "<SPDX License Expression>"
+_regex_placeholder_regex = re.compile(r"<[^<>]*>")
+
+
+def compile_regexes(regex):
+    """
+    Compile a "regex" entry of the Beman Standard YAML configuration file (a template or a list of templates).
+    The text of a template is matched literally, placeholders become (non-greedy) capture groups.
+    e.g., "# SPDX-License-Identifier: <SPDX License Expression>" -> r"\\#\\ SPDX\\-License\\-Identifier:\\ (.+?)"
+
+    Templates which are only a placeholder (e.g., "<put a regex here if possible>") are not specified yet
+    and are skipped.
+    """
+    templates = regex if isinstance(regex, list) else [regex]
+    regexes = []
+    for template in templates:
+        template = str(template)
+        if _regex_placeholder_regex.fullmatch(template.strip()):
+            continue
+
+        parts = []
+        last_end = 0
+        for match in _regex_placeholder_regex.finditer(template):
+            parts.append(re.escape(template[last_end : match.start()]))
+            parts.append("(.+?)")
+            last_end = match.end()
+        parts.append(re.escape(template[last_end:]))
+        regexes.append(re.compile("".join(parts)))
+    return regexes
+
+
+def parse_licenses(licenses):
+    """
+    Parse a "licenses" entry of the Beman Standard YAML configuration file.
+    e.g., [{"mit": [{"spdx": "The MIT License"}, {"path": "docs/licenses/mit.txt"}]}]
+       -> [{"id": "mit", "spdx": "The MIT License", "path": "docs/licenses/mit.txt"}]
+    """
+    parsed_licenses = []
+    for licenses_entry in licenses:
+        for license_id, license_entries in licenses_entry.items():
+            parsed_license = {"id": license_id}
+            for license_entry in license_entries:
+                parsed_license.update(license_entry)
+            parsed_licenses.append(parsed_license)
+    return parsed_licenses
@@ -3,9 +3,16 @@
 
 import re
 
+# A snake_case name - e.g., "exemplar", "identity_direct_usage", "identity.test" (check is_snake_case()).
+SNAKE_CASE_PATTERN = r"[a-z0-9]+|[a-z0-9][a-z0-9_.]+[a-z0-9]"
+
+# The regexes are compiled once, not on each call.
+_snake_case_regex = re.compile(f"(?:{SNAKE_CASE_PATTERN})$")
+_trailing_digits_regex = re.compile(r".*[0-9]+$")
+
 
 def is_snake_case(name):
-    return re.match("(^[a-z0-9]+$)|(^[a-z0-9][a-z0-9_.]+[a-z0-9]$)", name)
+    return _snake_case_regex.match(name)
 
 
 def is_beman_snake_case(name):
@@ -17,7 +24,7 @@ def is_beman_snake_case(name):
     return (
         name[:6] == "beman."
         and is_snake_case(name[6:])
-        and not re.match(".*[0-9]+$", name[6:])
+        and not _trailing_digits_regex.match(name[6:])
     )
 
 
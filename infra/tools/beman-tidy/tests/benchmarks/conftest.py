@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.utils.synthetic_repo import create_synthetic_repo
+
+# The stored benchmark results (check --benchmark-update-baseline).
+BENCHMARK_BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Bump when the layout of the baseline file, the synthetic repositories or the calibration change.
+BENCHMARK_BASELINE_VERSION = 1
+
+# Benchmarks faster than this (in seconds) are never reported as regressions: timer noise dominates.
+BENCHMARK_MIN_WALL_TIME = 0.001
+
+# The results of the current session, printed by pytest_terminal_summary().
+_benchmark_results_key = pytest.StashKey[dict]()
+
+
+def measure(function, repeat):
+    """
+    Run function repeat times.
+    @return: The fastest wall time, in seconds - the least disturbed by the rest of the machine.
+    """
+    wall_times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        wall_times.append(time.perf_counter() - start_time)
+    return min(wall_times)
+
+
+def calibrate():
+    """
+    Time a fixed CPU workload (hashing and a Python loop), so the results are stored
+    relative to the speed of the machine and can be compared across machines.
+    """
+    data = b"beman-tidy" * 400_000
+
+    def workload():
+        hashlib.sha256(data).hexdigest()
+        sum(index * index for index in range(200_000))
+
+    return measure(workload, repeat=5)
+
+
+@pytest.fixture(scope="session")
+def benchmark_calibration():
+    return calibrate()
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request):
+    """
+    The baseline results: benchmark name -> wall time relative to the calibration.
+    With --benchmark-update-baseline, the results of the session are stored as the new baseline.
+    """
+    baseline = {}
+    if BENCHMARK_BASELINE_PATH.exists():
+        content = json.loads(BENCHMARK_BASELINE_PATH.read_text())
+        if content["version"] == BENCHMARK_BASELINE_VERSION:
+            baseline = content["results"]
+
+    yield baseline
+
+    if request.config.getoption("--benchmark-update-baseline"):
+        # Keep the baseline of the benchmarks not run by this session (e.g., -k README).
+        results = request.config.stash.get(_benchmark_results_key, {})
+        baseline.update(
+            {
+                name: round(result["relative_time"], 4)
+                for name, result in results.items()
+            }
+        )
+        with open(BENCHMARK_BASELINE_PATH, "w") as file:
+            json.dump(
+                {"version": BENCHMARK_BASELINE_VERSION, "results": baseline},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+            file.write("\n")
+
+
+@pytest.fixture(scope="session")
+def synthetic_repos(tmp_path_factory):
+    """
+    The synthetic repositories, generated on first use.
+    @return: A function size -> (path, dictionary relative path -> file size in bytes).
+    """
+    repos = {}
+
+    def get_synthetic_repo(size):
+        if size not in repos:
+            path = tmp_path_factory.mktemp(f"synthetic-{size}") / "exemplar"
+            path.mkdir()
+            repos[size] = (path, create_synthetic_repo(path, size))
+        return repos[size]
+
+    return get_synthetic_repo
+
+
+@pytest.fixture
+def run_benchmark(request, benchmark_calibration, benchmark_baseline):
+    """
+    Measure a benchmark and compare it against the baseline.
+    Usage: run_benchmark(name, function, input_size, repeat=5)
+    - input_size: the bytes processed by function, used to report the throughput (0 if unknown).
+    Fails if the benchmark is more than --benchmark-tolerance times slower than the baseline
+    (check BENCHMARK_MIN_WALL_TIME).
+    """
+
+    def run_benchmark_helper(name, function, input_size, repeat=5):
+        wall_time = measure(function, repeat)
+        relative_time = wall_time / benchmark_calibration
+        result = {
+            "wall_time": wall_time,
+            "throughput": input_size / wall_time / (1024 * 1024)
+            if input_size
+            else None,
+            "relative_time": relative_time,
+            "baseline": benchmark_baseline.get(name),
+        }
+        request.config.stash.setdefault(_benchmark_results_key, {})[name] = result
+
+        tolerance = request.config.getoption("--benchmark-tolerance")
+        if (
+            result["baseline"] is not None
+            and wall_time >= BENCHMARK_MIN_WALL_TIME
+            and not request.config.getoption("--benchmark-update-baseline")
+        ):
+            assert relative_time <= result["baseline"] * tolerance, (
+                f"{name} is {relative_time / result['baseline']:.2f}x slower than the baseline "
+                f"(tolerance: {tolerance}x)."
+            )
+        return result
+
+    return run_benchmark_helper
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Print the benchmark results: wall time, throughput and ratio to the baseline.
+    """
+    results = config.stash.get(_benchmark_results_key, {})
+    if not results:
+        return
+
+    name_width = max(len("Benchmark"), *(len(name) for name in results))
+    header = f"{'Benchmark':<{name_width}}  {'Wall (ms)':>10}  {'MiB/s':>10}  {'Baseline':>8}"
+    terminalreporter.section("beman-tidy benchmarks")
+    terminalreporter.write_line(header)
+    terminalreporter.write_line("-" * len(header))
+    for name, result in results.items():
+        baseline_ratio = (
+            f"{result['relative_time'] / result['baseline']:.2f}x"
+            if result["baseline"] is not None
+            else "-"
+        )
+        throughput = (
+            f"{result['throughput']:.1f}" if result["throughput"] is not None else "-"
+        )
+        terminalreporter.write_line(
+            f"{name:<{name_width}}  {result['wall_time'] * 1000:>10.2f}  "
+            f"{throughput:>10}  {baseline_ratio:>8}"
+        )
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import argparse
+import contextlib
+import io
+from fnmatch import fnmatchcase
+
+import pytest
+
+from beman_tidy.lib.checks.system.manifest import (
+    get_beman_standard_check_manifest,
+    load_beman_standard_checks,
+)
+from beman_tidy.lib.checks.beman_standard.license import (
+    APPROVED_LICENSE_FOOTER,
+    APPROVED_LICENSE_HEADER_PREFIX,
+    APPROVED_LICENSE_HEADER_SUFFIX,
+    LicenseApprovedCheck,
+)
+from beman_tidy.lib.pipeline import collect_checks_pipeline_summary
+from beman_tidy.lib.utils.git import get_repo_info
+from beman_tidy.lib.utils.name_rules import NameRuleEngine
+
+from tests.utils.conftest import mock_repo_info, mock_beman_standard_check_config  # noqa: F401
+from tests.utils.synthetic_repo import SYNTHETIC_REPO_SIZES
+
+# Run them with: uv run pytest tests/benchmarks --benchmark
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("size", SYNTHETIC_REPO_SIZES)
+@pytest.mark.parametrize("check_name", get_beman_standard_check_manifest())
+def test__benchmark__check(
+    check_name,
+    size,
+    synthetic_repos,
+    run_benchmark,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Benchmark a single check (pre_check() and check()) on a synthetic repository.
+    Each run uses a new check instance and new repository information (no warm caches).
+    The throughput is computed over the input files of the check (check the manifest input patterns).
+    """
+    path, file_sizes = synthetic_repos(size)
+    check_class = load_beman_standard_checks([check_name])[check_name]
+    input_patterns = get_beman_standard_check_manifest()[check_name]["input_patterns"]
+    input_size = sum(
+        file_size
+        for relative_path, file_size in file_sizes.items()
+        if any(fnmatchcase(relative_path, pattern) for pattern in input_patterns or [])
+    )
+
+    def run_check():
+        check_instance = check_class(
+            get_repo_info(path), mock_beman_standard_check_config
+        )
+        assert check_instance.pre_check() and check_instance.check()
+
+    run_benchmark(f"check[{size}-{check_name}]", run_check, input_size)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+@pytest.mark.parametrize("size", SYNTHETIC_REPO_SIZES)
+def test__benchmark__pipeline(
+    size,
+    jobs,
+    synthetic_repos,
+    run_benchmark,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Benchmark all the checks (end-to-end, as run by the CLI) on a synthetic repository.
+    """
+    path, file_sizes = synthetic_repos(size)
+
+    def run_pipeline():
+        args = argparse.Namespace(
+            repo_path=str(path),
+            repo_info=get_repo_info(path),
+            verbose=False,
+            fix_inplace=False,
+            jobs=jobs,
+            cache=False,
+            cache_dir=None,
+            changed_since=None,
+            staged=False,
+            include_untracked=True,
+            include_ignored=False,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = collect_checks_pipeline_summary(
+                list(mock_beman_standard_check_config),
+                args,
+                mock_beman_standard_check_config,
+            )
+        assert sum(summary["failed"].values()) == 0
+
+    run_benchmark(
+        f"pipeline[{size}-jobs{jobs}]", run_pipeline, sum(file_sizes.values())
+    )
+
+
+# Large and pathological LICENSE files (~16 MB each): a backtracking regex needs hundreds of ms to match them,
+# the structural matcher of LICENSE.APPROVED a few ms (check test__benchmark__license_approved()).
+_approved_license_header = (
+    APPROVED_LICENSE_HEADER_PREFIX + "MIT License" + APPROVED_LICENSE_HEADER_SUFFIX
+)
+LICENSE_APPROVED_BENCHMARK_CASES = {
+    # A huge license body (valid).
+    "large-body": (
+        True,
+        _approved_license_header + "x" * 16_000_000 + APPROVED_LICENSE_FOOTER,
+    ),
+    # Many almost complete footers (the last character is missing).
+    "many-footers": (
+        False,
+        _approved_license_header + "x" + APPROVED_LICENSE_FOOTER[:-1] * 25_000,
+    ),
+    # Many almost complete footer separators.
+    "many-separators": (
+        False,
+        _approved_license_header + "x" + ("\n\n" + "=" * 77 + "x") * 200_000,
+    ),
+    # Many headers.
+    "many-headers": (False, _approved_license_header * 140_000),
+}
+
+
+@pytest.mark.parametrize("case", LICENSE_APPROVED_BENCHMARK_CASES)
+def test__benchmark__license_approved(
+    case,
+    tmp_path,
+    run_benchmark,
+    mock_repo_info,  # noqa: F811
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Benchmark the matching of large and pathological LICENSE files: it must stay linear in the file size.
+    The file is read once, before the benchmark: only the matching is measured.
+    """
+    expected_result, content = LICENSE_APPROVED_BENCHMARK_CASES[case]
+    license_path = tmp_path / "LICENSE"
+    license_path.write_text(content)
+    check_instance = LicenseApprovedCheck(
+        mock_repo_info, mock_beman_standard_check_config
+    )
+    check_instance.path = license_path
+    assert check_instance.pre_check() is True
+    check_instance.read()
+
+    def run_check():
+        assert check_instance.check() is expected_result
+
+    run_benchmark(f"license_approved[{case}]", run_check, len(content))
+
+
+def test__benchmark__name_rules(run_benchmark):
+    """
+    Benchmark the file name rules on 100k paths: a single pass, two regex matches per path.
+    """
+    engine = NameRuleEngine(
+        {"headers": ["include/"], "tests": ["tests/"], "test_data": ["tests/data/"]},
+        {"headers": ["${snake_case}.hpp"], "tests": ["${snake_case}.test.cpp"]},
+        [".cpp", ".hpp"],
+    )
+    paths = [
+        f"include/beman/exemplar/group_{index // 100}/header_{index}.hpp"
+        for index in range(50_000)
+    ] + [
+        f"tests/beman/exemplar/group_{index // 100}/test_{index}.test.cpp"
+        for index in range(50_000)
+    ]
+
+    def run_engine():
+        assert engine.evaluate(paths) == (100_000, [])
+
+    run_benchmark("name_rules[100k]", run_engine, 0)
@@ -6,6 +6,30 @@ import os
 from pathlib import Path
 
 
+def pytest_addoption(parser):
+    """
+    Add custom options to pytest.
+    """
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run the benchmarks (tests/benchmarks/, skipped by default)",
+    )
+    parser.addoption(
+        "--benchmark-update-baseline",
+        action="store_true",
+        default=False,
+        help="store the benchmark results as the new baseline (tests/benchmarks/baseline.json)",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=2.0,
+        help="maximum slowdown of a benchmark compared to the baseline (default: 2.0, i.e. 2x slower)",
+    )
+
+
 def pytest_configure(config):
     """
     Add custom markers to pytest.
@@ -13,6 +37,21 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "use_test_repo: mark test to use test repository instead of exemplar"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a benchmark (only run with --benchmark)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip the benchmarks unless --benchmark is set.
+    """
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark (use --benchmark to run)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(autouse=True)
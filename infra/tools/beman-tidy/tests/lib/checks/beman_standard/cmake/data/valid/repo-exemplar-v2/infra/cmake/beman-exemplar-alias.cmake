@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+ADD_LIBRARY(beman::exemplar ALIAS beman.exemplar)
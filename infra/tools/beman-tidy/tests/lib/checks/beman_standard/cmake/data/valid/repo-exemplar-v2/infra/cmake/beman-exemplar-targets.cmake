@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+add_library(beman.exemplar INTERFACE)
+include(${CMAKE_CURRENT_LIST_DIR}/beman-exemplar-alias.cmake)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+from pathlib import Path
+
+from tests.utils.git_repo import create_git_repo
+from tests.utils.path_runners import (
+    run_check_for_each_path,
+)
+from tests.utils.pipeline_args import get_pipeline_args
+
+from beman_tidy.lib.pipeline import collect_checks_pipeline_summary
+from beman_tidy.lib.utils.git import get_repo_info
+
+# Actual tested checks.
+from beman_tidy.lib.checks.beman_standard.cmake import (
+    CMakeProjectNameCheck,
+    CMakeLibraryNameCheck,
+    CMakeLibraryAliasCheck,
+    CMakeSkipTestsCheck,
+    CMakeSkipExamplesCheck,
+)
+
+test_data_prefix = "tests/lib/checks/beman_standard/cmake/data"
+valid_prefix = f"{test_data_prefix}/valid"
+invalid_prefix = f"{test_data_prefix}/invalid"
+
+valid_cmake_paths = [
+    # exemplar/ top-level CMakeLists.txt.
+    Path(f"{valid_prefix}/CMakeLists-v1.txt"),
+    # Uppercase commands, bracket arguments and comments, compound conditions.
+    Path(f"{valid_prefix}/CMakeLists-v2.txt"),
+]
+
+
+def test__CMAKE_PROJECT_NAME__valid(repo_info, beman_standard_check_config):
+    """
+    Test that a valid CMake project name passes the check.
+    """
+    run_check_for_each_path(
+        True,
+        valid_cmake_paths,
+        CMakeProjectNameCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CMAKE_PROJECT_NAME__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that an invalid CMake project name fails the check.
+    """
+    invalid_cmake_paths = [
+        # project(beman_exemplar)
+        Path(f"{invalid_prefix}/invalid-project-name-v1.txt"),
+        # project(exemplar)
+        Path(f"{invalid_prefix}/invalid-project-name-v2.txt"),
+        # Missing project()
+        Path(f"{invalid_prefix}/invalid-project-name-v3.txt"),
+        # project(beman.exemplar) only in comments, project(beman.optional)
+        Path(f"{invalid_prefix}/invalid-project-name-v4.txt"),
+        # Not valid CMake code
+        Path(f"{invalid_prefix}/invalid-syntax-v1.txt"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_cmake_paths,
+        CMakeProjectNameCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CMAKE_PROJECT_NAME__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+valid_repo_paths = [
+    # exemplar/ repo with the library in add_subdirectory(src/beman/exemplar).
+    Path(f"{valid_prefix}/repo-exemplar-v1/"),
+    # exemplar/ repo with the library in a CMAKE_MODULE_PATH module and a nested include().
+    Path(f"{valid_prefix}/repo-exemplar-v2/"),
+]
+
+
+def test__CMAKE_LIBRARY_NAME__valid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMake project with the library target beman.exemplar passes the check.
+    """
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        CMakeLibraryNameCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CMAKE_LIBRARY_NAME__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMake project without the library target beman.exemplar fails the check.
+    """
+    invalid_repo_paths = [
+        # add_library(beman_exemplar)
+        Path(f"{invalid_prefix}/repo-exemplar-v1/"),
+        # add_library(beman.exemplar) in a listfile not included by the project.
+        Path(f"{invalid_prefix}/repo-exemplar-v2/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        CMakeLibraryNameCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CMAKE_LIBRARY_NAME__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__CMAKE_LIBRARY_ALIAS__valid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMake project with the alias target beman::exemplar passes the check.
+    """
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        CMakeLibraryAliasCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CMAKE_LIBRARY_ALIAS__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMake project without a valid alias target beman::exemplar fails the check.
+    """
+    invalid_repo_paths = [
+        # add_library(beman::exemplar ALIAS beman_exemplar)
+        Path(f"{invalid_prefix}/repo-exemplar-v1/"),
+        # add_library(beman::exemplar ...) in a listfile not included by the project.
+        Path(f"{invalid_prefix}/repo-exemplar-v2/"),
+        # add_library(beman::identity ALIAS beman.exemplar)
+        Path(f"{invalid_prefix}/repo-exemplar-v3/"),
+        # add_library(beman::exemplar ALIAS beman.exemplar.detail)
+        Path(f"{invalid_prefix}/repo-exemplar-v4/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        CMakeLibraryAliasCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CMAKE_LIBRARY_ALIAS__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__CMAKE_SKIP_TESTS__valid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMakeLists.txt with the BEMAN_EXEMPLAR_BUILD_TESTS option passes the check.
+    """
+    run_check_for_each_path(
+        True,
+        valid_cmake_paths,
+        CMakeSkipTestsCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CMAKE_SKIP_TESTS__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMakeLists.txt without a used BEMAN_EXEMPLAR_BUILD_TESTS option fails the check.
+    """
+    invalid_cmake_paths = [
+        # Missing option()
+        Path(f"{invalid_prefix}/invalid-skip-v1.txt"),
+        # option() never used in an if()
+        Path(f"{invalid_prefix}/invalid-skip-v2.txt"),
+        # option(EXEMPLAR_BUILD_TESTS) - missing BEMAN_ prefix
+        Path(f"{invalid_prefix}/invalid-skip-v3.txt"),
+        # Not valid CMake code
+        Path(f"{invalid_prefix}/invalid-syntax-v1.txt"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_cmake_paths,
+        CMakeSkipTestsCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CMAKE_SKIP_TESTS__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__CMAKE_SKIP_EXAMPLES__valid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMakeLists.txt with the BEMAN_EXEMPLAR_BUILD_EXAMPLES option passes the check.
+    """
+    run_check_for_each_path(
+        True,
+        valid_cmake_paths,
+        CMakeSkipExamplesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CMAKE_SKIP_EXAMPLES__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that a CMakeLists.txt without a used BEMAN_EXEMPLAR_BUILD_EXAMPLES option fails the check.
+    """
+    invalid_cmake_paths = [
+        # Missing option()
+        Path(f"{invalid_prefix}/invalid-skip-v1.txt"),
+        # option() never used in an if()
+        Path(f"{invalid_prefix}/invalid-skip-v2.txt"),
+        # option(BEMAN_EXEMPLAR_BUILD_EXAMPLE) - singular
+        Path(f"{invalid_prefix}/invalid-skip-v3.txt"),
+        # Not valid CMake code
+        Path(f"{invalid_prefix}/invalid-syntax-v1.txt"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_cmake_paths,
+        CMakeSkipExamplesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CMAKE_SKIP_EXAMPLES__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test__CMAKE_LIBRARY_NAME__parse_errors_logged_once(
+    tmp_path,
+    capsys,
+    cache,
+    beman_standard_check_config,
+):
+    """
+    Test that each listfile of the include graph that cannot be parsed is reported exactly once per check,
+    with or without the result cache (the pipeline also reads the check inputs).
+    """
+    create_git_repo(tmp_path)
+    (tmp_path / "CMakeLists.txt").write_text(
+        "project(beman.exemplar)\nadd_subdirectory(src/beman/exemplar)\n"
+    )
+    (tmp_path / "src/beman/exemplar").mkdir(parents=True)
+    (tmp_path / "src/beman/exemplar/CMakeLists.txt").write_text(
+        "add_library(beman.exemplar\n"
+    )
+
+    checks = ["CMAKE.LIBRARY_NAME", "CMAKE.LIBRARY_ALIAS"]
+    args = get_pipeline_args(
+        str(tmp_path),
+        repo_info=get_repo_info(str(tmp_path)),
+        verbose=True,
+        cache=cache,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    # The second run replays the cached diagnostics (--cache).
+    for _ in range(2 if cache else 1):
+        collect_checks_pipeline_summary(checks, args, beman_standard_check_config)
+        output = capsys.readouterr().out
+        for check_name in checks:
+            assert (
+                len(
+                    [
+                        line
+                        for line in output.splitlines()
+                        if f"[{check_name:<25}]: Cannot parse the file" in line
+                    ]
+                )
+                == 1
+            )
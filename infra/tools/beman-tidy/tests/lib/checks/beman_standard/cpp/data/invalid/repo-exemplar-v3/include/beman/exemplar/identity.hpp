@@ -0,0 +1,9 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+// namespace beman::exemplar {
+#define BEMAN_EXEMPLAR_NAMESPACE namespace beman::exemplar {
+constexpr const char* name = "namespace beman::exemplar {";
+
+struct identity {};
@@ -0,0 +1,7 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+namespace beman::exemplar {
+struct identity {};
+} // namespace beman::exemplar
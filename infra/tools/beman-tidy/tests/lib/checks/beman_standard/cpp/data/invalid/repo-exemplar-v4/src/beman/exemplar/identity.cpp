@@ -0,0 +1,7 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include <beman/exemplar/identity.hpp>
+
+namespace beman::optional {
+int answer() { return 42; }
+} // namespace beman::optional
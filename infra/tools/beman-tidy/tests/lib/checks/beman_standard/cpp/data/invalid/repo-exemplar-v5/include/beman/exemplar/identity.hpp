@@ -0,0 +1,25 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP
+#define BEMAN_EXEMPLAR_IDENTITY_HPP
+
+#include <functional>
+#include <utility>
+
+namespace beman::exemplar {
+
+// Flag forking: -DBEMAN_EXEMPLAR_USE_STD_IDENTITY changes the library.
+#ifdef BEMAN_EXEMPLAR_USE_STD_IDENTITY
+using identity = std::identity;
+#else
+struct identity {
+    template <class T>
+    constexpr T&& operator()(T&& t) const noexcept {
+        return std::forward<T>(t);
+    }
+};
+#endif
+
+} // namespace beman::exemplar
+
+#endif // BEMAN_EXEMPLAR_IDENTITY_HPP
@@ -0,0 +1,32 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP
+#define BEMAN_EXEMPLAR_IDENTITY_HPP
+
+#include <utility>
+
+// An overridable default: -DBEMAN_EXEMPLAR_USE_DEDUCING_THIS=1 changes the library.
+#ifndef BEMAN_EXEMPLAR_USE_DEDUCING_THIS
+#define BEMAN_EXEMPLAR_USE_DEDUCING_THIS 0
+#endif
+
+namespace beman::exemplar {
+
+struct identity {
+#if BEMAN_EXEMPLAR_USE_DEDUCING_THIS && \
+    defined(__cpp_explicit_this_parameter)
+    template <class Self, class T>
+    constexpr T&& operator()(this Self&&, T&& t) noexcept {
+        return std::forward<T>(t);
+    }
+#else
+    template <class T>
+    constexpr T&& operator()(T&& t) const noexcept {
+        return std::forward<T>(t);
+    }
+#endif
+};
+
+} // namespace beman::exemplar
+
+#endif // BEMAN_EXEMPLAR_IDENTITY_HPP
@@ -0,0 +1,20 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+// The include guard is not prefixed.
+#ifndef IDENTITY_HPP
+#define IDENTITY_HPP
+
+#include <utility>
+
+namespace beman::exemplar {
+
+struct identity {
+    template <class T>
+    constexpr T&& operator()(T&& t) const noexcept {
+        return std::forward<T>(t);
+    }
+};
+
+} // namespace beman::exemplar
+
+#endif // IDENTITY_HPP
@@ -0,0 +1,23 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP
+#define BEMAN_EXEMPLAR_IDENTITY_HPP
+
+#include <utility>
+
+// A macro of the library without the library prefix (never #undef'd).
+#define EXEMPLAR_CONSTEXPR \
+    constexpr
+
+namespace beman::exemplar {
+
+struct identity {
+    template <class T>
+    EXEMPLAR_CONSTEXPR T&& operator()(T&& t) const noexcept {
+        return std::forward<T>(t);
+    }
+};
+
+} // namespace beman::exemplar
+
+#endif // BEMAN_EXEMPLAR_IDENTITY_HPP
@@ -0,0 +1,8 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+// Identit (Latin-1 comment, not valid UTF-8).
+namespace exemplar {
+struct identity {};
+} // namespace exemplar
@@ -0,0 +1,9 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP
+#define BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP
+
+// Only macros: no namespace required.
+#define BEMAN_EXEMPLAR_VERSION 1
+
+#endif // BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP
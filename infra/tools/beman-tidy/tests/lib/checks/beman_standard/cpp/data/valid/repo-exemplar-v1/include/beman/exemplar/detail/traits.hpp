@@ -0,0 +1,12 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+namespace beman {
+namespace exemplar {
+namespace detail {
+template <class T>
+inline constexpr bool is_identity_v = false;
+} // namespace detail
+} // namespace exemplar
+} // namespace beman
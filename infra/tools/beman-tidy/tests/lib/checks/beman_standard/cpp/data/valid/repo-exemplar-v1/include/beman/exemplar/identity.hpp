@@ -0,0 +1,19 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP
+#define BEMAN_EXEMPLAR_IDENTITY_HPP
+
+#include <utility>
+
+namespace beman::exemplar {
+
+struct identity {
+    template <class T>
+    constexpr T&& operator()(T&& t) const noexcept {
+        return std::forward<T>(t);
+    }
+};
+
+} // namespace beman::exemplar
+
+#endif // BEMAN_EXEMPLAR_IDENTITY_HPP
@@ -0,0 +1,27 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+#include <functional>
+
+// namespace exemplar {
+/* namespace std { */
+#define BEMAN_EXEMPLAR_OPEN namespace exemplar {
+
+constexpr const char* description = "namespace exemplar {";
+constexpr const char* raw_description = R"doc(
+namespace exemplar { )" }
+)doc";
+constexpr char open_brace = '{';
+constexpr long big = 1'000'000;
+
+namespace beman::exemplar {
+inline namespace v1 {
+struct identity {};
+} // namespace v1
+} // namespace beman::exemplar
+
+template <>
+struct std::hash<beman::exemplar::identity> {
+    std::size_t operator()(const beman::exemplar::identity&) const noexcept { return 0; }
+};
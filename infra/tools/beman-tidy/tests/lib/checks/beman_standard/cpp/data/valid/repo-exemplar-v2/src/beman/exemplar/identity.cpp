@@ -0,0 +1,11 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include <beman/exemplar/identity.hpp>
+
+namespace {
+constexpr int unused = 0;
+} // namespace
+
+namespace beman::exemplar::detail {
+int answer() { return 42; }
+} // namespace beman::exemplar::detail
@@ -0,0 +1,26 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#if !defined(BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP)
+#define BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP
+
+#if __has_include(<version>)
+    #include <version>
+#endif
+
+// Feature-test macros of the implementation: not flags.
+#if defined(__cpp_lib_ranges) && \
+    __cpp_lib_ranges >= 201911L
+    #define BEMAN_EXEMPLAR_HAS_RANGES 1
+#else
+    #define BEMAN_EXEMPLAR_HAS_RANGES 0
+#endif
+
+#if defined(_MSC_VER) || defined(__clang__) /* #ifdef EXEMPLAR_IN_COMMENT */
+    #define BEMAN_EXEMPLAR_ALWAYS_INLINE inline
+#elif __has_cpp_attribute(gnu::always_inline)
+    #define BEMAN_EXEMPLAR_ALWAYS_INLINE [[gnu::always_inline]] inline
+#else
+    #define BEMAN_EXEMPLAR_ALWAYS_INLINE inline
+#endif
+
+#endif // !defined(BEMAN_EXEMPLAR_DETAIL_CONFIG_HPP)
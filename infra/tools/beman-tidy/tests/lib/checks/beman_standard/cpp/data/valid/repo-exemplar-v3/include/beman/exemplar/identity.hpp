@@ -0,0 +1,35 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP
+#define BEMAN_EXEMPLAR_IDENTITY_HPP
+
+#include <beman/exemplar/detail/config.hpp>
+
+#include <cassert>
+#include <utility>
+
+// A local helper macro: #undef'd at the end of the file.
+#define EXEMPLAR_FORWARD(x) \
+    std::forward<decltype(x)>(x)
+
+namespace beman::exemplar {
+
+struct identity {
+    template <class T>
+    BEMAN_EXEMPLAR_ALWAYS_INLINE constexpr T&& operator()(T&& t) const noexcept {
+#ifndef NDEBUG
+        assert(&t != nullptr);
+#endif
+        return EXEMPLAR_FORWARD(t);
+    }
+
+#if BEMAN_EXEMPLAR_HAS_RANGES
+    using is_transparent = void;
+#endif
+};
+
+} // namespace beman::exemplar
+
+#undef EXEMPLAR_FORWARD
+
+#endif // BEMAN_EXEMPLAR_IDENTITY_HPP
@@ -0,0 +1,8 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include <beman/exemplar/identity.hpp>
+
+// Not a directive: "#ifdef EXEMPLAR_IN_STRING".
+namespace beman::exemplar {
+const char* name() { return "#ifdef EXEMPLAR_IN_STRING"; }
+} // namespace beman::exemplar
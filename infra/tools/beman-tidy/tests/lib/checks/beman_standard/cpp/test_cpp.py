@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+from pathlib import Path
+
+from tests.utils.path_runners import (
+    run_check_for_each_path,
+)
+
+# Actual tested checks.
+from beman_tidy.lib.checks.beman_standard.cpp import (
+    CppNamespaceCheck,
+    CppNoFlagForkingCheck,
+    CppExtensionIdentifiersCheck,
+)
+
+test_data_prefix = "tests/lib/checks/beman_standard/cpp/data"
+valid_prefix = f"{test_data_prefix}/valid"
+invalid_prefix = f"{test_data_prefix}/invalid"
+
+
+def test__CPP_NAMESPACE__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with C++ files in the beman::exemplar namespace pass the check.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo with "namespace beman::exemplar", nested namespaces, a macros-only header
+        # and a source file without declarations.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo with other namespaces in comments, strings, raw strings and macros,
+        # an inline namespace, a std specialization and an anonymous namespace.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+        # exemplar/ repo with configuration macros and feature-test conditions.
+        Path(f"{valid_prefix}/repo-exemplar-v3/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        CppNamespaceCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CPP_NAMESPACE__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with C++ files outside the beman::exemplar namespace fail the check.
+    """
+    invalid_repo_paths = [
+        # namespace exemplar
+        Path(f"{invalid_prefix}/repo-exemplar-v1/"),
+        # Declarations in the global namespace.
+        Path(f"{invalid_prefix}/repo-exemplar-v2/"),
+        # namespace beman::exemplar only in a comment, a macro and a string.
+        Path(f"{invalid_prefix}/repo-exemplar-v3/"),
+        # namespace beman::optional in a source file.
+        Path(f"{invalid_prefix}/repo-exemplar-v4/"),
+        # namespace exemplar in a header which is not valid UTF-8 (a Latin-1 comment).
+        Path(f"{invalid_prefix}/repo-exemplar-v9/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        CppNamespaceCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CPP_NAMESPACE__report(tmp_path, repo_info, beman_standard_check_config):
+    """
+    Test that every non-compliant file is reported, with its line number, and that files outside
+    the library directories or with other extensions are not scanned.
+    """
+    files = {
+        "include/beman/exemplar/identity.hpp": "namespace beman::exemplar {}\n",
+        "include/beman/exemplar/detail/identity.hpp": "#pragma once\n\nnamespace exemplar::detail {}\n",
+        "src/beman/exemplar/identity.cpp": "int answer() { return 42; }\n",
+        "src/beman/exemplar/README.md": "namespace exemplar {}\n",
+        "tests/beman/exemplar/identity.test.cpp": "int main() {}\n",
+    }
+    for relative_path, content in files.items():
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text(content)
+    repo_info["top_level"] = tmp_path
+
+    check_instance = CppNamespaceCheck(repo_info, beman_standard_check_config)
+    assert check_instance.check() is False
+    assert check_instance.properties == {"scanned_files": 3}
+    assert check_instance.diagnostics[:-1] == [
+        "include/beman/exemplar/detail/identity.hpp:3: Invalid namespace 'exemplar::detail'. Expected: 'beman::exemplar'.",
+        "src/beman/exemplar/identity.cpp:1: Missing namespace. Expected: 'beman::exemplar'.",
+    ]
+    assert check_instance.diagnostics[-1].startswith(
+        "2 of 3 files do not declare their entities in the 'beman::exemplar' namespace."
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CPP_NAMESPACE__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__CPP_NO_FLAG_FORKING__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories without flag forking pass the check.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo with include guards only.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo without conditional directives.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+        # exemplar/ repo with conditions on the macros of the implementation (__has_include, __cpp_lib_ranges,
+        # _MSC_VER, NDEBUG) and of the library (BEMAN_EXEMPLAR_HAS_RANGES), with line continuations.
+        Path(f"{valid_prefix}/repo-exemplar-v3/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        CppNoFlagForkingCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CPP_NO_FLAG_FORKING__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with flag forking fail the check.
+    """
+    invalid_repo_paths = [
+        # #ifdef BEMAN_EXEMPLAR_USE_STD_IDENTITY, never defined by the library.
+        Path(f"{invalid_prefix}/repo-exemplar-v5/"),
+        # #if BEMAN_EXEMPLAR_USE_DEDUCING_THIS, an overridable default (#ifndef / #define).
+        Path(f"{invalid_prefix}/repo-exemplar-v6/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        CppNoFlagForkingCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CPP_NO_FLAG_FORKING__report(tmp_path, repo_info, beman_standard_check_config):
+    """
+    Test that every condition on a flag is reported, with its line number.
+    """
+    files = {
+        "include/beman/exemplar/identity.hpp": (
+            "#ifdef BEMAN_EXEMPLAR_USE_STD\n"
+            "#elif defined(__cpp_lib_ranges) || EXEMPLAR_LEGACY\n"
+            "#endif\n"
+        ),
+        "src/beman/exemplar/identity.cpp": (
+            "#if !defined(BEMAN_EXEMPLAR_USE_STD) \\\n"
+            "    && BEMAN_EXEMPLAR_VERSION > 1\n"
+            "#endif\n"
+            "#define BEMAN_EXEMPLAR_VERSION 2\n"
+        ),
+    }
+    for relative_path, content in files.items():
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text(content)
+    repo_info["top_level"] = tmp_path
+
+    check_instance = CppNoFlagForkingCheck(repo_info, beman_standard_check_config)
+    assert check_instance.check() is False
+    assert check_instance.properties == {"scanned_files": 2}
+    assert check_instance.diagnostics[:-1] == [
+        "include/beman/exemplar/identity.hpp:1: The code forks on the flag 'BEMAN_EXEMPLAR_USE_STD' (#ifdef).",
+        "include/beman/exemplar/identity.hpp:2: The code forks on the flag 'EXEMPLAR_LEGACY' (#elif).",
+        "src/beman/exemplar/identity.cpp:1: The code forks on the flag 'BEMAN_EXEMPLAR_USE_STD' (#if).",
+    ]
+    assert check_instance.diagnostics[-1].startswith(
+        "2 flags fork the code of the library: BEMAN_EXEMPLAR_USE_STD, EXEMPLAR_LEGACY."
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CPP_NO_FLAG_FORKING__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__CPP_EXTENSION_IDENTIFIERS__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with prefixed macros pass the check.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo with prefixed include guards and macros.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo with a prefixed macro.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+        # exemplar/ repo with a local helper macro (#undef'd after use).
+        Path(f"{valid_prefix}/repo-exemplar-v3/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        CppExtensionIdentifiersCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__CPP_EXTENSION_IDENTIFIERS__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with macros without the library prefix fail the check.
+    """
+    invalid_repo_paths = [
+        # Include guard IDENTITY_HPP.
+        Path(f"{invalid_prefix}/repo-exemplar-v7/"),
+        # Macro EXEMPLAR_CONSTEXPR, never #undef'd.
+        Path(f"{invalid_prefix}/repo-exemplar-v8/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        CppExtensionIdentifiersCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__CPP_EXTENSION_IDENTIFIERS__fix_inplace(
+    repo_info, beman_standard_check_config
+):
+    pass
@@ -0,0 +1,5 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include <beman/exemplar/identity.hpp>
+
+int main() { return 0; }
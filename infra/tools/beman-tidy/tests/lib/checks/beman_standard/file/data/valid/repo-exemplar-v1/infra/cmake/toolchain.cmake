@@ -0,0 +1 @@
+set(CMAKE_CXX_STANDARD 20)
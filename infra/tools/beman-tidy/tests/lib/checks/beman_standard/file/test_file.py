@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+from pathlib import Path
+
+from tests.utils.path_runners import (
+    run_check_for_each_path,
+)
+
+# Actual tested checks.
+from beman_tidy.lib.checks.beman_standard import file as file_checks
+from beman_tidy.lib.checks.beman_standard.file import (
+    LICENSE_ID_READ_SIZE,
+    FileCppNamesCheck,
+    FileTestNamesCheck,
+    FileLicenseIdCheck,
+)
+
+test_data_prefix = "tests/lib/checks/beman_standard/file/data"
+valid_prefix = f"{test_data_prefix}/valid"
+invalid_prefix = f"{test_data_prefix}/invalid"
+
+
+def test__FILE_CPP_NAMES__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with snake_case .hpp/.cpp files pass the check.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo with include/beman/exemplar/identity.hpp and src/beman/exemplar/identity.cpp.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo with tests/beman/exemplar/identity.test.cpp.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        FileCppNamesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__FILE_CPP_NAMES__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with invalid C++ file names fail the check.
+    """
+    invalid_repo_paths = [
+        # include/beman/exemplar/Identity.hpp: not snake_case.
+        Path(f"{invalid_prefix}/repo-exemplar-v6/"),
+        # include/beman/exemplar/identity.h: not .hpp.
+        Path(f"{invalid_prefix}/repo-exemplar-v7/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        FileCppNamesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__FILE_CPP_NAMES__report(tmp_path, repo_info, beman_standard_check_config):
+    """
+    Test that every invalid C++ file name is reported, and that other files are not checked.
+    """
+    for relative_path in [
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/detail/IdentityImpl.hpp",
+        "src/beman/exemplar/identity.cxx",
+        "tests/beman/exemplar/identity.test.cpp",
+        "examples/identity_direct_usage.cpp",
+        "examples/CMakeLists.txt",
+        "docs/Design.md",
+        "scripts/GenerateHeaders.cpp",
+    ]:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text("")
+    repo_info["top_level"] = tmp_path
+
+    check_instance = FileCppNamesCheck(repo_info, beman_standard_check_config)
+    assert check_instance.check() is False
+    assert check_instance.properties == {"scanned_files": 5}
+    assert check_instance.diagnostics[:-1] == [
+        "include/beman/exemplar/detail/IdentityImpl.hpp: Invalid file name. Expected: '${snake_case}.hpp'.",
+        "src/beman/exemplar/identity.cxx: Invalid file name. Expected: '${snake_case}.cpp' or '${snake_case}.hpp'.",
+    ]
+    assert check_instance.diagnostics[-1].startswith(
+        "2 of 5 files have an invalid name."
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__FILE_CPP_NAMES__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__FILE_TEST_NAMES__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with ${snake_case}.test.cpp test files pass the check.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo without tests.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo with tests/beman/exemplar/identity.test.cpp.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        FileTestNamesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__FILE_TEST_NAMES__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with invalid test file names fail the check.
+    """
+    invalid_repo_paths = [
+        # tests/beman/exemplar/identity_test.cpp: not .test.cpp.
+        Path(f"{invalid_prefix}/repo-exemplar-v8/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        FileTestNamesCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__FILE_TEST_NAMES__fix_inplace(repo_info, beman_standard_check_config):
+    pass
+
+
+def test__FILE_LICENSE_ID__valid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with valid SPDX license identifiers.
+    """
+    valid_repo_paths = [
+        # exemplar/ repo with all the comment styles, a shebang, a multi-line HTML comment,
+        # an empty file, a vendored directory and a not scanned file.
+        Path(f"{valid_prefix}/repo-exemplar-v1/"),
+        # exemplar/ repo with a single-line HTML comment after the README.md title.
+        Path(f"{valid_prefix}/repo-exemplar-v2/"),
+    ]
+
+    run_check_for_each_path(
+        True,
+        valid_repo_paths,
+        FileLicenseIdCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__FILE_LICENSE_ID__invalid(repo_info, beman_standard_check_config):
+    """
+    Test that repositories with invalid SPDX license identifiers.
+    """
+    invalid_repo_paths = [
+        # Missing SPDX license identifier in a header.
+        Path(f"{invalid_prefix}/repo-exemplar-v1/"),
+        # Wrong comment style in a source file (# instead of //).
+        Path(f"{invalid_prefix}/repo-exemplar-v2/"),
+        # SPDX license identifier after the first 10 lines.
+        Path(f"{invalid_prefix}/repo-exemplar-v3/"),
+        # Missing SPDX license expression.
+        Path(f"{invalid_prefix}/repo-exemplar-v4/"),
+        # SPDX license identifier outside of an HTML comment in README.md.
+        Path(f"{invalid_prefix}/repo-exemplar-v5/"),
+    ]
+
+    run_check_for_each_path(
+        False,
+        invalid_repo_paths,
+        FileLicenseIdCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
+def test__FILE_LICENSE_ID__report(tmp_path, repo_info, beman_standard_check_config):
+    """
+    Test that every non-compliant file is reported, with its line number, and that binary files are skipped.
+    """
+    spdx = "SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception"
+    files = {
+        "CMakeLists.txt": f"# {spdx}\n",
+        "include/beman/exemplar/identity.hpp": "#pragma once\n",
+        "src/beman/exemplar/identity.cpp": f"\n\n/* {spdx} */\n",
+        "tests/beman/exemplar/CMakeLists.txt": "add_executable(test)\n",
+        "docs/logo.md": "\0binary",
+    }
+    for relative_path, content in files.items():
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text(content)
+    repo_info["top_level"] = tmp_path
+
+    check_instance = FileLicenseIdCheck(repo_info, beman_standard_check_config)
+    assert check_instance.check() is False
+    assert check_instance.properties == {"scanned_files": 5}
+    assert [
+        diagnostic.split(": ")[0] for diagnostic in check_instance.diagnostics[:-1]
+    ] == [
+        "include/beman/exemplar/identity.hpp:1",
+        "src/beman/exemplar/identity.cpp:3",
+        "tests/beman/exemplar/CMakeLists.txt:1",
+    ]
+    assert check_instance.diagnostics[-1].startswith(
+        "3 of 5 files do not start with a valid SPDX license identifier."
+    )
+
+    # --fix-inplace only adds guidance: the files are not scanned (and reported) again.
+    check_instance.fix()
+    assert len(check_instance.diagnostics) == 5
+    assert check_instance.diagnostics[-1].startswith(
+        "Please add the SPDX license identifier"
+    )
+
+
+def test__FILE_LICENSE_ID__bounded_read(
+    tmp_path, monkeypatch, repo_info, beman_standard_check_config
+):
+    """
+    Test that only the beginning of each file is read (at most LICENSE_ID_READ_SIZE bytes), whatever its size.
+    """
+    spdx = "// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception\n"
+    for index in range(300):
+        path = tmp_path / f"include/beman/exemplar/group_{index // 100}/{index}.hpp"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(spdx)
+    (tmp_path / "src/beman/exemplar").mkdir(parents=True)
+    (tmp_path / "src/beman/exemplar/large.cpp").write_text(
+        spdx + "x" * (100 * LICENSE_ID_READ_SIZE)
+    )
+    repo_info["top_level"] = tmp_path
+
+    bytes_read = {}
+
+    class CountedFile:
+        def __init__(self, path, *args, **kwargs):
+            self.path = str(path)
+            self.file = open(path, *args, **kwargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self.file.close()
+
+        def read(self, size=-1):
+            data = self.file.read(size)
+            bytes_read[self.path] = bytes_read.get(self.path, 0) + len(data)
+            return data
+
+    monkeypatch.setattr(file_checks, "open", CountedFile, raising=False)
+
+    check_instance = FileLicenseIdCheck(repo_info, beman_standard_check_config)
+    assert check_instance.check() is True
+    assert check_instance.properties == {"scanned_files": 301}
+    assert len(bytes_read) == 301
+    assert max(bytes_read.values()) == LICENSE_ID_READ_SIZE
+
+
+@pytest.mark.skip(reason="NOT implemented")
+def test__FILE_LICENSE_ID__fix_inplace(repo_info, beman_standard_check_config):
+    pass
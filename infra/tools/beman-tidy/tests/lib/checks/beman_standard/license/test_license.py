@@ -68,6 +68,30 @@ def test__LICENSE_APPROVED__invalid(repo_info, beman_standard_check_config):
     )
 
 
+def test__LICENSE_APPROVED__matched_license(repo_info, beman_standard_check_config):
+    """
+    Test that the matched approved license is reported - from the fingerprint of a reference file
+    or from the LICENSE header.
+    """
+    license_index = LicenseApprovedCheck(
+        repo_info, beman_standard_check_config
+    ).license_index
+    license_paths = {
+        Path(f"{valid_prefix}/valid-LICENSE-v1"): "apache-v2",
+        Path(f"{valid_prefix}/valid-LICENSE-v2"): "boost-v1",
+        Path(f"{valid_prefix}/valid-LICENSE-v3"): "mit",
+        Path(f"{valid_prefix}/valid-LICENSE-v4"): "apache-v2",
+        license_index.get("boost-v1")["path"]: "boost-v1",
+        license_index.get("mit")["path"]: "mit",
+    }
+
+    for license_path, license_id in license_paths.items():
+        check_instance = LicenseApprovedCheck(repo_info, beman_standard_check_config)
+        check_instance.path = license_path
+        assert check_instance.pre_check() and check_instance.check()
+        assert check_instance.properties == {"license": license_id}
+
+
 @pytest.mark.skip(reason="NOT implemented")
 def test__LICENSE_APPROVED__fix_inplace(repo_info, beman_standard_check_config):
     pass
@@ -111,6 +135,25 @@ def test__LICENSE_APACHE_LLVM__invalid(repo_info, beman_standard_check_config):
     )
 
 
+def test__LICENSE_APACHE_LLVM__line_endings(
+    tmp_path, repo_info, beman_standard_check_config
+):
+    """
+    Test that the reference LICENSE file with CRLF line endings and trailing whitespace passes the check.
+    """
+    content = Path(f"{valid_prefix}/valid-LICENSE-v4").read_text()
+    license_path = tmp_path / "LICENSE"
+    license_path.write_bytes(content.replace("\n", "  \r\n").encode())
+
+    run_check_for_each_path(
+        True,
+        [license_path],
+        LicenseApacheLLVMCheck,
+        repo_info,
+        beman_standard_check_config,
+    )
+
+
 @pytest.mark.skip(reason="NOT implemented")
 def test__LICENSE_APACHE_LLVM__fix_inplace(repo_info, beman_standard_check_config):
     pass
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import importlib
+
+from beman_tidy.lib.checks.system.manifest import (
+    build_beman_standard_check_manifest,
+    get_beman_standard_check_manifest,
+    load_beman_standard_checks,
+)
+from beman_tidy.lib.checks.system.registry import (
+    _beman_standard_check_inputs_registry,
+    get_beman_standard_check_name_by_class,
+)
+
+
+def test__manifest__in_sync():
+    """
+    Test that the static manifest matches the @register_beman_standard_check decorators.
+    Regenerate it with `python3 -m beman_tidy.lib.checks.system.manifest`.
+    """
+    assert get_beman_standard_check_manifest() == build_beman_standard_check_manifest()
+
+
+def test__manifest__registry():
+    """
+    Test that each manifest entry is registered by its module, with the same inputs.
+    """
+    manifest = get_beman_standard_check_manifest()
+    for check_name, entry in manifest.items():
+        importlib.import_module(entry["module"])
+        assert _beman_standard_check_inputs_registry[check_name] == (
+            entry["input_patterns"],
+            entry["repo_metadata"],
+        )
+
+
+def test__manifest__load_checks():
+    """
+    Test that only the implemented checks are loaded, in the given order.
+    """
+    checks = load_beman_standard_checks(
+        ["TOPLEVEL.README", "NOT.IMPLEMENTED", "README.TITLE"]
+    )
+
+    assert list(checks) == ["TOPLEVEL.README", "README.TITLE"]
+    for check_name, check_class in checks.items():
+        assert get_beman_standard_check_name_by_class(check_class) == check_name
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from beman_tidy.lib.checks.system.registry import (
+    get_beman_standard_checks_affected_by_paths,
+)
+
+# Register the tested checks.
+from beman_tidy.lib.checks.beman_standard import directory, readme, repository  # noqa: F401
+
+
+def test__registry__affected_checks():
+    """
+    Test that only the checks with matching input patterns are selected, in the given order.
+    """
+    check_names = [
+        "README.TITLE",
+        "DIRECTORY.SOURCES",
+        "REPOSITORY.CODEOWNERS",
+        "REPOSITORY.DEFAULT_BRANCH",
+        "NOT.IMPLEMENTED",
+    ]
+
+    assert get_beman_standard_checks_affected_by_paths(
+        check_names, ["README.md", "src/beman/exemplar/identity.cpp"]
+    ) == ["README.TITLE", "DIRECTORY.SOURCES", "REPOSITORY.DEFAULT_BRANCH"]
+
+
+def test__registry__affected_checks_repo_metadata():
+    """
+    Test that checks depending on repository metadata are always selected.
+    """
+    assert get_beman_standard_checks_affected_by_paths(
+        ["README.TITLE", "REPOSITORY.DEFAULT_BRANCH"], []
+    ) == ["REPOSITORY.DEFAULT_BRANCH"]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from beman_tidy.cli import read_repo_paths
+from beman_tidy.lib import batch
+from beman_tidy.lib.batch import (
+    print_batch_compliance_table,
+    run_batch_pipeline,
+)
+
+from tests.utils.conftest import mock_beman_standard_check_config  # noqa: F401
+from tests.utils.git_repo import create_git_repo
+from tests.utils.pipeline_args import get_pipeline_args
+
+
+def get_summary(passed_requirements, implemented_requirements):
+    """
+    Create the summary of a repository, as collected by the checks pipeline.
+    """
+    return {
+        "passed": {"REQUIREMENT": passed_requirements, "RECOMMENDATION": 0},
+        "failed": {
+            "REQUIREMENT": implemented_requirements - passed_requirements,
+            "RECOMMENDATION": 0,
+        },
+        "skipped": {"REQUIREMENT": 0, "RECOMMENDATION": 0},
+        "implemented": {"REQUIREMENT": implemented_requirements, "RECOMMENDATION": 2},
+        "all": {"REQUIREMENT": implemented_requirements, "RECOMMENDATION": 2},
+    }
+
+
+def test__batch__read_repo_paths_from_file(tmp_path):
+    """
+    Test that --repos-from reads one repository path per line, without empty lines and comments.
+    """
+    manifest_path = tmp_path / "repos.txt"
+    manifest_path.write_text(
+        "# Beman libraries\n/path/to/exemplar\n\n  /path/to/optional  \n# /path/to/skipped\n"
+    )
+    assert read_repo_paths(str(manifest_path)) == [
+        "/path/to/exemplar",
+        "/path/to/optional",
+    ]
+
+
+def test__batch__read_repo_paths_from_stdin(monkeypatch):
+    """
+    Test that --repos-from - reads the repository paths from stdin.
+    """
+    monkeypatch.setattr(sys, "stdin", io.StringIO("/path/to/exemplar\n# comment\n"))
+    assert read_repo_paths("-") == ["/path/to/exemplar"]
+
+
+def test__batch__compliance_table(capsys):
+    """
+    Test the aggregated compliance table: one row per repository, in the given order.
+    """
+    rows = [
+        ("exemplar", get_summary(4, 4), 0),
+        ("optional", get_summary(3, 4), 1),
+        ("missing", None, None),
+    ]
+    print_batch_compliance_table(rows, get_pipeline_args())
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Compliance summary:"
+    assert [line.split()[0] for line in lines[3:6]] == [
+        "exemplar",
+        "optional",
+        "missing",
+    ]
+    assert "100.00% (4/4)" in lines[3] and "PASSED" in lines[3]
+    assert " 75.00% (3/4)" in lines[4] and "FAILED (1 checks)" in lines[4]
+    assert "ERROR" in lines[5]
+    assert "1/3 repositories are compliant." in lines
+
+
+def test__batch__failing_repo(
+    monkeypatch,
+    tmp_path,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that an exception raised while checking a repository is reported as an error of this repository,
+    instead of aborting the whole batch.
+    """
+    create_git_repo(tmp_path)
+
+    def raise_error(*args, **kwargs):
+        raise ZeroDivisionError("division by zero")
+
+    monkeypatch.setattr(batch, "_batch_worker_state", {})
+    monkeypatch.setattr(batch, "collect_checks_pipeline_summary", raise_error)
+    batch._init_batch_worker(
+        ["TOPLEVEL.README"], get_pipeline_args(), mock_beman_standard_check_config
+    )
+
+    repo_path, output, reports, _, summary, failed_checks = batch._run_batch_repo(
+        str(tmp_path)
+    )
+    assert repo_path == str(tmp_path)
+    assert summary is None and failed_checks is None
+    assert "ZeroDivisionError" in output
+    assert [method for method, _ in reports] == ["report_error"]
+    assert "ZeroDivisionError" in reports[0][1][1]
+
+
+def test__batch__exit_code(
+    capsys,
+    tmp_path,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that the batch result is the number of non-compliant repositories: failed checks or errors.
+    """
+    compliant_path = tmp_path / "compliant"
+    compliant_path.mkdir()
+    create_git_repo(compliant_path)
+    non_compliant_path = tmp_path / "non_compliant"
+    non_compliant_path.mkdir()
+    create_git_repo(non_compliant_path)
+    (non_compliant_path / "README.md").unlink()
+    not_a_repo_path = tmp_path / "not_a_repo"
+    not_a_repo_path.mkdir()
+
+    repo_paths = [str(compliant_path), str(non_compliant_path), str(not_a_repo_path)]
+    failed_repos = run_batch_pipeline(
+        repo_paths,
+        ["TOPLEVEL.README"],
+        get_pipeline_args(jobs=2),
+        mock_beman_standard_check_config,
+    )
+    assert failed_repos == 2
+
+    output = capsys.readouterr().out
+    # The repositories are printed in the given order.
+    assert [line for line in output.splitlines() if line.startswith("==> ")] == [
+        f"==> {repo_path}" for repo_path in repo_paths
+    ]
+    assert "1/3 repositories are compliant." in output
+
+
+def test__batch__cli_exit_code(tmp_path):
+    """
+    Test the batch mode of the CLI: repositories read from stdin, exit code = non-compliant repositories.
+    """
+    compliant_path = tmp_path / "compliant"
+    compliant_path.mkdir()
+    create_git_repo(compliant_path)
+    not_a_repo_path = tmp_path / "not_a_repo"
+    not_a_repo_path.mkdir()
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "beman_tidy.cli",
+            "--repos-from",
+            "-",
+            "--checks",
+            "TOPLEVEL.README",
+        ],
+        input=f"{compliant_path}\n{not_a_repo_path}\n",
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent.parent)},
+    )
+    assert result.returncode == 1, result.stdout + result.stderr
+    assert "1/2 repositories are compliant." in result.stdout
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from beman_tidy.lib.pipeline import run_checks_pipeline
+from beman_tidy.lib.reporters import BufferedReporter
+from beman_tidy.lib.utils.git import get_repo_info
+
+from tests.utils.conftest import mock_beman_standard_check_config  # noqa: F401
+from tests.utils.git_repo import create_git_repo
+from tests.utils.pipeline_args import get_pipeline_args
+
+
+def test__pipeline__parallel_run_same_as_serial(
+    tmp_path,
+    capsys,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that running the checks in parallel (--jobs 8) prints the same output (in the same order),
+    collects the same summary and returns the same exit code as a serial run (--jobs 1).
+    """
+    create_git_repo(tmp_path)
+    for relative_path, content in {
+        "CMakeLists.txt": "project(beman.exemplar)\nadd_library(beman.exemplar)\n",
+        "LICENSE": "Not an approved license.\n",
+        "include/beman/exemplar/identity.hpp": "namespace beman::exemplar {}\n",
+        "src/beman/exemplar/Identity.cpp": "namespace other {}\n",
+        "tests/beman/exemplar/identity.test.cpp": "int main() {}\n",
+    }.items():
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text(content)
+
+    def run_pipeline(jobs):
+        args = get_pipeline_args(
+            str(tmp_path),
+            repo_info=get_repo_info(str(tmp_path)),
+            verbose=True,
+            jobs=jobs,
+        )
+        reporter = BufferedReporter()
+        failed_checks = run_checks_pipeline(
+            list(mock_beman_standard_check_config),
+            args,
+            mock_beman_standard_check_config,
+            reporter,
+        )
+        summaries = [
+            arguments
+            for method, arguments in reporter.reports
+            if method == "report_summary"
+        ]
+        return capsys.readouterr().out, summaries, failed_checks
+
+    serial_output, serial_summaries, serial_failed_checks = run_pipeline(jobs=1)
+    parallel_output, parallel_summaries, parallel_failed_checks = run_pipeline(jobs=8)
+
+    # Some checks pass and some fail, so the comparison covers both outputs.
+    assert "PASSED" in serial_output and "FAILED" in serial_output
+    assert serial_failed_checks > 0
+    assert parallel_output == serial_output
+    assert parallel_summaries == serial_summaries
+    assert len(serial_summaries) == 1
+    assert parallel_failed_checks == serial_failed_checks
+
+
+def test__pipeline__changed_files_coverage(
+    tmp_path,
+    capsys,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that the coverage of a changed-files run (--staged) only counts the checks that were run.
+    """
+    repo = create_git_repo(tmp_path)
+
+    def run_pipeline(checks_to_run):
+        args = get_pipeline_args(
+            str(tmp_path), repo_info=get_repo_info(str(tmp_path)), staged=True
+        )
+        reporter = BufferedReporter()
+        run_checks_pipeline(
+            checks_to_run, args, mock_beman_standard_check_config, reporter
+        )
+        cnt_checks = len(
+            [method for method, _ in reporter.reports if method == "report_check"]
+        )
+        summary = next(
+            arguments[1]
+            for method, arguments in reporter.reports
+            if method == "report_summary"
+        )
+        return capsys.readouterr().out, cnt_checks, summary
+
+    # Only the checks of README.md (and of the repository metadata) run.
+    (tmp_path / "README.md").write_text("# beman.exemplar: A Beman Library\n")
+    repo.index.add(["README.md"])
+    output, cnt_checks, summary = run_pipeline(list(mock_beman_standard_check_config))
+    assert cnt_checks > 0
+    assert sum(summary["implemented"].values()) == cnt_checks
+    assert sum(summary["not_affected"].values()) > 0
+    assert "NOT AFFECTED" in output
+    assert f"/{summary['implemented']['REQUIREMENT']} checks passed)" in output
+
+    # No check is affected: the coverage is printed, without dividing by zero.
+    repo.index.commit("Update README.md")
+    (tmp_path / "notes.txt").write_text("notes\n")
+    repo.index.add(["notes.txt"])
+    output, cnt_checks, summary = run_pipeline(["TOPLEVEL.README"])
+    assert cnt_checks == 0
+    assert sum(summary["implemented"].values()) == 0
+    assert "(0/0 checks passed)" in output
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from beman_tidy.lib import profiler as profiler_module
+from beman_tidy.lib.checks.beman_standard.readme import ReadmeTitleCheck
+from beman_tidy.lib.profiler import (
+    Profiler,
+    print_profile_table,
+    profiler,
+    write_profile,
+    write_trace,
+)
+
+from tests.utils.conftest import mock_repo_info, mock_beman_standard_check_config  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _disable_profilers():
+    """
+    Disable the profilers enabled by a test: the audit hook stays installed in the pytest process,
+    but it is a no-op for the next tests.
+    """
+    yield
+    for enabled_profiler in list(profiler_module._enabled_profilers):
+        enabled_profiler.disable()
+
+
+def test__profiler__disabled():
+    """
+    Test that spans are no-ops until the profiler is enabled.
+    """
+    profiler = Profiler()
+    with profiler.span("README.TITLE", "check") as record:
+        assert record is None
+    assert profiler.records == []
+
+
+def test__profiler__io(tmp_path):
+    """
+    Test that the files opened (count and size) and subprocesses are accounted to the open spans.
+    """
+    path = tmp_path / "README.md"
+    path.write_text("x" * 1000)
+
+    profiler = Profiler()
+    profiler.enable()
+    with profiler.span("README.TITLE", "check", repository="exemplar"):
+        with profiler.span("nested", "check"):
+            path.read_text()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+    nested_record, record = profiler.pop_records()
+    assert profiler.records == []
+    assert (nested_record["files_opened"], nested_record["bytes_opened"]) == (1, 1000)
+    assert nested_record["subprocesses"] == 0
+    assert record["repository"] == "exemplar"
+    assert record["files_opened"] >= 1
+    assert record["bytes_opened"] >= 1000
+    assert record["subprocesses"] == 1
+    assert record["wall_time"] >= nested_record["wall_time"]
+
+
+def test__profiler__disable(tmp_path):
+    """
+    Test that the audit hook is a no-op once the profilers are disabled, even inside an open span.
+    """
+    path = tmp_path / "README.md"
+    path.write_text("x" * 1000)
+
+    profiler = Profiler()
+    profiler.enable()
+    with profiler.span("README.TITLE", "check") as record:
+        path.read_text()
+        profiler.disable()
+        path.read_text()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+    assert (record["files_opened"], record["bytes_opened"]) == (1, 1000)
+    assert record["subprocesses"] == 0
+    assert profiler_module._enabled_profilers == set()
+
+    with profiler.span("README.TITLE", "check") as record:
+        assert record is None
+
+
+def test__profiler__output(tmp_path, capsys):
+    """
+    Test the profile table (sorted by wall time) and the JSON file.
+    """
+    profiler = Profiler()
+    profiler.enable()
+    with profiler.span("config", "config"):
+        pass
+    profiler.records[0]["wall_time"] = 0.5
+    with profiler.span("README.TITLE", "check"):
+        pass
+
+    print_profile_table(profiler.records)
+    table = capsys.readouterr().out
+    assert table.index("config") < table.index("README.TITLE")
+
+    write_profile(profiler.records, tmp_path / "profile.json")
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert profile["version"] == 2
+    assert [record["name"] for record in profile["records"]] == [
+        "config",
+        "README.TITLE",
+    ]
+
+
+def test__profiler__check_method_spans(
+    tmp_path,
+    mock_repo_info,  # noqa: F811
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that the pre_check/check/fix methods of the checks are measured (a single span per method,
+    even if the override calls super()) - and only when the profiler is enabled.
+    """
+    (tmp_path / "README.md").write_text("# beman.exemplar: A Beman Library Exemplar\n")
+    mock_repo_info["top_level"] = tmp_path
+    check = ReadmeTitleCheck(mock_repo_info, mock_beman_standard_check_config)
+
+    assert check.pre_check() and check.check()
+    assert profiler.records == []
+
+    profiler.enable()
+    try:
+        assert check.pre_check() and check.check() and check.fix()
+    finally:
+        profiler.disable()
+    records = profiler.pop_records()
+
+    assert [record["name"] for record in records] == [
+        "README.TITLE:pre_check",
+        "README.TITLE:check",
+        "README.TITLE:fix",
+    ]
+    assert {record["category"] for record in records} == {"method"}
+    assert {record["repository"] for record in records} == {str(tmp_path)}
+
+
+def test__profiler__trace(tmp_path, capsys):
+    """
+    Test the Chrome trace events: a complete event per record (in microseconds) and the process names.
+    The check method spans are not printed in the profile table.
+    """
+    profiler = Profiler()
+    profiler.enable()
+    with profiler.span("README.TITLE", "check", repository="exemplar"):
+        with profiler.span("README.TITLE:check", "method", repository="exemplar"):
+            pass
+    worker_record = dict(profiler.records[0], pid=-1)
+    profiler.add_records([worker_record])
+
+    write_trace(profiler.records, tmp_path / "trace.json")
+    trace_events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+
+    process_names = {
+        event["pid"]: event["args"]["name"]
+        for event in trace_events
+        if event["ph"] == "M"
+    }
+    assert process_names == {-1: "beman-tidy worker", os.getpid(): "beman-tidy"}
+
+    check_event, method_event, _ = [
+        event for event in trace_events if event["ph"] == "X"
+    ]
+    assert (check_event["name"], check_event["cat"]) == ("README.TITLE", "check")
+    assert (method_event["name"], method_event["cat"]) == (
+        "README.TITLE:check",
+        "method",
+    )
+    assert check_event["ts"] <= method_event["ts"]
+    assert check_event["dur"] >= method_event["dur"]
+    assert check_event["args"]["repository"] == "exemplar"
+    assert "cpu_time" in check_event["args"]
+
+    print_profile_table(profiler.records)
+    assert "README.TITLE:check" not in capsys.readouterr().out
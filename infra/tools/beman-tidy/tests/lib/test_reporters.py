@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import io
+import json
+
+from beman_tidy.lib.reporters import (
+    BufferedReporter,
+    NdjsonReporter,
+    SarifReporter,
+    replay_reports,
+)
+
+from tests.utils.conftest import mock_beman_standard_check_config  # noqa: F401
+
+
+def get_check_result(name, check_type, verdict, diagnostics):
+    """
+    Create a check result, as reported by the checks pipeline.
+    """
+    return {
+        "repository": "/path/to/exemplar",
+        "name": name,
+        "type": check_type,
+        "verdict": verdict,
+        "duration": 0.001,
+        "cached": False,
+        "diagnostics": diagnostics,
+        "path": "/path/to/exemplar/README.md",
+    }
+
+
+def test__reporters__ndjson():
+    """
+    Test that each report is written as a JSON line, as soon as it is reported.
+    """
+    stream = io.StringIO()
+    reporter = NdjsonReporter(stream)
+
+    reporter.report_check(
+        get_check_result("README.TITLE", "RECOMMENDATION", "failed", ["Bad title."])
+    )
+    assert json.loads(stream.getvalue())["diagnostics"] == ["Bad title."]
+
+    reporter.report_error("/path/to/missing", "Not a Git repository.")
+    reporter.close()
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["event"] for event in events] == ["check", "error"]
+    assert events[0]["name"] == "README.TITLE"
+    assert events[0]["verdict"] == "failed"
+
+
+def test__reporters__sarif(mock_beman_standard_check_config):  # noqa: F811
+    """
+    Test that the streamed SARIF log is a valid JSON document with one result per check.
+    """
+    stream = io.StringIO()
+    reporter = SarifReporter(stream, mock_beman_standard_check_config)
+    reporter.report_check(
+        get_check_result("README.TITLE", "RECOMMENDATION", "failed", ["Bad title."])
+    )
+    reporter.report_check(
+        get_check_result("TOPLEVEL.README", "REQUIREMENT", "passed", [])
+    )
+    reporter.close()
+
+    sarif = json.loads(stream.getvalue())
+    assert sarif["version"] == "2.1.0"
+    run = sarif["runs"][0]
+    assert "README.TITLE" in [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+    assert [
+        (result["ruleId"], result["kind"], result["level"]) for result in run["results"]
+    ] == [
+        ("README.TITLE", "fail", "warning"),
+        ("TOPLEVEL.README", "pass", "none"),
+    ]
+    assert run["results"][0]["message"]["text"] == "Bad title."
+    assert run["invocations"][0]["executionSuccessful"]
+
+
+def test__reporters__buffered():
+    """
+    Test that buffered reports are replayed in order.
+    """
+    buffered_reporter = BufferedReporter()
+    buffered_reporter.report_check(
+        get_check_result("README.TITLE", "RECOMMENDATION", "passed", [])
+    )
+    buffered_reporter.report_error("/path/to/missing", "Not a Git repository.")
+
+    stream = io.StringIO()
+    replay_reports(buffered_reporter.reports, NdjsonReporter(stream))
+    assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()] == [
+        "check",
+        "error",
+    ]
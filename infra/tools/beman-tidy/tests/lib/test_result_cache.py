@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from beman_tidy.lib.result_cache import ResultCache
+from beman_tidy.lib.checks.beman_standard.readme import ReadmeTitleCheck
+from beman_tidy.lib.checks.beman_standard.repository import (
+    RepositoryDefaultBranchCheck,
+)
+
+from tests.utils.conftest import mock_repo_info, mock_beman_standard_check_config  # noqa: F401
+
+
+def test__result_cache__file_inputs(
+    mock_repo_info,  # noqa: F811
+    mock_beman_standard_check_config,  # noqa: F811
+    tmp_path,
+):
+    """
+    Test that a stored result is reused until the input file changes.
+    """
+    readme_path = tmp_path / "README.md"
+    readme_path.write_text("# beman.exemplar: A Beman Library Exemplar\n")
+
+    def make_check():
+        check_instance = ReadmeTitleCheck(
+            mock_repo_info, mock_beman_standard_check_config
+        )
+        check_instance.path = readme_path
+        return check_instance
+
+    cache = ResultCache(tmp_path / "cache")
+    check_instance = make_check()
+    key = cache.get_key(check_instance)
+    assert cache.get(check_instance, key) is None
+
+    check_instance.log("a diagnostic")
+    cache.put(check_instance, key, True)
+    cache.save()
+
+    # A new cache instance (e.g., the next run) reuses the stored result.
+    cache = ResultCache(tmp_path / "cache")
+    check_instance = make_check()
+    assert cache.get(check_instance, cache.get_key(check_instance)) == {
+        "key": key,
+        "passed": True,
+        "diagnostics": ["a diagnostic"],
+        "properties": {},
+    }
+
+    # Changed input: cache miss.
+    readme_path.write_text("# Invalid title\n")
+    check_instance = make_check()
+    assert cache.get(check_instance, cache.get_key(check_instance)) is None
+
+
+def test__result_cache__repo_info_inputs(
+    mock_repo_info,  # noqa: F811
+    mock_beman_standard_check_config,  # noqa: F811
+    tmp_path,
+):
+    """
+    Test that the repo_info fields declared as inputs are part of the cache key.
+    """
+    cache = ResultCache(tmp_path / "cache")
+    check_instance = RepositoryDefaultBranchCheck(
+        mock_repo_info, mock_beman_standard_check_config
+    )
+    key = cache.get_key(check_instance)
+    cache.put(check_instance, key, True)
+    assert cache.get(check_instance, key) is not None
+
+    mock_repo_info["default_branch"] = "master"
+    check_instance = RepositoryDefaultBranchCheck(
+        mock_repo_info, mock_beman_standard_check_config
+    )
+    assert cache.get_key(check_instance) != key
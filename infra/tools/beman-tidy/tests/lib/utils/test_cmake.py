@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import os
+
+import pytest
+
+from beman_tidy.lib.utils import cmake
+from beman_tidy.lib.utils.cmake import (
+    CMakeCommand,
+    CMakeParseError,
+    parse_cmake_listfile,
+)
+from beman_tidy.lib.utils.snapshot import RepositorySnapshot
+
+
+def test__cmake__commands():
+    """
+    Test the command invocations of a listfile: names, arguments and line numbers.
+    """
+    listfile = parse_cmake_listfile(
+        "# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception\n"
+        "#[[ A bracket comment\n"
+        "add_library(ignored) ]]\n"
+        "PROJECT(\n"
+        "    beman.exemplar # The library name\n"
+        '    DESCRIPTION "A \\"Beman\\" Library\\\n'
+        ' Exemplar"\n'
+        "    LANGUAGES CXX)\n"
+        'set(PATH [==[C:\\path]]]==] $<$<CONFIG:Debug>:/debug> a\\;b -DX="a b")\n'
+        "if((A OR B) AND NOT C)\n"
+        "endif ()\n"
+    )
+
+    assert listfile.commands == [
+        CMakeCommand(
+            "project",
+            [
+                "beman.exemplar",
+                "DESCRIPTION",
+                'A "Beman" Library Exemplar',
+                "LANGUAGES",
+                "CXX",
+            ],
+            4,
+            8,
+        ),
+        CMakeCommand(
+            "set",
+            ["PATH", "C:\\path]]", "$<$<CONFIG:Debug>:/debug>", "a\\;b", '-DX="a b"'],
+            9,
+            9,
+        ),
+        CMakeCommand("if", ["(", "A", "OR", "B", ")", "AND", "NOT", "C"], 10, 10),
+        CMakeCommand("endif", [], 11, 11),
+    ]
+
+
+def test__cmake__queries():
+    """
+    Test the queries of a listfile: commands by name (case-insensitive), options and conditions.
+    """
+    listfile = parse_cmake_listfile(
+        'option(BEMAN_EXEMPLAR_BUILD_TESTS "Enable building tests." ON)\n'
+        'OPTION(BEMAN_EXEMPLAR_BUILD_EXAMPLES "Enable building examples." ON)\n'
+        "add_library(beman.exemplar)\n"
+        "add_library(beman::exemplar ALIAS beman.exemplar)\n"
+        "if(BEMAN_EXEMPLAR_BUILD_TESTS)\n"
+        "elseif(BEMAN_EXEMPLAR_BUILD_EXAMPLES AND BUILD_TESTING)\n"
+        "endif()\n"
+    )
+
+    assert [command.arguments for command in listfile.find_commands("ADD_LIBRARY")] == [
+        ["beman.exemplar"],
+        ["beman::exemplar", "ALIAS", "beman.exemplar"],
+    ]
+    assert listfile.find_command("add_library").line == 3
+    assert listfile.find_command("add_executable") is None
+    assert [command.name for command in listfile.find_commands("if", "endif")] == [
+        "if",
+        "endif",
+    ]
+    assert listfile.get_option_names() == [
+        "BEMAN_EXEMPLAR_BUILD_TESTS",
+        "BEMAN_EXEMPLAR_BUILD_EXAMPLES",
+    ]
+    assert listfile.get_condition_variables() == {
+        "BEMAN_EXEMPLAR_BUILD_TESTS",
+        "BEMAN_EXEMPLAR_BUILD_EXAMPLES",
+        "AND",
+        "BUILD_TESTING",
+    }
+
+
+@pytest.mark.parametrize(
+    "content, line",
+    [
+        ("project(beman.exemplar\n\n", 1),
+        ("project beman.exemplar\n", 1),
+        ('\nset(A "unterminated)\n', 2),
+        ("\n\nset(A [[unterminated)\n", 3),
+        ("#[[ unterminated\n", 1),
+        ("set(A)\n)\n", 2),
+    ],
+)
+def test__cmake__parse_errors(content, line):
+    """
+    Test that invalid listfiles raise a CMakeParseError with the line number.
+    """
+    with pytest.raises(CMakeParseError) as error:
+        parse_cmake_listfile(content)
+    assert error.value.line == line
+
+
+def write_listfiles(top_level, listfiles):
+    for relative_path, content in listfiles.items():
+        path = top_level / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def test__cmake__include_graph(tmp_path):
+    """
+    Test the include graph of a project: add_subdirectory(), include() of files and modules, variables,
+    missing and not parsed listfiles.
+    """
+    write_listfiles(
+        tmp_path,
+        {
+            "CMakeLists.txt": (
+                "project(beman.exemplar)\n"
+                "include(CTest)\n"
+                'list(APPEND CMAKE_MODULE_PATH "${CMAKE_CURRENT_SOURCE_DIR}/infra/cmake")\n'
+                "add_subdirectory(src/beman/exemplar)\n"
+                "if(BEMAN_EXEMPLAR_BUILD_TESTS)\n"
+                "    add_subdirectory(${PROJECT_SOURCE_DIR}/tests/beman/exemplar)\n"
+                "endif()\n"
+                "add_subdirectory(examples)\n"
+                "add_subdirectory(${EXTERNAL_DIR}/external)\n"
+                "include(optional.cmake OPTIONAL)\n"
+            ),
+            "src/beman/exemplar/CMakeLists.txt": (
+                "include(beman-exemplar-targets)\ninclude(GNUInstallDirs)\n"
+            ),
+            "infra/cmake/beman-exemplar-targets.cmake": (
+                "add_library(beman.exemplar)\n"
+                "include(${CMAKE_CURRENT_LIST_DIR}/beman-exemplar-alias.cmake)\n"
+                "include(local.cmake)\n"
+            ),
+            "infra/cmake/beman-exemplar-alias.cmake": (
+                "add_library(beman::exemplar ALIAS beman.exemplar)\n"
+            ),
+            # Relative include() paths are relative to the current source directory.
+            "src/beman/exemplar/local.cmake": "add_library(beman.exemplar.local)\n",
+            "tests/beman/exemplar/CMakeLists.txt": "add_executable(test\n",
+        },
+    )
+    snapshot = RepositorySnapshot({"name": "exemplar", "top_level": tmp_path})
+
+    graph = snapshot.get_cmake_graph()
+    assert snapshot.get_cmake_graph() is graph
+
+    def relative_paths(paths):
+        return [os.path.relpath(path, tmp_path) for path in paths]
+
+    assert relative_paths(path for path, _ in graph.iter_listfiles()) == [
+        "CMakeLists.txt",
+        "src/beman/exemplar/CMakeLists.txt",
+        "infra/cmake/beman-exemplar-targets.cmake",
+        "infra/cmake/beman-exemplar-alias.cmake",
+        "src/beman/exemplar/local.cmake",
+    ]
+    assert [
+        (command.name, command.arguments[0])
+        for _, command in graph.find_commands("add_library")
+    ] == [
+        ("add_library", "beman.exemplar"),
+        ("add_library", "beman::exemplar"),
+        ("add_library", "beman.exemplar.local"),
+    ]
+    assert [inclusion.path is None for inclusion in graph.inclusions[graph.root]] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert relative_paths(graph.errors) == ["tests/beman/exemplar/CMakeLists.txt"]
+    assert graph.errors[str(tmp_path / "tests/beman/exemplar/CMakeLists.txt")].line == 1
+    assert relative_paths(inclusion.path for _, inclusion in graph.missing) == [
+        "examples/CMakeLists.txt"
+    ]
+    assert len(graph.get_paths()) == 7
+
+
+def test__cmake__include_graph_parse_once(tmp_path, monkeypatch):
+    """
+    Test that the listfiles of a graph are parsed once per distinct content, and that invalidate() rebuilds it.
+    """
+    cnt_tests = 200
+    write_listfiles(
+        tmp_path,
+        {
+            "CMakeLists.txt": "".join(
+                f"add_subdirectory(tests/test_{index})\n" for index in range(cnt_tests)
+            ),
+            **{
+                f"tests/test_{index}/CMakeLists.txt": "add_executable(test test.cpp)\n"
+                for index in range(cnt_tests)
+            },
+        },
+    )
+    calls = []
+
+    def parse_cmake_listfile_counted(text):
+        calls.append(text)
+        return parse_cmake_listfile(text)
+
+    monkeypatch.setattr(cmake, "parse_cmake_listfile", parse_cmake_listfile_counted)
+    snapshot = RepositorySnapshot({"name": "exemplar", "top_level": tmp_path})
+
+    graph = snapshot.get_cmake_graph()
+    assert len(graph.listfiles) == cnt_tests + 1
+    assert len(calls) == 2
+
+    (tmp_path / "tests/test_0/CMakeLists.txt").write_text("add_executable(test_0)\n")
+    snapshot.invalidate(tmp_path / "tests/test_0/CMakeLists.txt")
+    graph = snapshot.get_cmake_graph()
+    assert len(graph.find_commands("add_executable")) == cnt_tests
+    assert len(calls) == 3
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import contextvars
+import threading
+
+from beman_tidy.lib.utils.concurrency import map_batches
+
+_current_check = contextvars.ContextVar("current_check", default=None)
+
+
+def test__map_batches__order():
+    """
+    Test that the results are in the order of the items, whatever the batch size.
+    """
+    items = range(1000)
+    for batch_size in [1, 7, 64, 1000, 5000]:
+        assert map_batches(lambda item: item * item, iter(items), batch_size) == [
+            item * item for item in items
+        ]
+    assert map_batches(lambda item: item, []) == []
+
+
+def test__map_batches__context():
+    """
+    Test that the function runs on worker threads, in a copy of the caller's context.
+    """
+    _current_check.set("CPP.NAMESPACE")
+
+    results = map_batches(
+        lambda item: (_current_check.get(), threading.get_ident()), range(256), 16
+    )
+
+    assert {check for check, _ in results} == {"CPP.NAMESPACE"}
+    assert threading.get_ident() not in {thread for _, thread in results}
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+
+from beman_tidy.lib.utils.cpp import (
+    CppDirective,
+    CppNamespace,
+    get_cpp_condition_macros,
+    scan_cpp_directives,
+    scan_cpp_namespaces,
+)
+from beman_tidy.lib.utils.snapshot import RepositorySnapshot
+
+
+def test__cpp__namespaces():
+    """
+    Test the namespace declarations of a C++ file: qualified names, nesting and line numbers.
+    """
+    scan = scan_cpp_namespaces(
+        "namespace beman {\n"
+        "namespace exemplar::inline v1 {\n"
+        "namespace {\n"
+        "}\n"
+        "} // namespace exemplar::v1\n"
+        "} // namespace beman\n"
+        "namespace beman::exemplar::detail { struct tag {}; }\n"
+        "inline namespace [[deprecated]] v0 {}\n"
+        'extern "C" { namespace c {} }\n'
+    )
+
+    assert scan.namespaces == [
+        CppNamespace("beman", 1, False),
+        CppNamespace("beman::exemplar::v1", 2, True),
+        CppNamespace("beman::exemplar::v1::(anonymous)", 3, True),
+        CppNamespace("beman::exemplar::detail", 7, False),
+        CppNamespace("v0", 8, False),
+        CppNamespace("c", 9, False),
+    ]
+    assert scan.has_declarations is True
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "// namespace a {\n",
+        "/* namespace a {\n */\n",
+        "#define OPEN namespace a {\n",
+        "#define OPEN \\\n    namespace a {\n",
+        'const char* s = "namespace a { \\" namespace b {";\n',
+        'const char* s = R"x(namespace a { )" namespace b {)x";\n',
+        'const char* s = u8R"(namespace a {)";\n',
+        "char c = '\"'; namespace_ a{};\n",
+        "long n = 1'000'000; char c = '{';\n",
+        "using namespace std;\n",
+        "namespace fs = std::filesystem;\n",
+    ],
+)
+def test__cpp__not_namespaces(content):
+    """
+    Test that comments, literals, directives, using-directives and namespace aliases are not namespace declarations.
+    """
+    assert scan_cpp_namespaces(content).namespaces == []
+
+
+def test__cpp__has_declarations():
+    """
+    Test that files with only preprocessor directives and comments have no declarations.
+    """
+    assert (
+        scan_cpp_namespaces(
+            "#pragma once\n// A comment { ;\n#include <utility>\n#define X { ; }\n"
+        ).has_declarations
+        is False
+    )
+    assert scan_cpp_namespaces("#pragma once\nint x;\n").has_declarations is True
+
+
+def test__cpp__directives(tmp_path):
+    """
+    Test the preprocessor directives of a C++ file: line continuations, comments and line numbers.
+    """
+    path = tmp_path / "config.hpp"
+    path.write_bytes(
+        b"// #define IN_COMMENT\n"
+        b"#ifndef BEMAN_EXEMPLAR_CONFIG_HPP // include guard\n"
+        b"  #  define BEMAN_EXEMPLAR_CONFIG_HPP\n"
+        b"#if defined(A) && \\\r\n"
+        b"    B /* comment */ > 1\n"
+        b'const char* s = "#define IN_STRING";\n'
+        b"#endif\n"
+        b"#endif"
+    )
+
+    assert scan_cpp_directives(path) == [
+        CppDirective("ifndef", 2, "BEMAN_EXEMPLAR_CONFIG_HPP"),
+        CppDirective("define", 3, "BEMAN_EXEMPLAR_CONFIG_HPP"),
+        CppDirective("if", 4, "defined(A) && B > 1"),
+        CppDirective("endif", 7, ""),
+        CppDirective("endif", 8, ""),
+    ]
+
+
+def test__cpp__directives_empty(tmp_path):
+    """
+    Test that empty and missing files have no directives.
+    """
+    (tmp_path / "empty.hpp").write_bytes(b"")
+
+    assert scan_cpp_directives(tmp_path / "empty.hpp") == []
+    assert scan_cpp_directives(tmp_path / "missing.hpp") == []
+
+
+@pytest.mark.parametrize(
+    "directive, macros",
+    [
+        (CppDirective("ifdef", 1, "A"), ["A"]),
+        (CppDirective("elifndef", 1, "A"), ["A"]),
+        (CppDirective("if", 1, "defined(A) || !defined B"), ["A", "B"]),
+        (CppDirective("elif", 1, "A >= 202002L && 0x1F and not B"), ["A", "B"]),
+        (CppDirective("if", 1, "__has_include(<beman/x.hpp>) && X(1, Y)"), ["X", "Y"]),
+        (CppDirective("if", 1, "__has_cpp_attribute(nodiscard) || true"), []),
+        (CppDirective("define", 1, "A B"), []),
+    ],
+)
+def test__cpp__condition_macros(directive, macros):
+    """
+    Test the macros tested by the conditional directives.
+    """
+    assert get_cpp_condition_macros(directive) == macros
+
+
+def test__cpp__directive_index(tmp_path):
+    """
+    Test the directive index: guards, overridable defaults and local macros.
+    """
+    files = {
+        "include/beman/exemplar/identity.hpp": (
+            "#ifndef BEMAN_EXEMPLAR_IDENTITY_HPP\n"
+            "#define BEMAN_EXEMPLAR_IDENTITY_HPP\n"
+            "#if !defined(BEMAN_EXEMPLAR_USE_X)\n"
+            "#define BEMAN_EXEMPLAR_USE_X 0\n"
+            "#endif\n"
+            "#define HELPER(x) x\n"
+            "#undef HELPER\n"
+            "#if BEMAN_EXEMPLAR_USE_X\n"
+            "#endif\n"
+            "#endif\n"
+        ),
+        "src/beman/exemplar/identity.cpp": "#ifdef BEMAN_EXEMPLAR_IDENTITY_HPP\n#endif\n",
+        "tests/beman/exemplar/identity.test.cpp": "#ifdef TEST\n#endif\n",
+    }
+    for relative_path, content in files.items():
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text(content)
+    snapshot = RepositorySnapshot({"top_level": str(tmp_path)})
+
+    index = snapshot.get_cpp_directive_index(
+        ["include/beman/exemplar", "src/beman/exemplar"]
+    )
+    assert index.paths == [
+        "include/beman/exemplar/identity.hpp",
+        "src/beman/exemplar/identity.cpp",
+    ]
+    assert [
+        (d.name, d.line, d.has_value, d.overridable, d.local)
+        for d in index.iter_definitions()
+    ] == [
+        ("BEMAN_EXEMPLAR_IDENTITY_HPP", 2, False, False, False),
+        ("BEMAN_EXEMPLAR_USE_X", 4, True, True, False),
+        ("HELPER", 6, True, False, True),
+    ]
+    assert [(c.name, c.path, c.line) for c in index.iter_conditions()] == [
+        ("BEMAN_EXEMPLAR_USE_X", "include/beman/exemplar/identity.hpp", 8),
+        ("BEMAN_EXEMPLAR_IDENTITY_HPP", "src/beman/exemplar/identity.cpp", 1),
+    ]
+    assert index.is_defined("BEMAN_EXEMPLAR_IDENTITY_HPP") is True
+    assert index.is_defined("BEMAN_EXEMPLAR_USE_X") is False
+    assert index.is_defined("TEST") is False
+
+    # Built once per run.
+    assert (
+        snapshot.get_cpp_directive_index(
+            ["include/beman/exemplar", "src/beman/exemplar"]
+        )
+        is index
+    )
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+
+from beman_tidy.lib.utils.git import GIT_BACKENDS, get_repo_info
+
+from tests.utils.git_repo import create_git_repo
+
+
+@pytest.mark.parametrize("backend", GIT_BACKENDS)
+def test__repo_info__lazy(tmp_path, backend):
+    """
+    Test that the repository information is computed only on access.
+    """
+    path = tmp_path / "exemplar"
+    path.mkdir()
+    create_git_repo(path)
+    repo_info = get_repo_info(path, backend)
+
+    assert "status" in repo_info
+    assert "missing_field" not in repo_info
+    assert "status" not in repo_info._values
+
+    assert repo_info["name"] == "exemplar"
+    assert repo_info["top_level"] == path
+    assert "status" not in repo_info._values
+
+
+@pytest.mark.parametrize("backend", GIT_BACKENDS)
+def test__repo_info__prefetch(tmp_path, backend):
+    """
+    Test that prefetch() computes the same values as the on-demand access.
+    """
+    path = tmp_path / "exemplar"
+    path.mkdir()
+    repo = create_git_repo(path)
+
+    repo_info = get_repo_info(path, backend)
+    repo_info.prefetch(list(repo_info))
+    assert set(repo_info._values) == set(repo_info)
+
+    assert repo_info["remote_url"] == "https://github.com/bemanproject/exemplar.git"
+    assert repo_info["current_branch"] == "main"
+    assert repo_info["default_branch"] == "main"
+    assert repo_info["commit_hash"] == repo.head.commit.hexsha
+    assert repo_info["unstaged_changes"] == ""
+    assert dict(repo_info) == dict(get_repo_info(path, backend))
+
+
+def test__repo_info__backends_worktree(tmp_path):
+    """
+    Test that the native backend reads the same information as GitPython
+    in a linked worktree (.git file) with packed refs.
+    """
+    path = tmp_path / "exemplar"
+    path.mkdir()
+    repo = create_git_repo(path)
+    repo.git.pack_refs("--all")
+    worktree_path = tmp_path / "exemplar-feature"
+    repo.git.worktree("add", "-b", "feature/lazy", str(worktree_path))
+
+    for repo_path in [path, worktree_path, worktree_path / "README.md"]:
+        native_repo_info = dict(get_repo_info(repo_path, "native"))
+        assert native_repo_info == dict(get_repo_info(repo_path, "gitpython"))
+
+    assert native_repo_info["current_branch"] == "feature/lazy"
+    assert native_repo_info["name"] == "exemplar-feature"
+
+
+def test__repo_info__not_a_repository(tmp_path):
+    """
+    Test that a path outside a Git repository stops the program.
+    """
+    with pytest.raises(SystemExit):
+        get_repo_info(tmp_path, "native")
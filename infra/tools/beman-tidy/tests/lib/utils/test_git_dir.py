@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+
+from beman_tidy.lib.utils.git_dir import (
+    GitDirectory,
+    GitError,
+    NotAGitRepositoryError,
+    parse_git_config,
+)
+
+
+def test__git_config__parse():
+    """
+    Test that the Git config sections, subsections and values are parsed.
+    """
+    config = parse_git_config(
+        "\n".join(
+            [
+                "# comment",
+                "[core]",
+                "\tbare = false",
+                "\tfilemode",
+                '[remote "origin"]',
+                "\turl = https://github.com/bemanproject/exemplar.git ; comment",
+                "\tfetch = +refs/heads/*:refs/remotes/origin/*",
+                '[branch "feature/a"]',
+                '\tdescription = "a # quoted \\"value\\""',
+                "[Remote.upstream]",
+                "\tURL = git@github.com:bemanproject/exemplar.git",
+            ]
+        )
+    )
+
+    assert config[("core", None, "bare")] == "false"
+    assert config[("core", None, "filemode")] == "true"
+    assert (
+        config[("remote", "origin", "url")]
+        == "https://github.com/bemanproject/exemplar.git"
+    )
+    assert config[("branch", "feature/a", "description")] == 'a # quoted "value"'
+    assert (
+        config[("remote", "upstream", "url")]
+        == "git@github.com:bemanproject/exemplar.git"
+    )
+
+
+def test__git_directory__refs(tmp_path):
+    """
+    Test the loose, packed and symbolic refs of a fake .git directory with gitdir indirection.
+    """
+    common_dir = tmp_path / "main.git"
+    (common_dir / "refs" / "remotes" / "origin").mkdir(parents=True)
+    (common_dir / "refs" / "remotes" / "origin" / "HEAD").write_text(
+        "ref: refs/remotes/origin/main\n"
+    )
+    (common_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{'a' * 40} refs/heads/main\n"
+        f"{'b' * 40} refs/tags/v1.0\n"
+        f"^{'c' * 40}\n"
+    )
+    git_dir = common_dir / "worktrees" / "feature"
+    git_dir.mkdir(parents=True)
+    (git_dir / "commondir").write_text("../..\n")
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    worktree = tmp_path / "feature"
+    (worktree / "src").mkdir(parents=True)
+    (worktree / ".git").write_text("gitdir: ../main.git/worktrees/feature\n")
+
+    git_directory = GitDirectory.discover(worktree / "src")
+    assert git_directory.top_level == worktree.resolve()
+    assert git_directory.common_dir == common_dir.resolve()
+    assert git_directory.resolve_ref("HEAD") == "a" * 40
+    assert git_directory.resolve_ref("refs/tags/v1.0") == "b" * 40
+    assert (
+        git_directory.read_symbolic_ref("refs/remotes/origin/HEAD")
+        == "refs/remotes/origin/main"
+    )
+    with pytest.raises(GitError):
+        git_directory.resolve_ref("refs/heads/missing")
+    with pytest.raises(GitError):
+        git_directory.read_symbolic_ref("refs/heads/main")
+
+
+def test__git_directory__not_a_repository(tmp_path):
+    """
+    Test that discovery fails outside a Git working tree.
+    """
+    with pytest.raises(NotAGitRepositoryError):
+        GitDirectory.discover(tmp_path / "missing")
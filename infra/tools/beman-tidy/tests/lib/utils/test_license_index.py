@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from beman_tidy.lib.utils.license_index import get_license_digest, get_license_index
+
+from tests.utils.conftest import mock_beman_standard_check_config  # noqa: F401
+
+
+def test__license_digest__normalization(tmp_path):
+    """
+    Test that the fingerprint ignores line endings, trailing whitespace and leading/trailing blank lines
+    - but not the text itself.
+    """
+    contents = [
+        "Line 1\n\nLine 2\n",
+        "Line 1\r\n\r\nLine 2\r\n",
+        "\n\nLine 1  \n\t\nLine 2\t\n\n\n",
+        "Line 1\n\nLine 2",
+    ]
+    digests = set()
+    for index, content in enumerate(contents):
+        path = tmp_path / f"LICENSE-{index}"
+        path.write_bytes(content.encode())
+        digests.add(get_license_digest(path))
+    assert len(digests) == 1
+
+    for index, content in enumerate(["Line 1\nLine 2\n", "Line 1\n\n Line 2\n"]):
+        path = tmp_path / f"LICENSE-different-{index}"
+        path.write_text(content)
+        assert get_license_digest(path) not in digests
+
+    assert get_license_digest(tmp_path / "missing") is None
+
+
+def test__license_index__reference_licenses(
+    tmp_path,
+    mock_beman_standard_check_config,  # noqa: F811
+):
+    """
+    Test that each reference license of the Beman Standard YAML file is indexed (once per process).
+    """
+    licenses = mock_beman_standard_check_config["LICENSE.APPROVED"]["licenses"]
+    license_index = get_license_index(licenses)
+    assert get_license_index(licenses) is license_index
+
+    for license in licenses:
+        reference_license = license_index.get(license["id"])
+        assert reference_license["spdx"] == license["spdx"]
+        assert license_index.match_file(reference_license["path"]) is reference_license
+
+    # A huge file is never hashed.
+    path = tmp_path / "LICENSE"
+    path.write_text(" " * (license_index.max_file_size + 1))
+    assert license_index.match_file(path) is None
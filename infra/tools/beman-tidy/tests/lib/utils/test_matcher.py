@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import re
+
+from beman_tidy.lib.utils.matcher import MultiLiteralMatcher
+
+
+def count_occurrences(literal, text):
+    """
+    Reference implementation: count the (possibly overlapping) occurrences of literal in text.
+    """
+    return len(re.findall(f"(?={re.escape(literal)})", text))
+
+
+def test__matcher__non_overlapping_literals():
+    """
+    Test that disjoint literals are counted with a single regex scan.
+    """
+    literals = ["![Library Status](a.svg)", "![Standard Target](b.svg)", "Status:"]
+    matcher = MultiLiteralMatcher(literals)
+    text = "# Title\n![Library Status](a.svg) ![Library Status](a.svg)\nStatus: x\n"
+
+    assert not matcher.overlapping
+    assert matcher.count(text) == {
+        "![Library Status](a.svg)": 2,
+        "![Standard Target](b.svg)": 0,
+        "Status:": 1,
+    }
+
+
+def test__matcher__overlapping_literals():
+    """
+    Test that overlapping literals (prefixes, substrings, self-overlaps) are counted exactly.
+    """
+    literals = ["ab", "abc", "bc", "b", "aa", "c.d"]
+    matcher = MultiLiteralMatcher(literals)
+    text = "aaab abc xbcx aaaa c.d abcabc"
+
+    assert matcher.overlapping
+    assert matcher.count(text) == {
+        literal: count_occurrences(literal, text) for literal in literals
+    }
+
+
+def test__matcher__empty_inputs():
+    """
+    Test that empty texts and empty literals are handled.
+    """
+    matcher = MultiLiteralMatcher(["", "a"])
+
+    assert matcher.literals == ["a"]
+    assert matcher.count("") == {"a": 0}
+    assert matcher.count(None) == {"a": 0}
+    assert MultiLiteralMatcher([]).count("abc") == {}
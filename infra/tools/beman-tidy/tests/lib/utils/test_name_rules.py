@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import re
+
+import pytest
+
+from beman_tidy.lib.utils.name_rules import NameRuleEngine, compile_name_template
+
+DIRECTORY_CLASSES = {
+    "headers": ["include/"],
+    "tests": ["tests/"],
+    "test_data": ["tests/data/"],
+}
+
+
+@pytest.mark.parametrize(
+    "template, name, expected",
+    [
+        ("${snake_case}.test.cpp", "identity.test.cpp", True),
+        ("${snake_case}.test.cpp", "identity_test.cpp", False),
+        ("${snake_case}.test.cpp", "Identity.test.cpp", False),
+        ("${snake_case}.hpp", "identity_direct_usage.hpp", True),
+        ("${snake_case}.hpp", "_identity.hpp", False),
+        ("${snake_case}.hpp", "identity.hpp.in", False),
+        ("main.cpp", "main.cpp", True),
+        ("main.cpp", "mainXcpp", False),
+    ],
+)
+def test__name_rules__template(template, name, expected):
+    """
+    Test that the templates match their text literally and ${snake_case} as a snake_case name.
+    """
+    assert (re.fullmatch(compile_name_template(template), name) is not None) is expected
+
+
+def test__name_rules__unknown_variable():
+    """
+    Test that unknown template variables are rejected.
+    """
+    with pytest.raises(ValueError):
+        compile_name_template("${camel_case}.cpp")
+
+
+def test__name_rules__evaluate():
+    """
+    Test the directory classes (the longest prefix wins), the extensions and the combined templates.
+    """
+    engine = NameRuleEngine(
+        DIRECTORY_CLASSES,
+        {
+            "headers": ["${snake_case}.hpp"],
+            "tests": ["${snake_case}.test.cpp", "${snake_case}.hpp"],
+        },
+        [".cpp", ".hpp", ".h"],
+    )
+
+    assert engine.classify("include/beman/exemplar/identity.hpp") == "headers"
+    assert engine.classify("tests/beman/exemplar/identity.test.cpp") == "tests"
+    # The test data have no rules.
+    assert engine.classify("tests/data/Input.cpp") == "test_data"
+    assert engine.classify("src/beman/exemplar/identity.cpp") is None
+
+    cnt_checked, violations = engine.evaluate(
+        [
+            "include/beman/exemplar/identity.hpp",
+            "include/beman/exemplar/identity.h",
+            "include/beman/exemplar/CMakeLists.txt",
+            "tests/beman/exemplar/identity.test.cpp",
+            "tests/beman/exemplar/helpers.hpp",
+            "tests/beman/exemplar/IdentityTest.cpp",
+            "tests/data/Input.cpp",
+            "README.md",
+        ]
+    )
+    assert cnt_checked == 5
+    assert [
+        (violation.path, violation.directory_class, violation.templates)
+        for violation in violations
+    ] == [
+        ("include/beman/exemplar/identity.h", "headers", ["${snake_case}.hpp"]),
+        (
+            "tests/beman/exemplar/IdentityTest.cpp",
+            "tests",
+            ["${snake_case}.test.cpp", "${snake_case}.hpp"],
+        ),
+    ]
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from beman_tidy.lib.utils import repository_index
+from beman_tidy.lib.utils.git_dir import iter_git_files
+from beman_tidy.lib.utils.repository_index import RepositoryIndex
+from beman_tidy.lib.utils.snapshot import RepositorySnapshot
+
+from tests.utils.conftest import mock_repo_info  # noqa: F401
+from tests.utils.git_repo import create_git_repo
+
+
+def create_repo(path):
+    for relative_path in [
+        "README.md",
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/config.h",
+        "src/beman/exemplar/identity.cpp",
+        ".git/HEAD",
+    ]:
+        (path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (path / relative_path).write_text("content\n")
+    (path / "empty").mkdir()
+
+
+def test__repository_index__queries(tmp_path):
+    """
+    Test the single path queries of the index.
+    """
+    create_repo(tmp_path)
+    index = RepositoryIndex(tmp_path)
+
+    assert index.is_file(tmp_path / "README.md")
+    assert not index.is_dir(tmp_path / "README.md")
+    assert index.is_dir(tmp_path / "include/beman")
+    assert index.is_dir(tmp_path / "empty")
+    assert not index.exists(tmp_path / "missing")
+    assert not index.exists(tmp_path / "README.md/missing")
+
+    entry = index.get(tmp_path / "include/beman/exemplar/identity.hpp")
+    assert entry.relative_path == "include/beman/exemplar/identity.hpp"
+    assert entry.name == "identity.hpp"
+    assert entry.size == len("content\n")
+
+    assert [entry.name for entry in index.list_directory(tmp_path)] == [
+        ".git",
+        "README.md",
+        "empty",
+        "include",
+        "src",
+    ]
+    assert index.list_directory(tmp_path / "empty") == []
+    assert index.list_directory(tmp_path / "README.md") == []
+    assert index.list_directory(tmp_path / "missing") == []
+
+
+def test__repository_index__relative_paths(tmp_path, monkeypatch):
+    """
+    Test that relative paths are relative to the current directory (like pathlib).
+    """
+    create_repo(tmp_path)
+    monkeypatch.chdir(tmp_path.parent)
+    index = RepositoryIndex(tmp_path.name)
+
+    assert index.top_level == str(tmp_path)
+    assert index.is_file(os.path.join(tmp_path.name, "README.md"))
+    assert not index.exists("README.md")
+
+
+def test__repository_index__walk(tmp_path):
+    """
+    Test that the filesystem walk lists each entry once, in order, and skips .git.
+    """
+    create_repo(tmp_path)
+    index = RepositoryIndex(tmp_path, include_ignored=True)
+
+    assert [entry.relative_path for entry in index.walk()] == [
+        ".git",
+        "README.md",
+        "empty",
+        "include",
+        "src",
+        "include/beman",
+        "include/beman/exemplar",
+        "include/beman/exemplar/config.h",
+        "include/beman/exemplar/identity.hpp",
+        "src/beman",
+        "src/beman/exemplar",
+        "src/beman/exemplar/identity.cpp",
+    ]
+
+    assert [entry.relative_path for entry in index.iter_files()] == [
+        "README.md",
+        "include/beman/exemplar/config.h",
+        "include/beman/exemplar/identity.hpp",
+        "src/beman/exemplar/identity.cpp",
+    ]
+    assert [entry.relative_path for entry in index.iter_files("include", [".hpp"])] == [
+        "include/beman/exemplar/identity.hpp"
+    ]
+    assert list(index.iter_files("missing")) == []
+
+
+def test__repository_index__invalidate(mock_repo_info, tmp_path):  # noqa: F811
+    """
+    Test that the snapshot index lists each directory once, until invalidated.
+    """
+    create_repo(tmp_path)
+    mock_repo_info["top_level"] = tmp_path
+    snapshot = RepositorySnapshot(mock_repo_info)
+    index = snapshot.index
+    assert snapshot.index is index
+
+    assert not index.exists(tmp_path / "src/beman/exemplar/CMakeLists.txt")
+    (tmp_path / "src/beman/exemplar/CMakeLists.txt").write_text("content\n")
+    assert not index.exists(tmp_path / "src/beman/exemplar/CMakeLists.txt")
+
+    snapshot.invalidate(tmp_path / "src/beman/exemplar/CMakeLists.txt")
+    assert index.is_file(tmp_path / "src/beman/exemplar/CMakeLists.txt")
+
+
+def test__repository_index__git_traversal(tmp_path):
+    """
+    Test that the traversals only visit the files listed by git, unless include_ignored.
+    """
+    repo = create_git_repo(tmp_path)
+    for relative_path in [
+        ".gitignore",
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/deleted.hpp",
+        "include/beman/exemplar/untracked.hpp",
+        "build/_deps/dependency/dependency.hpp",
+    ]:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text("content\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    repo.index.add(
+        [
+            ".gitignore",
+            "include/beman/exemplar/identity.hpp",
+            "include/beman/exemplar/deleted.hpp",
+        ]
+    )
+    repo.index.commit("Add files")
+    (tmp_path / "include/beman/exemplar/deleted.hpp").unlink()
+
+    def get_files(index, *args):
+        return sorted(entry.relative_path for entry in index.iter_files(*args))
+
+    index = RepositoryIndex(tmp_path)
+    assert index.get_traversal_source() == "git"
+    assert get_files(index) == [
+        ".gitignore",
+        "README.md",
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/untracked.hpp",
+    ]
+    assert get_files(index, "include", [".hpp"]) == [
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/untracked.hpp",
+    ]
+    assert get_files(index, "build") == []
+    assert sorted(
+        entry.relative_path for entry in index.walk(tmp_path / "include")
+    ) == [
+        "include/beman",
+        "include/beman/exemplar",
+        "include/beman/exemplar/identity.hpp",
+        "include/beman/exemplar/untracked.hpp",
+    ]
+    # Single path queries still see the ignored files.
+    assert index.is_file(tmp_path / "build/_deps/dependency/dependency.hpp")
+
+    assert get_files(RepositoryIndex(tmp_path, include_untracked=False)) == [
+        ".gitignore",
+        "README.md",
+        "include/beman/exemplar/identity.hpp",
+    ]
+
+    index = RepositoryIndex(tmp_path, include_ignored=True)
+    assert index.get_traversal_source() == "filesystem"
+    assert "build/_deps/dependency/dependency.hpp" in get_files(index)
+
+
+def test__repository_index__git_traversal_fallback(tmp_path):
+    """
+    Test that the traversals walk the filesystem if git cannot list the files.
+    """
+    create_repo(tmp_path)
+    index = RepositoryIndex(tmp_path)
+
+    assert index.get_traversal_source() == "git"
+    assert len(list(index.iter_files())) == 4
+    assert index.get_traversal_source() == "filesystem"
+
+
+def test__repository_index__is_empty(tmp_path):
+    """
+    Test the emptiness probes: files are not read, directories are not listed, results are cached until invalidated.
+    """
+    create_repo(tmp_path)
+    (tmp_path / "empty.txt").write_text("")
+    large_directory = tmp_path / "large"
+    large_directory.mkdir()
+    for index in range(1000):
+        (large_directory / f"file_{index}.txt").write_text("content\n")
+    index = RepositoryIndex(tmp_path)
+
+    assert not index.is_empty(tmp_path / "README.md")
+    assert index.is_empty(tmp_path / "empty.txt")
+    assert index.is_empty(tmp_path / "empty")
+    assert index.is_empty(tmp_path / "missing")
+    assert not index.is_empty(large_directory)
+    assert str(large_directory) not in index._directories
+
+    # Cached for the run.
+    (tmp_path / "empty/file.txt").write_text("content\n")
+    assert index.is_empty(tmp_path / "empty")
+    index.invalidate(tmp_path / "empty/file.txt")
+    assert not index.is_empty(tmp_path / "empty")
+
+    # A listed directory is not probed again.
+    index.list_directory(tmp_path / "src")
+    assert not index.is_empty(tmp_path / "src")
+    assert str(tmp_path / "src") not in index._empty_directories
+
+
+def test__repository_index__git_files_listed_once(tmp_path, monkeypatch):
+    """
+    Test that concurrent (and abandoned) traversals share a single `git ls-files` call.
+    """
+    create_git_repo(tmp_path)
+    for index in range(100):
+        (tmp_path / f"src/file_{index}.cpp").parent.mkdir(exist_ok=True)
+        (tmp_path / f"src/file_{index}.cpp").write_text("content\n")
+
+    calls = []
+
+    def iter_git_files_counted(*args):
+        calls.append(args)
+        # Let the other traversals start while git is listing.
+        time.sleep(0.05)
+        yield from iter_git_files(*args)
+
+    monkeypatch.setattr(repository_index, "iter_git_files", iter_git_files_counted)
+    index = RepositoryIndex(tmp_path)
+
+    # An abandoned traversal still lists all the files.
+    next(index.iter_files())
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        cnt_files = list(
+            executor.map(lambda _: len(list(index.iter_files())), range(4))
+        )
+    assert cnt_files == [101] * 4
+    assert len(calls) == 1
+
+    # Concurrent traversals of a new index.
+    index = RepositoryIndex(tmp_path)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        cnt_files = list(
+            executor.map(lambda _: len(list(index.iter_files())), range(4))
+        )
+    assert cnt_files == [101] * 4
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import pytest
+
+from beman_tidy.lib.utils.snapshot import RepositorySnapshot
+
+from tests.utils.conftest import mock_repo_info  # noqa: F401
+
+
+def test__snapshot__repo_info(mock_repo_info):  # noqa: F811
+    """
+    Test that the snapshot behaves like the repo_info dictionary.
+    """
+    snapshot = RepositorySnapshot(mock_repo_info)
+
+    assert snapshot["name"] == "exemplar"
+    assert "default_branch" in snapshot
+    assert "missing_field" not in snapshot
+    assert snapshot.get("missing_field", "default") == "default"
+
+
+def test__snapshot__read_once(mock_repo_info, tmp_path):  # noqa: F811
+    """
+    Test that a file is read at most once and the content is shared.
+    """
+    path = tmp_path / "README.md"
+    path.write_text("# beman.exemplar: A Beman Library Exemplar\n\nBody\n")
+    snapshot = RepositorySnapshot(mock_repo_info)
+
+    assert snapshot.read_lines(path) == [
+        "# beman.exemplar: A Beman Library Exemplar\n",
+        "\n",
+        "Body\n",
+    ]
+
+    # Changes are not visible until the file is invalidated.
+    path.write_text("new content")
+    assert snapshot.read_text(path).startswith("# beman.exemplar")
+
+    snapshot.invalidate(path)
+    assert snapshot.read_text(path) == "new content"
+
+
+def test__snapshot__missing_file(mock_repo_info, tmp_path):  # noqa: F811
+    """
+    Test that a missing file is read as empty.
+    """
+    snapshot = RepositorySnapshot(mock_repo_info)
+
+    assert snapshot.read_text(tmp_path / "missing") == ""
+    assert snapshot.read_lines(tmp_path / "missing") == []
+
+
+def test__snapshot__parse_once(mock_repo_info, tmp_path):  # noqa: F811
+    """
+    Test that a file is parsed at most once per parser, including parse errors.
+    """
+    path = tmp_path / "CMakeLists.txt"
+    path.write_text("project(beman.exemplar)\n")
+    snapshot = RepositorySnapshot(mock_repo_info)
+    calls = []
+
+    def parser(text):
+        calls.append(text)
+        if not text.startswith("project"):
+            raise ValueError("invalid")
+        return text.split("(")[0]
+
+    assert snapshot.parse(path, parser) == "project"
+    assert snapshot.parse(str(path), parser) == "project"
+    assert len(calls) == 1
+
+    path.write_text("invalid content")
+    snapshot.invalidate(path)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            snapshot.parse(path, parser)
+    assert len(calls) == 2
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import json
+
+import pytest
+
+from beman_tidy.lib.utils import standard_config
+from beman_tidy.lib.utils.standard_config import (
+    CheckConfig,
+    compile_regexes,
+    get_beman_standard_config_path,
+    load_beman_standard_config,
+    parse_beman_standard_yml,
+)
+
+
+def test__standard_config__check_config():
+    """
+    Test that the compiled check config behaves like the former config dictionary.
+    """
+    beman_standard_check_config = load_beman_standard_config(cache=False)
+
+    readme_badges = beman_standard_check_config["README.BADGES"]
+    assert isinstance(readme_badges, CheckConfig)
+    assert readme_badges["type"] == "REQUIREMENT"
+    assert "values" in readme_badges
+    assert "value" not in readme_badges
+    assert readme_badges.get("value", "default") == "default"
+    assert len(readme_badges["values_set"]) == 6
+    with pytest.raises(KeyError):
+        readme_badges["missing_key"]
+
+    assert beman_standard_check_config["TOPLEVEL.CMAKE"]["value"] == "CMakeLists.txt"
+    assert beman_standard_check_config["LICENSE.APPROVED"]["licenses"][2] == {
+        "id": "mit",
+        "spdx": "The MIT License",
+        "path": "docs/licenses/mit.txt",
+    }
+
+
+def test__standard_config__regexes():
+    """
+    Test that regex templates are compiled and unspecified placeholders are skipped.
+    """
+    assert compile_regexes("<put a regex here if possible>") == []
+
+    regexes = compile_regexes(
+        [
+            "// SPDX-License-Identifier: <SPDX License Expression>",
+            "<!-- SPDX-License-Identifier: <SPDX License Expression> -->",
+        ]
+    )
+    assert regexes[0].fullmatch("// SPDX-License-Identifier: MIT").group(1) == "MIT"
+    assert (
+        regexes[1].fullmatch("<!-- SPDX-License-Identifier: BSL-1.0 -->").group(1)
+        == "BSL-1.0"
+    )
+    assert regexes[0].fullmatch("# SPDX-License-Identifier: MIT") is None
+
+
+def test__standard_config__cache(tmp_path, monkeypatch):
+    """
+    Test that a warm start loads the parsed YAML file from the cache (plain JSON), without parsing the YAML file,
+    and rebuilds the compiled config.
+    """
+    monkeypatch.setenv("BEMAN_TIDY_CACHE_DIR", str(tmp_path))
+    cold_config = load_beman_standard_config()
+    cache_paths = list(tmp_path.glob("*.json"))
+    assert len(cache_paths) == 1
+    assert json.loads(cache_paths[0].read_text()) == parse_beman_standard_yml(
+        get_beman_standard_config_path().read_bytes()
+    )
+
+    def fail(content):
+        raise AssertionError("The YAML file must not be parsed on a warm start.")
+
+    monkeypatch.setattr(standard_config, "parse_beman_standard_yml", fail)
+    warm_config = load_beman_standard_config()
+    assert warm_config == cold_config
+    assert repr(warm_config["README.BADGES"]) == repr(cold_config["README.BADGES"])
+    assert warm_config["README.BADGES"]["values_matcher"].count(
+        "![Standard Target](https://github.com/bemanproject/beman/blob/main/images/badges/cpp26.svg)"
+    )
+
+    # A corrupted cache is ignored (and replaced).
+    cache_paths[0].write_bytes(b"corrupted")
+    monkeypatch.setattr(
+        standard_config, "parse_beman_standard_yml", parse_beman_standard_yml
+    )
+    assert load_beman_standard_config(cache=True) == cold_config
+    assert json.loads(cache_paths[0].read_text()) is not None
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.utils.git_repo import create_git_repo
+
+# Import-time budget of `beman-tidy --checks TOPLEVEL.README` (all the beman_tidy imports),
+# measured with `python3 -X importtime`. Generous, so a noisy machine does not fail the test.
+IMPORT_TIME_BUDGET_US = 400_000
+
+
+def get_import_times(stderr):
+    """
+    Parse the output of `python3 -X importtime`.
+    @return: A list of (module, cumulative time in us, is top-level import).
+    """
+    import_times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header
+        import_times.append(
+            (module.strip(), int(cumulative), not module[1:].startswith(" "))
+        )
+    return import_times
+
+
+def test__cli__import_time_budget(tmp_path):
+    """
+    Test that running a single check imports only what it needs, within the import-time budget.
+    """
+    create_git_repo(tmp_path)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "beman_tidy.cli",
+            str(tmp_path),
+            "--checks",
+            "TOPLEVEL.README",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent)},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Summary" in result.stdout
+
+    import_times = get_import_times(result.stderr)
+    imported_modules = {module for module, _, _ in import_times}
+
+    # The unrelated check modules, GitPython and the batch mode are never imported.
+    for module in [
+        "beman_tidy.lib.checks.beman_standard.directory",
+        "beman_tidy.lib.checks.beman_standard.repository",
+        "beman_tidy.lib.batch",
+        "git",
+        "multiprocessing",
+    ]:
+        assert module not in imported_modules
+
+    beman_tidy_import_time = sum(
+        cumulative
+        for module, cumulative, top_level in import_times
+        if top_level and module.startswith("beman_tidy")
+    )
+    assert beman_tidy_import_time <= IMPORT_TIME_BUDGET_US
+
+
+def test__cli__format_ndjson(tmp_path):
+    """
+    Test that --format ndjson writes only JSON lines to stdout (the text output goes to stderr).
+    """
+    create_git_repo(tmp_path)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "beman_tidy.cli",
+            str(tmp_path),
+            "--checks",
+            "TOPLEVEL.README,TOPLEVEL.CMAKE",
+            "--format",
+            "ndjson",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent)},
+    )
+
+    events = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(event["event"], event.get("name")) for event in events] == [
+        ("check", "TOPLEVEL.README"),
+        ("check", "TOPLEVEL.CMAKE"),
+        ("summary", None),
+    ]
+    assert [event.get("verdict") for event in events[:2]] == ["passed", "failed"]
+    assert events[2]["failed_checks"] == result.returncode == 1
+    assert "Summary" in result.stderr
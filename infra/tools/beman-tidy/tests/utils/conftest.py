@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
 import pytest
-from beman_tidy.lib.utils.git import load_beman_standard_config
+from beman_tidy.lib.utils.standard_config import load_beman_standard_config
 
 
 @pytest.fixture
@@ -24,4 +24,4 @@ def mock_repo_info():
 def mock_beman_standard_check_config():
     """Parse the Beman Standard YAML file and return a dictionary of check configurations"""
 
-    return load_beman_standard_config()
+    return load_beman_standard_config(cache=False)
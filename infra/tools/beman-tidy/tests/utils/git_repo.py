@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from git import Repo
+
+
+def create_git_repo(path):
+    """
+    Create a git repository with one commit and an origin remote.
+    """
+    repo = Repo.init(path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "beman-tidy")
+        config.set_value("user", "email", "beman-tidy@example.com")
+    (path / "README.md").write_text("# beman.exemplar: A Beman Library Exemplar\n")
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
+    repo.create_remote("origin", "https://github.com/bemanproject/exemplar.git")
+    repo.git.update_ref("refs/remotes/origin/main", "HEAD")
+    repo.git.symbolic_ref("refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+    return repo
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import argparse
+
+
+def get_pipeline_args(repo_path=None, **overrides):
+    """
+    Create the CLI arguments of a checks pipeline run, with the CLI defaults.
+    e.g., get_pipeline_args("/path/to/exemplar", jobs=8, verbose=True)
+    """
+    args = argparse.Namespace(
+        repo_path=repo_path,
+        fix_inplace=False,
+        verbose=False,
+        require_all=False,
+        checks=None,
+        format="text",
+        jobs=1,
+        cache=False,
+        cache_dir=None,
+        git_backend="native",
+        changed_since=None,
+        staged=False,
+        include_untracked=True,
+        include_ignored=False,
+        profile=False,
+        profile_output=None,
+        trace=None,
+    )
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
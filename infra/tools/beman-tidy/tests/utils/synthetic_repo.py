@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import shutil
+from pathlib import Path
+
+from beman_tidy.lib.utils.standard_config import get_beman_standard_config_path
+
+from tests.utils.git_repo import create_git_repo
+
+# The synthetic repository sizes, from small (a typical Beman library) to huge.
+# - readme_size: size of README.md in bytes (a valid header followed by filler paragraphs).
+# - source_depth: depth of the src/beman/<name>/ tree (one sub-directory per level).
+# - cnt_headers: number of headers under include/beman/<name>/.
+# - cnt_cmake_files: number of CMakeLists.txt files (one per directory).
+SYNTHETIC_REPO_SIZES = {
+    "small": {
+        "readme_size": 8 * 1024,
+        "source_depth": 1,
+        "cnt_headers": 10,
+        "cnt_cmake_files": 4,
+    },
+    "medium": {
+        "readme_size": 256 * 1024,
+        "source_depth": 4,
+        "cnt_headers": 200,
+        "cnt_cmake_files": 20,
+    },
+    "large": {
+        "readme_size": 2 * 1024 * 1024,
+        "source_depth": 8,
+        "cnt_headers": 2000,
+        "cnt_cmake_files": 100,
+    },
+    "huge": {
+        "readme_size": 8 * 1024 * 1024,
+        "source_depth": 16,
+        "cnt_headers": 8000,
+        "cnt_cmake_files": 500,
+    },
+}
+
+# The SPDX license identifier of the synthetic source and CMake files (check FILE.LICENSE_ID).
+SPDX_LICENSE_ID = "SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception"
+
+# A valid README.md (title, badges, implements and status lines) - the synthetic README.md starts with it.
+README_TEMPLATE_PATH = (
+    Path(__file__).parent.parent
+    / "lib/checks/beman_standard/readme/data/valid/README-v1.md"
+)
+
+
+def create_synthetic_repo(path, size):
+    """
+    Create a synthetic beman.exemplar repository of the given size (check SYNTHETIC_REPO_SIZES)
+    - e.g., to benchmark the checks. The repository follows The Beman Standard, so all the checks run
+    until their end (no early exit on a missing file).
+
+    The generation is deterministic: the same size always produces the same content.
+    @return: A dictionary relative path -> size in bytes, for all the generated files.
+    """
+    params = SYNTHETIC_REPO_SIZES[size]
+    create_git_repo(path)
+    name = "exemplar"
+    files = {}
+
+    # README.md: a valid header, followed by filler paragraphs up to readme_size.
+    readme = README_TEMPLATE_PATH.read_text()
+    paragraph = (
+        "This is a synthetic README.md paragraph used to benchmark beman-tidy. "
+        "It mentions `beman.exemplar`, [The Beman Standard](https://github.com/bemanproject/beman) "
+        "and some **Markdown** formatting.\n\n"
+    )
+    readme += paragraph * max(
+        0, (params["readme_size"] - len(readme)) // len(paragraph)
+    )
+    files["README.md"] = readme
+
+    files[".github/CODEOWNERS"] = "* @bemanproject/core-reviewers\n"
+
+    # CMakeLists.txt: the top-level one, one per source level, the rest under tests/ - all joined
+    # by add_subdirectory() (check CMAKE.LIBRARY_NAME).
+    cnt_source_cmake_files = min(params["source_depth"], params["cnt_cmake_files"] - 1)
+    cnt_test_cmake_files = params["cnt_cmake_files"] - 1 - cnt_source_cmake_files
+    files["CMakeLists.txt"] = (
+        f"# {SPDX_LICENSE_ID}\n"
+        "cmake_minimum_required(VERSION 3.25)\n"
+        f'project(beman.{name} DESCRIPTION "A Beman Library Exemplar" LANGUAGES CXX)\n'
+        f'option(BEMAN_{name.upper()}_BUILD_TESTS "Enable building tests." ON)\n'
+        f'option(BEMAN_{name.upper()}_BUILD_EXAMPLES "Enable building examples." ON)\n'
+        f"add_subdirectory(src/beman/{name})\n"
+        f"if(BEMAN_{name.upper()}_BUILD_TESTS)\n"
+        "    enable_testing()\n"
+        + "".join(
+            f"    add_subdirectory(tests/beman/{name}/test_{index})\n"
+            for index in range(cnt_test_cmake_files)
+        )
+        + "endif()\n"
+        f"if(BEMAN_{name.upper()}_BUILD_EXAMPLES)\n"
+        "    add_subdirectory(examples)\n"
+        "endif()\n"
+    )
+    source_dir = f"src/beman/{name}"
+    for level in range(params["source_depth"]):
+        files[f"{source_dir}/{name}_{level}.cpp"] = (
+            f"// {SPDX_LICENSE_ID}\n#include <beman/{name}/{name}_{level}.hpp>\n"
+        )
+        if level < cnt_source_cmake_files:
+            files[f"{source_dir}/CMakeLists.txt"] = (
+                f"# {SPDX_LICENSE_ID}\n"
+                + (
+                    f"add_library(beman.{name})\n"
+                    f"add_library(beman::{name} ALIAS beman.{name})\n"
+                    if level == 0
+                    else ""
+                )
+                + f"target_sources(beman.{name} PRIVATE {name}_{level}.cpp)\n"
+                + (
+                    f"add_subdirectory(detail_{level})\n"
+                    if level + 1 < cnt_source_cmake_files
+                    else ""
+                )
+            )
+        source_dir += f"/detail_{level}"
+    for index in range(cnt_test_cmake_files):
+        files[f"tests/beman/{name}/test_{index}/CMakeLists.txt"] = (
+            f"# {SPDX_LICENSE_ID}\n"
+            f"add_executable(beman.{name}.test_{index} test_{index}.cpp)\n"
+        )
+
+    # Headers: 100 per directory.
+    for index in range(params["cnt_headers"]):
+        files[f"include/beman/{name}/group_{index // 100}/header_{index}.hpp"] = (
+            f"// {SPDX_LICENSE_ID}\n"
+            f"#ifndef BEMAN_{name.upper()}_HEADER_{index}_HPP\n"
+            f"#define BEMAN_{name.upper()}_HEADER_{index}_HPP\n"
+            f"namespace beman::{name} {{\n"
+            f"inline constexpr int value_{index} = {index};\n"
+            f"}} // namespace beman::{name}\n"
+            "#endif\n"
+        )
+
+    for relative_path, content in files.items():
+        file_path = path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+
+    # LICENSE: the reference Apache License v2.0 with LLVM Exceptions.
+    shutil.copyfile(
+        get_beman_standard_config_path().parent / "docs/licenses/apache-v2.txt",
+        path / "LICENSE",
+    )
+
+    return {
+        relative_path: (path / relative_path).stat().st_size
+        for relative_path in [*files, "LICENSE"]
+    }